@@ -0,0 +1,94 @@
+"""
+Archivo: cache_frames.py
+
+Descripción:
+    Este archivo define una caché con memoria limitada para los frames ya
+    renderizados de la animación. Cuando se supera el límite se descartan los
+    frames que hace más tiempo que no se usan (LRU).
+
+Autor: Gabriel Gomez Garcia
+Fecha: 19 de octubre de 2026
+"""
+
+# Librerías estándar
+from collections import OrderedDict
+
+# Módulos locales
+from constantes import Default
+
+
+class CacheFrames:
+    """
+    Caché LRU de frames renderizados con un máximo de memoria.
+
+    Cada entrada guarda el valor junto con los bytes que ocupa, que los da quien
+    la guarda, porque la caché no sabe medir objetos como un PhotoImage.
+    """
+
+    def __init__(self, memoria_maxima: int = Default.ANIMACION_CACHE_MEMORIA) -> None:
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            memoria_maxima (int): Bytes máximos que pueden ocupar los frames guardados.
+        """
+        self.memoria_maxima = memoria_maxima
+        self._entradas: OrderedDict = OrderedDict()
+        self._memoria = 0
+
+    def obtener(self, clave):
+        """
+        Devuelve el frame guardado y lo marca como el más reciente.
+
+        Args:
+            clave: Identificador del frame (normalmente su índice).
+
+        Returns:
+            El valor guardado, o None si no está en la caché.
+        """
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return None
+        self._entradas.move_to_end(clave)
+        return entrada[0]
+
+    def guardar(self, clave, valor, memoria: int) -> None:
+        """
+        Guarda un frame y descarta los más antiguos si no cabe.
+
+        Un frame que por sí solo supera el límite no se guarda.
+
+        Args:
+            clave: Identificador del frame.
+            valor: Frame renderizado.
+            memoria (int): Bytes que ocupa el frame.
+        """
+        if clave in self._entradas:
+            self._memoria -= self._entradas.pop(clave)[1]
+        if memoria > self.memoria_maxima:
+            return
+
+        while self._entradas and self._memoria + memoria > self.memoria_maxima:
+            _, (_, memoria_descartada) = self._entradas.popitem(last=False)
+            self._memoria -= memoria_descartada
+
+        self._entradas[clave] = (valor, memoria)
+        self._memoria += memoria
+
+    def limpiar(self) -> None:
+        """Vacía la caché."""
+        self._entradas.clear()
+        self._memoria = 0
+
+    @property
+    def memoria(self) -> int:
+        """Devuelve los bytes que ocupan los frames guardados."""
+        return self._memoria
+
+    def __len__(self) -> int:
+        """Devuelve el número de frames guardados."""
+        return len(self._entradas)
+
+    def __contains__(self, clave) -> bool:
+        """Indica si el frame está en la caché."""
+        return clave in self._entradas
@@ -151,6 +151,16 @@ class Texts:
     REFLEXION_LINE = "line"
 
     TRANS_PELI_CREAR = "Generar animación"
+    TRANS_PELI_INTERMEDIOS = "Intermedios"
+    TRANS_PELI_PRERENDERIZAR = "Pre-renderizar"
+    TRANS_PELI_EXPORTAR = "Exportar"
+    TRANS_PELI_FORMATOS = ["APNG", "GIF", "Secuencia PNG"]
+
+    # Suavizado de los frames intermedios entre fotogramas clave
+    SUAVIZADO_LINEAL = "Lineal"
+    SUAVIZADO_ENTRADA = "Acelerar"
+    SUAVIZADO_SALIDA = "Frenar"
+    SUAVIZADO_ENTRADA_SALIDA = "Acelerar y frenar"
 
 
 # Estrategias de dibujo
@@ -230,6 +240,29 @@ class Default:
     MIN_DISTANCE = 10  # Distancia mínima para interacciones
     MIN_DISTANCE_SELECT = 20
 
+    # Manejadores para transformar arrastrando
+    MANEJADOR_TAMANHO = 6  # Mitad del lado de cada manejador
+    MANEJADOR_DISTANCIA_ROTACION = 30  # Separación del manejador de rotación
+    VISTA_PREVIA_INTERVALO_MS = 16  # Como mucho una vista previa por frame (~60 FPS)
+    ESCALA_MINIMA = 0.05  # Factor de escala mínimo al arrastrar
+
+    # Historial de transformaciones
+    HISTORIAL_INTERVALO_INSTANTANEAS = 10  # Cada cuántos pasos se guardan los puntos
+    HISTORIAL_MEMORIA_MAXIMA = 16 * 1024 * 1024  # Bytes máximos del historial
+    HISTORIAL_MAX_INVALIDADOS = 64  # Objetos borrados antes de compactar
+
+    # Animación por fotogramas clave
+    ANIMACION_INTERMEDIOS = 0  # Frames intermedios entre dos claves
+    ANIMACION_SUAVIZADO = Texts.SUAVIZADO_ENTRADA_SALIDA  # Suavizado por defecto
+    ANIMACION_CACHE_MEMORIA = 256 * 1024 * 1024  # Bytes máximos de frames renderizados
+    ANIMACION_INTERVALO_COMPLETOS = 10  # Cada cuántas claves se guardan todas las figuras
+    PLANIFICADOR_MUESTRAS = 240  # Tiempos entre frames usados para las estadísticas
+    PLANIFICADOR_REFRESCO_MS = 250  # Cada cuánto se actualizan las estadísticas en pantalla
+    EXPORTAR_FORMATO = "APNG"  # Formato de exportación por defecto
+    EXPORTAR_SONDEO_MS = 200  # Cada cuánto se mira si ha terminado la exportación
+
+    LOG_LEVEL = "INFO"  # Nivel de los mensajes de log ("DEBUG" para ver los puntos)
+
     # Herramientas de dibujo
     DRAWING_COLOR = Color.BLACK  # Color de dibujo
     DRAWING_TOOL = DrawingStrategies.STRATEGIES["BresenhamLine Integer"]  # Pincel
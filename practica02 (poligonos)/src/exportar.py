@@ -0,0 +1,273 @@
+"""
+Archivo: exportar.py
+
+Descripción:
+    Este archivo exporta una animación sin necesidad de pantalla. Cada frame se
+    pinta con rasterizado.py en un proceso distinto y se comprime como PNG, y
+    después se escriben como una secuencia numerada de PNG, como un único PNG
+    animado (APNG) o, si está instalado Pillow, como un GIF animado.
+
+    Los PNG y el APNG se escriben solo con la librería estándar (zlib). Si el
+    frame tiene 256 colores o menos, que es lo normal, se usan imágenes con
+    paleta, que ocupan mucho menos.
+
+Autor: Gabriel Gomez Garcia
+Fecha: 19 de octubre de 2026
+"""
+
+# Librerías estándar
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+# Imports de terceros
+import numpy as np
+
+# Módulos locales (sin constantes, para no cargar tkinter)
+from rasterizado import FONDO, caja_frame, color_a_rgb, rasterizar_frame
+
+FORMATO_PNG = "png"  # Secuencia de PNG numerados
+FORMATO_APNG = "apng"  # PNG animado
+FORMATO_GIF = "gif"  # GIF animado (necesita Pillow)
+
+FIRMA_PNG = b"\x89PNG\r\n\x1a\n"
+COMPRESION = 6  # Nivel de zlib de los PNG exportados (0-9)
+
+
+def frames_a_poligonos(peli) -> list[list[tuple]]:
+    """
+    Convierte los frames de una animación en listas de tuplas que se pueden
+    mandar a otros procesos (las figuras tienen el lienzo de tkinter dentro).
+
+    Args:
+        peli: Secuencia de frames, por ejemplo un AnimacionFotogramasClave.
+            Cada frame es un dict {figura: (puntos, color)}.
+
+    Returns:
+        list[list[tuple]]: Para cada frame, tuplas (puntos, color, tamanho, rellenar).
+    """
+    return [
+        [
+            (puntos, color, figura.tamanho, getattr(figura, "rellenar", True))
+            for figura, (puntos, color) in peli[indice].items()
+        ]
+        for indice in range(len(peli))
+    ]
+
+
+def _trozo_png(tipo: bytes, datos: bytes) -> bytes:
+    """Crea un trozo (chunk) de PNG con su longitud y su CRC."""
+    return (
+        struct.pack(">I", len(datos))
+        + tipo
+        + datos
+        + struct.pack(">I", zlib.crc32(tipo + datos) & 0xFFFFFFFF)
+    )
+
+
+def _cabecera_png(ancho: int, alto: int, paleta: np.ndarray | None) -> bytes:
+    """Crea el trozo IHDR, y el PLTE si la imagen usa paleta."""
+    tipo_color = 3 if paleta is not None else 2
+    cabecera = _trozo_png(
+        b"IHDR", struct.pack(">IIBBBBB", ancho, alto, 8, tipo_color, 0, 0, 0)
+    )
+    if paleta is not None:
+        cabecera += _trozo_png(b"PLTE", paleta.astype(np.uint8).tobytes())
+    return cabecera
+
+
+def _comprimir_imagen(imagen: np.ndarray, paleta: np.ndarray | None) -> bytes:
+    """
+    Comprime la imagen como los datos de un IDAT.
+
+    Con paleta, cada píxel se guarda como el índice de su color en la paleta.
+    """
+    if paleta is not None:
+        claves_paleta = (paleta[:, 0] << 16) | (paleta[:, 1] << 8) | paleta[:, 2]
+        claves = (
+            (imagen[..., 0].astype(np.int32) << 16)
+            | (imagen[..., 1].astype(np.int32) << 8)
+            | imagen[..., 2]
+        )
+        filas = np.searchsorted(claves_paleta, claves).astype(np.uint8)
+    else:
+        filas = imagen.reshape(imagen.shape[0], -1)
+
+    # cada fila empieza con el byte del filtro (0, sin filtro)
+    datos = np.zeros((filas.shape[0], filas.shape[1] + 1), dtype=np.uint8)
+    datos[:, 1:] = filas
+    return zlib.compress(datos.tobytes(), COMPRESION)
+
+
+def _renderizar_frame(argumentos: tuple) -> bytes:
+    """
+    Pinta un frame y devuelve sus datos comprimidos. Se ejecuta en otro proceso.
+
+    Args:
+        argumentos (tuple): Polígonos del frame, caja común, paleta y fondo.
+
+    Returns:
+        bytes: Los datos del IDAT del frame.
+    """
+    poligonos, caja, paleta, fondo = argumentos
+    imagen, _ = rasterizar_frame(poligonos, caja, fondo)
+    return _comprimir_imagen(imagen, paleta)
+
+
+def _crear_paleta(frames: list[list[tuple]], fondo: str) -> np.ndarray | None:
+    """
+    Crea la paleta común de todos los frames.
+
+    Los frames solo tienen el color de fondo y el de cada polígono, así que la
+    paleta se conoce antes de pintar nada.
+
+    Returns:
+        np.ndarray | None: Colores (k x 3) ordenados, o None si hay más de 256.
+    """
+    colores = {color_a_rgb(fondo)}
+    for poligonos in frames:
+        colores.update(color_a_rgb(color) for _, color, _, _ in poligonos)
+    if len(colores) > 256:
+        return None
+    # ordenar las tuplas (r, g, b) es ordenar por r << 16 | g << 8 | b
+    return np.array(sorted(colores), dtype=np.int32)
+
+
+def _caja_comun(frames: list[list[tuple]]) -> tuple[int, int, int, int]:
+    """Calcula la caja que contiene todos los frames, para que tengan el mismo tamaño."""
+    cajas = np.array([caja_frame(poligonos) for poligonos in frames if poligonos])
+    if len(cajas) == 0:
+        return 0, 0, 1, 1
+    return (
+        int(cajas[:, 0].min()),
+        int(cajas[:, 1].min()),
+        int(cajas[:, 2].max()),
+        int(cajas[:, 3].max()),
+    )
+
+
+def _escribir_secuencia(ruta: str, datos: list, cabecera: bytes) -> list[str]:
+    """Escribe cada frame como un PNG numerado: ruta_0000.png, ruta_0001.png..."""
+    base, _ = os.path.splitext(ruta)
+    cifras = max(len(str(len(datos) - 1)), 4)
+    rutas = []
+    for indice, idat in enumerate(datos):
+        ruta_frame = f"{base}_{indice:0{cifras}d}.png"
+        with open(ruta_frame, "wb") as archivo:
+            archivo.write(
+                FIRMA_PNG + cabecera + _trozo_png(b"IDAT", idat) + _trozo_png(b"IEND", b"")
+            )
+        rutas.append(ruta_frame)
+    return rutas
+
+
+def _escribir_apng(
+    ruta: str, datos: list, cabecera: bytes, ancho: int, alto: int, fps: float
+) -> None:
+    """Escribe todos los frames en un único PNG animado que se repite sin fin."""
+    retraso = max(int(round(1000 / fps)), 1)
+    secuencia = 0
+    with open(ruta, "wb") as archivo:
+        # IHDR tiene que ir primero y acTL antes de los datos de la imagen
+        ihdr_longitud = 8 + 13 + 4
+        archivo.write(FIRMA_PNG + cabecera[:ihdr_longitud])
+        archivo.write(_trozo_png(b"acTL", struct.pack(">II", len(datos), 0)))
+        archivo.write(cabecera[ihdr_longitud:])
+
+        for indice, idat in enumerate(datos):
+            control = struct.pack(
+                ">IIIIIHHBB", secuencia, ancho, alto, 0, 0, retraso, 1000, 0, 0
+            )
+            archivo.write(_trozo_png(b"fcTL", control))
+            secuencia += 1
+            if indice == 0:
+                archivo.write(_trozo_png(b"IDAT", idat))
+            else:
+                archivo.write(_trozo_png(b"fdAT", struct.pack(">I", secuencia) + idat))
+                secuencia += 1
+        archivo.write(_trozo_png(b"IEND", b""))
+
+
+def _escribir_gif(
+    ruta: str, datos: list, paleta: np.ndarray | None, ancho: int, alto: int, fps: float
+) -> None:
+    """Escribe un GIF animado con Pillow a partir de los frames ya comprimidos."""
+    try:
+        from PIL import Image
+    except ImportError as error:
+        raise RuntimeError(
+            "Para exportar a GIF hace falta Pillow (pip install pillow)."
+        ) from error
+
+    imagenes = []
+    for idat in datos:
+        filas = np.frombuffer(zlib.decompress(idat), dtype=np.uint8)
+        if paleta is not None:
+            pixeles = filas.reshape(alto, ancho + 1)[:, 1:]
+            imagen = Image.fromarray(pixeles, mode="P")
+            imagen.putpalette(paleta.astype(np.uint8).ravel().tolist())
+        else:
+            pixeles = filas.reshape(alto, ancho * 3 + 1)[:, 1:].reshape(alto, ancho, 3)
+            imagen = Image.fromarray(pixeles, mode="RGB").quantize()
+        imagenes.append(imagen)
+
+    imagenes[0].save(
+        ruta,
+        save_all=True,
+        append_images=imagenes[1:],
+        duration=max(int(round(1000 / fps)), 1),
+        loop=0,
+    )
+
+
+def exportar_animacion(
+    frames: list[list[tuple]],
+    ruta: str,
+    formato: str = FORMATO_APNG,
+    fps: float = 2,
+    procesos: int | None = None,
+    fondo: str = FONDO,
+) -> list[str]:
+    """
+    Pinta todos los frames en paralelo y los guarda en el formato pedido.
+
+    Args:
+        frames (list[list[tuple]]): Frames como los devuelve frames_a_poligonos.
+        ruta (str): Archivo de salida. En la secuencia de PNG se usa como base
+            de los nombres.
+        formato (str): FORMATO_PNG, FORMATO_APNG o FORMATO_GIF.
+        fps (float): Frames por segundo de la animación.
+        procesos (int | None): Procesos a usar. Por defecto, todos los núcleos.
+        fondo (str): Color de fondo.
+
+    Returns:
+        list[str]: Archivos escritos.
+    """
+    if not frames:
+        raise ValueError("No hay frames que exportar.")
+    if formato not in (FORMATO_PNG, FORMATO_APNG, FORMATO_GIF):
+        raise ValueError(f"Formato de exportación desconocido: {formato}")
+
+    caja = _caja_comun(frames)
+    ancho, alto = caja[2] - caja[0], caja[3] - caja[1]
+    paleta = _crear_paleta(frames, fondo)
+
+    # cada proceso recibe varios frames de golpe para no pagar el envío uno a uno
+    procesos = procesos or os.cpu_count() or 1
+    tamanho_lote = max(len(frames) // (procesos * 4), 1)
+    argumentos = ((poligonos, caja, paleta, fondo) for poligonos in frames)
+    # los procesos se crean desde cero (spawn) y no como copias del proceso de la
+    # ventana, que tiene tkinter abierto
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=get_context("spawn")) as executor:
+        datos = list(executor.map(_renderizar_frame, argumentos, chunksize=tamanho_lote))
+
+    cabecera = _cabecera_png(ancho, alto, paleta)
+    if formato == FORMATO_PNG:
+        return _escribir_secuencia(ruta, datos, cabecera)
+    if formato == FORMATO_APNG:
+        _escribir_apng(ruta, datos, cabecera, ancho, alto, fps)
+    else:
+        _escribir_gif(ruta, datos, paleta, ancho, alto, fps)
+    return [ruta]
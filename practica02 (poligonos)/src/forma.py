@@ -199,6 +199,11 @@ class Poligono(ObjetoDibujo):
             raise ValueError("La matriz debe tener exactamente 3 filas (x , y y todo 1).")
         self._puntos = nueva_matriz
 
+    @property
+    def rellenar(self) -> bool:
+        """Indica si el interior del polígono se rellena al dibujarlo."""
+        return self._rellenar
+
     def cambiar_punto(self, indice: int, nuevo_punto: Punto) -> None:
         """Cambia un punto específico en el polígono.
 
@@ -321,6 +326,28 @@ class Poligono(ObjetoDibujo):
         self._puntos_relleno.clear()
         return True
 
+    @staticmethod
+    def borrar_varios(poligonos: list["Poligono"]) -> bool:
+        """Borra varios polígonos del lienzo con una única llamada a `delete`.
+
+        Args:
+            poligonos (list[Poligono]): Polígonos a borrar. Deben compartir el lienzo.
+
+        Returns:
+            bool: True si se borró algo, False si no había nada que borrar.
+        """
+        ids = []
+        for poligono in poligonos:
+            ids.extend(poligono._puntos_contorno)
+            ids.extend(poligono._puntos_relleno)
+            poligono._puntos_contorno.clear()
+            poligono._puntos_relleno.clear()
+
+        if not ids:
+            return False
+        poligonos[0].lienzo.delete(*ids)
+        return True
+
     def cambiar_color(self, color: str) -> None:
         """Cambia el color del polígono."""
         self.color = color
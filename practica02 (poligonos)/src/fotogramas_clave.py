@@ -0,0 +1,448 @@
+"""
+Archivo: fotogramas_clave.py
+
+Descripción:
+    Este archivo define el motor de fotogramas clave de la animación. En lugar de
+    guardar a mano cada frame, se guardan solo algunos fotogramas clave y los
+    frames intermedios se calculan al reproducir. Para cada polígono se busca la
+    transformación afín que lleva sus puntos de una clave a la siguiente y se
+    descompone en traslación, rotación, escalado y shearing, que se interpolan
+    por separado con una función de suavizado.
+
+Autor: Gabriel Gomez Garcia
+Fecha: 19 de octubre de 2026
+"""
+
+# Imports de terceros
+import numpy as np
+
+# Módulos locales
+from constantes import Default, Texts
+
+# Funciones de suavizado: reciben t en [0, 1] y devuelven el avance en [0, 1]
+SUAVIZADOS = {
+    Texts.SUAVIZADO_LINEAL: lambda t: t,
+    Texts.SUAVIZADO_ENTRADA: lambda t: t * t,
+    Texts.SUAVIZADO_SALIDA: lambda t: 1 - (1 - t) * (1 - t),
+    Texts.SUAVIZADO_ENTRADA_SALIDA: lambda t: t * t * (3 - 2 * t),
+}
+
+
+def descomponer_afin(matriz: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Descompone la parte lineal (2 x 2) de una transformación afín.
+
+    La matriz se escribe como R(angulo) @ [[escala_x, shearing], [0, escala_y]].
+    Si la transformación incluye una reflexión, escala_y sale negativa.
+
+    Args:
+        matriz (np.ndarray): Parte lineal (2 x 2) de la transformación.
+
+    Returns:
+        tuple: Ángulo (radianes), escala_x, escala_y y shearing.
+    """
+    angulo = np.arctan2(matriz[1, 0], matriz[0, 0])
+    escala_x = np.hypot(matriz[0, 0], matriz[1, 0])
+
+    # quitando la rotacion queda una matriz triangular superior
+    coseno, seno = np.cos(angulo), np.sin(angulo)
+    shearing = coseno * matriz[0, 1] + seno * matriz[1, 1]
+    escala_y = -seno * matriz[0, 1] + coseno * matriz[1, 1]
+    return angulo, escala_x, escala_y, shearing
+
+
+def componer_afin(
+    angulo: np.ndarray,
+    escala_x: np.ndarray,
+    escala_y: np.ndarray,
+    shearing: np.ndarray,
+) -> np.ndarray:
+    """
+    Operación inversa de descomponer_afin, para varios polígonos a la vez.
+
+    Args:
+        angulo (np.ndarray): Ángulos (m) en radianes.
+        escala_x (np.ndarray): Escalas en x (m).
+        escala_y (np.ndarray): Escalas en y (m).
+        shearing (np.ndarray): Shearing (m).
+
+    Returns:
+        np.ndarray: Matrices lineales (m x 2 x 2).
+    """
+    coseno, seno = np.cos(angulo), np.sin(angulo)
+    matrices = np.empty((len(angulo), 2, 2))
+    matrices[:, 0, 0] = coseno * escala_x
+    matrices[:, 1, 0] = seno * escala_x
+    matrices[:, 0, 1] = coseno * shearing - seno * escala_y
+    matrices[:, 1, 1] = seno * shearing + coseno * escala_y
+    return matrices
+
+
+class FotogramaClave:
+    """
+    Fotograma clave de la animación.
+
+    Atributos:
+        figuras (dict): Para cada figura, sus puntos (3 x n) y su color.
+        intermedios (int): Frames que se generan entre esta clave y la siguiente.
+        suavizado (str): Nombre de la función de suavizado del tramo que empieza aquí.
+    """
+
+    def __init__(
+        self,
+        figuras: dict,
+        intermedios: int = 0,
+        suavizado: str = Texts.SUAVIZADO_LINEAL,
+    ) -> None:
+        """
+        Inicializa el fotograma clave.
+
+        Args:
+            figuras (dict): Para cada figura, una tupla (puntos, color).
+            intermedios (int): Frames intermedios hasta la siguiente clave.
+            suavizado (str): Nombre de la función de suavizado.
+        """
+        self.figuras = figuras
+        self.intermedios = max(int(intermedios), 0)
+        self.suavizado = suavizado if suavizado in SUAVIZADOS else Texts.SUAVIZADO_LINEAL
+
+
+class AlmacenFotogramasClave:
+    """
+    Lista de fotogramas clave guardados como diferencias con el anterior.
+
+    Cada clave guarda solo las figuras que han cambiado: si el cambio es una
+    transformación afín que se reproduce exactamente se guarda su matriz, y si
+    no, la diferencia de cada vértice. Cada cierto número de claves se guardan
+    todas las figuras completas, para poder reconstruir cualquier clave sin
+    empezar desde el principio.
+    """
+
+    def __init__(
+        self, intervalo_completos: int = Default.ANIMACION_INTERVALO_COMPLETOS
+    ) -> None:
+        """
+        Inicializa el almacén vacío.
+
+        Args:
+            intervalo_completos (int): Cada cuántas claves se guardan todas las figuras.
+        """
+        self.intervalo_completos = max(int(intervalo_completos), 1)
+        self._entradas: list[dict] = []
+        self._ultimo_estado: dict = {}  # Figuras de la última clave guardada
+        # ultima clave reconstruida, para que recorrerlas en orden sea barato
+        self._reconstruida: tuple[int, dict] | None = None
+
+    def anhadir(
+        self,
+        figuras: list,
+        intermedios: int = 0,
+        suavizado: str = Texts.SUAVIZADO_LINEAL,
+    ) -> int:
+        """
+        Guarda una nueva clave con el estado actual de las figuras.
+
+        Args:
+            figuras (list): Figuras con atributos puntos y color.
+            intermedios (int): Frames intermedios hasta la siguiente clave.
+            suavizado (str): Nombre de la función de suavizado del tramo.
+
+        Returns:
+            int: Número de figuras que han cambiado respecto a la clave anterior.
+        """
+        completa = len(self._entradas) % self.intervalo_completos == 0
+        cambios = {}
+        estado = {}
+
+        for figura in figuras:
+            puntos, color = figura.puntos, figura.color
+            anterior = self._ultimo_estado.get(figura)
+
+            if (
+                not completa
+                and anterior is not None
+                and anterior[1] == color
+                and np.array_equal(anterior[0], puntos)
+            ):
+                estado[figura] = anterior
+                continue
+
+            puntos = puntos.copy()
+            estado[figura] = (puntos, color)
+            if completa or anterior is None or anterior[0].shape != puntos.shape:
+                cambios[figura] = ("puntos", puntos, color)
+            else:
+                cambios[figura] = self._codificar_cambio(anterior[0], puntos, color)
+
+        eliminadas = [figura for figura in self._ultimo_estado if figura not in estado]
+        self._entradas.append(
+            {
+                "completa": completa,
+                "cambios": cambios,
+                "eliminadas": eliminadas,
+                "intermedios": max(int(intermedios), 0),
+                "suavizado": suavizado,
+            }
+        )
+        self._ultimo_estado = estado
+        return len(cambios)
+
+    @staticmethod
+    def _codificar_cambio(anterior: np.ndarray, puntos: np.ndarray, color: str) -> tuple:
+        """
+        Codifica el cambio de una figura como matriz afín o como diferencia de vértices.
+
+        Args:
+            anterior (np.ndarray): Puntos (3 x n) en la clave anterior.
+            puntos (np.ndarray): Puntos (3 x n) actuales.
+            color (str): Color actual.
+
+        Returns:
+            tuple: (tipo, datos, color) con tipo "matriz" o "diferencia".
+        """
+        # una matriz (2 x 3) solo compensa si ocupa menos que la diferencia
+        if puntos.shape[1] > 3:
+            matriz = np.linalg.lstsq(anterior.T.astype(float), puntos[:2].T, rcond=None)[0].T
+            if np.array_equal(np.rint(matriz @ anterior), puntos[:2]):
+                return "matriz", matriz, color
+
+        diferencia = puntos[:2] - anterior[:2]
+        tipo = np.int16 if np.abs(diferencia).max(initial=0) < 2**15 else diferencia.dtype
+        return "diferencia", diferencia.astype(tipo), color
+
+    @staticmethod
+    def _decodificar_cambio(anterior: np.ndarray | None, cambio: tuple) -> tuple:
+        """Aplica un cambio guardado a los puntos de la clave anterior."""
+        tipo, datos, color = cambio
+        if tipo == "puntos":
+            return datos, color
+        puntos = anterior.copy()
+        if tipo == "matriz":
+            puntos[:2] = np.rint(datos @ anterior)
+        else:
+            puntos[:2] += datos
+        return puntos, color
+
+    def _figuras(self, indice: int) -> dict:
+        """
+        Reconstruye las figuras de una clave a partir de la última clave completa.
+
+        Args:
+            indice (int): Índice de la clave.
+
+        Returns:
+            dict: Para cada figura, una tupla (puntos, color).
+        """
+        # se parte de la clave ya reconstruida si está antes y no hay una completa en medio
+        inicio = indice - indice % self.intervalo_completos
+        if self._reconstruida is not None and inicio <= self._reconstruida[0] <= indice:
+            inicio, figuras = self._reconstruida
+            figuras = dict(figuras)
+            inicio += 1
+        else:
+            figuras = {}
+
+        for entrada in self._entradas[inicio : indice + 1]:
+            if entrada["completa"]:
+                figuras = {}
+            for figura in entrada["eliminadas"]:
+                figuras.pop(figura, None)
+            for figura, cambio in entrada["cambios"].items():
+                anterior = figuras.get(figura, (None, None))[0]
+                figuras[figura] = self._decodificar_cambio(anterior, cambio)
+
+        self._reconstruida = (indice, figuras)
+        return figuras
+
+    def pop(self) -> None:
+        """Borra la última clave guardada."""
+        self._entradas.pop()
+        self._reconstruida = None
+        self._ultimo_estado = self._figuras(len(self._entradas) - 1) if self._entradas else {}
+
+    @property
+    def memoria(self) -> int:
+        """Devuelve los bytes que ocupan los puntos y matrices guardados."""
+        return sum(
+            datos.nbytes
+            for entrada in self._entradas
+            for _, datos, _ in entrada["cambios"].values()
+        )
+
+    def __len__(self) -> int:
+        """Devuelve el número de claves guardadas."""
+        return len(self._entradas)
+
+    def __getitem__(self, indice: int) -> FotogramaClave:
+        """
+        Reconstruye la clave pedida.
+
+        Args:
+            indice (int): Índice de la clave.
+
+        Returns:
+            FotogramaClave: La clave con todas sus figuras.
+        """
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de fotograma clave fuera de rango.")
+        entrada = self._entradas[indice]
+        return FotogramaClave(
+            self._figuras(indice), entrada["intermedios"], entrada["suavizado"]
+        )
+
+
+class TramoInterpolado:
+    """
+    Interpolación entre dos fotogramas clave consecutivos.
+
+    Todas las figuras que aparecen en las dos claves se interpolan en lote: sus
+    vértices, centrados en su centro, se juntan en una única matriz (2 x N) y
+    cada columna sabe a qué figura pertenece, igual que en TransformacionLote.
+    """
+
+    def __init__(self, inicio: FotogramaClave, fin: FotogramaClave) -> None:
+        """
+        Calcula la descomposición afín de cada figura entre las dos claves.
+
+        Args:
+            inicio (FotogramaClave): Clave donde empieza el tramo.
+            fin (FotogramaClave): Clave donde acaba el tramo.
+        """
+        self._suavizado = SUAVIZADOS[inicio.suavizado]
+        self._fijas = {}  # figuras que no se pueden interpolar, se quedan como en el inicio
+        self._figuras = []
+
+        relativos, residuos, parametros, centros, desplazamientos = [], [], [], [], []
+        for figura, (puntos, color) in inicio.figuras.items():
+            if figura not in fin.figuras or fin.figuras[figura][0].shape != puntos.shape:
+                self._fijas[figura] = (puntos, color)
+                continue
+            puntos_fin = fin.figuras[figura][0]
+
+            centro = puntos[:2].mean(axis=1, keepdims=True)
+            centro_fin = puntos_fin[:2].mean(axis=1, keepdims=True)
+            relativo = puntos[:2] - centro
+            relativo_fin = puntos_fin[:2] - centro_fin
+
+            # transformacion lineal que mejor lleva un poligono al otro
+            solucion = np.linalg.lstsq(relativo.T, relativo_fin.T, rcond=None)[0]
+            lineal = solucion.T
+
+            self._figuras.append((figura, color))
+            relativos.append(relativo)
+            # lo que no explica la transformacion (redondeos, vertices movidos)
+            residuos.append(relativo_fin - lineal @ relativo)
+            parametros.append(descomponer_afin(lineal))
+            centros.append(centro[:, 0])
+            desplazamientos.append((centro_fin - centro)[:, 0])
+
+        if not self._figuras:
+            return
+
+        self._tamanhos = np.array([relativo.shape[1] for relativo in relativos])
+        self._cortes = np.cumsum(self._tamanhos)[:-1]
+        self._indice_columna = np.repeat(np.arange(len(relativos)), self._tamanhos)
+        self._relativos = np.hstack(relativos)
+        self._residuos = np.hstack(residuos)
+        self._parametros = np.array(parametros)
+        self._centros = np.array(centros)
+        self._desplazamientos = np.array(desplazamientos)
+
+    def frame(self, t: float) -> dict:
+        """
+        Calcula el frame en el instante t del tramo.
+
+        Args:
+            t (float): Posición en el tramo, 0 en la clave de inicio y 1 en la de fin.
+
+        Returns:
+            dict: Para cada figura, una tupla (puntos, color).
+        """
+        frame = dict(self._fijas)
+        if not self._figuras:
+            return frame
+
+        s = self._suavizado(t)
+        angulo, escala_x, escala_y, shearing = self._parametros.T
+        lineales = componer_afin(
+            s * angulo,
+            1 + s * (escala_x - 1),
+            1 + s * (escala_y - 1),
+            s * shearing,
+        )
+        centros = self._centros + s * self._desplazamientos
+
+        puntos = (
+            np.einsum("nij,jn->in", lineales[self._indice_columna], self._relativos)
+            + centros[self._indice_columna].T
+            + s * self._residuos
+        )
+        puntos = np.vstack(
+            [np.rint(puntos).astype(int), np.ones((1, puntos.shape[1]), dtype=int)]
+        )
+
+        for (figura, color), puntos_figura in zip(
+            self._figuras, np.split(puntos, self._cortes, axis=1)
+        ):
+            frame[figura] = (puntos_figura, color)
+        return frame
+
+
+class AnimacionFotogramasClave:
+    """
+    Secuencia de frames generada a partir de fotogramas clave.
+
+    Se comporta como una lista de frames de solo lectura: tiene longitud y se
+    indexa con enteros, pero cada frame intermedio se calcula al pedirlo. Solo
+    se guardan las claves y la descomposición de cada tramo, así que la memoria
+    depende del número de claves y no del número de frames.
+    """
+
+    def __init__(self, claves: list[FotogramaClave] | AlmacenFotogramasClave) -> None:
+        """
+        Inicializa la animación con sus fotogramas clave.
+
+        Args:
+            claves (list[FotogramaClave] | AlmacenFotogramasClave): Fotogramas clave en orden.
+        """
+        self._claves = claves
+        self._tramos: dict[int, TramoInterpolado] = {}
+
+        # frame en el que empieza cada clave
+        longitudes = [claves[i].intermedios + 1 for i in range(len(claves) - 1)]
+        self._inicios = np.concatenate(([0], np.cumsum(longitudes))).astype(int)
+
+    def __len__(self) -> int:
+        """Devuelve el número total de frames, contando los intermedios."""
+        return int(self._inicios[-1]) + 1 if self._claves else 0
+
+    def __getitem__(self, indice: int) -> dict:
+        """
+        Devuelve el frame pedido, interpolándolo si no es una clave.
+
+        Args:
+            indice (int): Índice del frame.
+
+        Returns:
+            dict: Para cada figura, una tupla (puntos, color).
+        """
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de frame fuera de rango.")
+
+        numero_clave = int(np.searchsorted(self._inicios, indice, side="right")) - 1
+        desfase = indice - self._inicios[numero_clave]
+        if desfase == 0:
+            return self._claves[numero_clave].figuras
+
+        # el tramo se prepara la primera vez que se necesita
+        tramo = self._tramos.get(numero_clave)
+        if tramo is None:
+            tramo = TramoInterpolado(
+                self._claves[numero_clave], self._claves[numero_clave + 1]
+            )
+            self._tramos[numero_clave] = tramo
+        return tramo.frame(desfase / (self._claves[numero_clave].intermedios + 1))
@@ -0,0 +1,408 @@
+"""
+Archivo: historial.py
+
+Descripción:
+    Este archivo define el historial de transformaciones usado para deshacer y
+    rehacer. En lugar de guardar todos los puntos de cada polígono en cada paso,
+    cada paso guarda los objetos afectados y la matriz aplicada a cada uno, y
+    solo cada cierto número de pasos se guarda una copia de los puntos.
+
+Autor: Gabriel Gomez Garcia
+Fecha: 19 de octubre de 2026
+"""
+
+# Librerías estándar
+from collections import deque
+
+# Imports de terceros
+import numpy as np
+
+# Módulos locales
+from constantes import Default
+from transformaciones import TransformacionLote
+
+
+class PasoHistorial:
+    """
+    Un paso del historial: los objetos transformados y la matriz de cada uno.
+
+    Atributos:
+        ids (np.ndarray): Identificadores de los objetos transformados.
+        matrices (np.ndarray): Matrices (k x 3 x 3) distintas usadas en el paso.
+        indices (np.ndarray): Índice de la matriz que usa cada objeto.
+        instantaneas (dict[int, np.ndarray]): Puntos (2 x n) de algunos objetos antes del paso.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        matrices: np.ndarray,
+        indices: np.ndarray,
+        instantaneas: dict[int, np.ndarray],
+    ) -> None:
+        """
+        Inicializa el paso con sus matrices y las instantáneas que toquen.
+
+        Args:
+            ids (np.ndarray): Identificadores de los objetos transformados.
+            matrices (np.ndarray): Matrices (k x 3 x 3) distintas usadas en el paso.
+            indices (np.ndarray): Índice de la matriz que usa cada objeto.
+            instantaneas (dict[int, np.ndarray]): Puntos de algunos objetos antes del paso.
+        """
+        self.ids = ids
+        self.matrices = matrices
+        self.indices = indices
+        self.instantaneas = instantaneas
+        self._posiciones = {id_objeto: i for i, id_objeto in enumerate(ids.tolist())}
+
+    def matriz(self, id_objeto: int) -> np.ndarray:
+        """Devuelve la matriz (3 x 3) aplicada al objeto en este paso."""
+        return self.matrices[self.indices[self._posiciones[id_objeto]]]
+
+    @property
+    def memoria(self) -> int:
+        """Devuelve los bytes que ocupa el paso."""
+        return (
+            self.ids.nbytes
+            + self.matrices.nbytes
+            + self.indices.nbytes
+            + sum(puntos.nbytes for puntos in self.instantaneas.values())
+        )
+
+
+class HistorialTransformaciones:
+    """
+    Historial de deshacer y rehacer con memoria limitada.
+
+    Las matrices inversas no sirven para deshacer de forma exacta porque los puntos
+    se truncan a enteros después de cada transformación. Por eso, para deshacer se
+    parte de la última instantánea del objeto y se vuelven a aplicar las matrices
+    hasta el paso anterior, lo que da exactamente los mismos puntos.
+    """
+
+    def __init__(
+        self,
+        intervalo_instantaneas: int = Default.HISTORIAL_INTERVALO_INSTANTANEAS,
+        memoria_maxima: int = Default.HISTORIAL_MEMORIA_MAXIMA,
+        max_invalidados: int = Default.HISTORIAL_MAX_INVALIDADOS,
+    ) -> None:
+        """
+        Inicializa un historial vacío.
+
+        Args:
+            intervalo_instantaneas (int): Cada cuántos pasos de un objeto se guardan sus puntos.
+            memoria_maxima (int): Bytes máximos; al superarlos se olvidan los pasos más antiguos.
+            max_invalidados (int): Objetos borrados que se acumulan antes de compactar.
+        """
+        if intervalo_instantaneas < 1:
+            raise ValueError("El intervalo de instantáneas debe ser al menos 1.")
+
+        self.intervalo_instantaneas = intervalo_instantaneas
+        self.memoria_maxima = memoria_maxima
+        self.max_invalidados = max_invalidados
+
+        self._pasos: deque[PasoHistorial] = deque()  # Pasos que se pueden deshacer
+        self._pasos_rehacer: list[PasoHistorial] = []  # Pasos que se pueden rehacer
+        self._ids: dict[object, int] = {}  # Objeto -> identificador
+        self._objetos: dict[int, object] = {}  # Identificador -> objeto
+        self._pasos_por_objeto: dict[int, deque[PasoHistorial]] = {}
+        self._pasos_desde_instantanea: dict[int, int] = {}
+        self._siguiente_id = 0
+        self._invalidados = 0
+        self._memoria = 0
+
+    ########### Registro ###########
+
+    def registrar(
+        self,
+        objetos: list,
+        puntos_anteriores: list[np.ndarray],
+        matrices: np.ndarray,
+        indices: np.ndarray,
+    ) -> None:
+        """
+        Guarda un nuevo paso y descarta todo lo que se podía rehacer.
+
+        Args:
+            objetos (list): Objetos transformados en el paso.
+            puntos_anteriores (list[np.ndarray]): Puntos (3 x n) de cada objeto antes del paso.
+            matrices (np.ndarray): Matrices (k x 3 x 3) distintas aplicadas.
+            indices (np.ndarray): Índice de la matriz aplicada a cada objeto.
+        """
+        self._descartar_rehacer()
+
+        ids = np.array([self._obtener_id(objeto) for objeto in objetos], dtype=np.int64)
+        instantaneas = {}
+        for id_objeto, puntos in zip(ids.tolist(), puntos_anteriores):
+            pasos = self._pasos_desde_instantanea.get(id_objeto, self.intervalo_instantaneas)
+            if pasos >= self.intervalo_instantaneas or not self._pasos_por_objeto[id_objeto]:
+                instantaneas[id_objeto] = self._comprimir(puntos)
+                self._pasos_desde_instantanea[id_objeto] = 1
+            else:
+                self._pasos_desde_instantanea[id_objeto] = pasos + 1
+
+        paso = PasoHistorial(
+            ids, np.asarray(matrices, dtype=float), np.asarray(indices, dtype=np.int32), instantaneas
+        )
+        for id_objeto in ids.tolist():
+            self._pasos_por_objeto[id_objeto].append(paso)
+
+        self._pasos.append(paso)
+        self._memoria += paso.memoria
+        self._ajustar_memoria()
+
+    def invalidar(self, objeto) -> None:
+        """
+        Olvida un objeto (por ejemplo, al borrarlo del lienzo) en tiempo constante.
+
+        Los pasos que lo mencionan lo ignorarán; su memoria se libera al compactar.
+
+        Args:
+            objeto: Objeto a olvidar.
+        """
+        id_objeto = self._ids.pop(objeto, None)
+        if id_objeto is None:
+            return
+        del self._objetos[id_objeto]
+        del self._pasos_por_objeto[id_objeto]
+        self._pasos_desde_instantanea.pop(id_objeto, None)
+
+        self._invalidados += 1
+        if self._invalidados >= self.max_invalidados:
+            self.compactar()
+
+    def limpiar(self) -> None:
+        """Vacía el historial por completo."""
+        self._pasos.clear()
+        self._pasos_rehacer.clear()
+        self._ids.clear()
+        self._objetos.clear()
+        self._pasos_por_objeto.clear()
+        self._pasos_desde_instantanea.clear()
+        self._invalidados = 0
+        self._memoria = 0
+
+    ########### Deshacer y rehacer ###########
+
+    def deshacer(self) -> list[tuple[object, np.ndarray]]:
+        """
+        Deshace el último paso que siga afectando a algún objeto.
+
+        Returns:
+            list[tuple[object, np.ndarray]]: Cada objeto con los puntos que tenía antes del paso.
+            Vacía si no hay nada que deshacer.
+        """
+        while self._pasos:
+            paso = self._pasos.pop()
+            ids = [i for i in paso.ids.tolist() if i in self._objetos]
+            if not ids:
+                self._memoria -= paso.memoria
+                continue
+
+            resultado = []
+            for id_objeto in ids:
+                pasos = self._pasos_por_objeto[id_objeto]
+                pasos.pop()
+                resultado.append(
+                    (self._objetos[id_objeto], self._reconstruir(id_objeto, pasos, paso))
+                )
+
+            self._pasos_rehacer.append(paso)
+            return resultado
+        return []
+
+    def rehacer(self) -> list[tuple[object, np.ndarray]]:
+        """
+        Rehace el último paso deshecho aplicando de nuevo sus matrices.
+
+        Returns:
+            list[tuple[object, np.ndarray]]: Cada objeto con sus puntos después del paso.
+            Vacía si no hay nada que rehacer.
+        """
+        while self._pasos_rehacer:
+            paso = self._pasos_rehacer.pop()
+            ids = [i for i in paso.ids.tolist() if i in self._objetos]
+            if not ids:
+                self._memoria -= paso.memoria
+                continue
+
+            resultado = []
+            for id_objeto in ids:
+                objeto = self._objetos[id_objeto]
+                pasos = self._pasos_por_objeto[id_objeto]
+
+                # el primer paso de cada objeto siempre tiene que tener instantanea
+                if not pasos and id_objeto not in paso.instantaneas:
+                    instantanea = self._comprimir(objeto.puntos)
+                    paso.instantaneas[id_objeto] = instantanea
+                    self._memoria += instantanea.nbytes
+
+                if id_objeto in paso.instantaneas:
+                    self._pasos_desde_instantanea[id_objeto] = 1
+                else:
+                    self._pasos_desde_instantanea[id_objeto] = (
+                        self._pasos_desde_instantanea.get(id_objeto, 0) + 1
+                    )
+
+                pasos.append(paso)
+                resultado.append(
+                    (objeto, self._aplicar(paso.matriz(id_objeto), objeto.puntos))
+                )
+
+            self._pasos.append(paso)
+            self._ajustar_memoria()
+            return resultado
+        return []
+
+    ########### Memoria ###########
+
+    def compactar(self) -> None:
+        """
+        Libera las instantáneas de los objetos invalidados y los pasos que ya no
+        afectan a ningún objeto.
+        """
+        for pila in (self._pasos, self._pasos_rehacer):
+            vivos = []
+            for paso in pila:
+                for id_objeto in [i for i in paso.instantaneas if i not in self._objetos]:
+                    self._memoria -= paso.instantaneas.pop(id_objeto).nbytes
+                if any(i in self._objetos for i in paso.ids.tolist()):
+                    vivos.append(paso)
+                else:
+                    self._memoria -= paso.memoria
+            pila.clear()
+            pila.extend(vivos)
+        self._invalidados = 0
+        self._ajustar_memoria()
+
+    def _ajustar_memoria(self) -> None:
+        """Olvida los pasos más antiguos mientras se supere la memoria máxima."""
+        if self._memoria <= self.memoria_maxima:
+            return
+        if self._invalidados:
+            self._invalidados = 0
+            self.compactar()
+            return
+
+        # primero lo que se puede rehacer mas tarde, luego lo mas antiguo
+        while self._memoria > self.memoria_maxima and self._pasos_rehacer:
+            self._memoria -= self._pasos_rehacer.pop(0).memoria
+
+        while self._memoria > self.memoria_maxima and len(self._pasos) > 1:
+            self._olvidar_paso_mas_antiguo()
+
+    def _olvidar_paso_mas_antiguo(self) -> None:
+        """
+        Elimina el paso más antiguo, pasando su resultado como instantánea al
+        siguiente paso de cada objeto si este no tenía una.
+        """
+        paso = self._pasos.popleft()
+        self._memoria -= paso.memoria
+
+        for id_objeto in paso.ids.tolist():
+            if id_objeto not in self._objetos:
+                continue
+            pasos = self._pasos_por_objeto[id_objeto]
+            pasos.popleft()
+            if pasos and id_objeto not in pasos[0].instantaneas:
+                puntos = self._aplicar(
+                    paso.matriz(id_objeto),
+                    self._descomprimir(paso.instantaneas[id_objeto]),
+                )
+                instantanea = self._comprimir(puntos)
+                pasos[0].instantaneas[id_objeto] = instantanea
+                self._memoria += instantanea.nbytes
+
+    def _descartar_rehacer(self) -> None:
+        """Descarta los pasos que se podían rehacer."""
+        for paso in self._pasos_rehacer:
+            self._memoria -= paso.memoria
+        self._pasos_rehacer.clear()
+
+    ########### Utilidades ###########
+
+    def _obtener_id(self, objeto) -> int:
+        """Devuelve el identificador del objeto, creándolo si es nuevo."""
+        id_objeto = self._ids.get(objeto)
+        if id_objeto is None:
+            id_objeto = self._siguiente_id
+            self._siguiente_id += 1
+            self._ids[objeto] = id_objeto
+            self._objetos[id_objeto] = objeto
+            self._pasos_por_objeto[id_objeto] = deque()
+        return id_objeto
+
+    def _reconstruir(
+        self, id_objeto: int, pasos: deque[PasoHistorial], paso: PasoHistorial
+    ) -> np.ndarray:
+        """
+        Calcula los puntos de un objeto justo antes de `paso`.
+
+        Args:
+            id_objeto (int): Identificador del objeto.
+            pasos (deque[PasoHistorial]): Pasos anteriores del objeto, ya sin `paso`.
+            paso (PasoHistorial): Paso que se está deshaciendo.
+
+        Returns:
+            np.ndarray: Puntos (3 x n) del objeto antes del paso.
+        """
+        if id_objeto in paso.instantaneas:
+            self._pasos_desde_instantanea[id_objeto] = (
+                self._contar_desde_instantanea(id_objeto, pasos)
+            )
+            return self._descomprimir(paso.instantaneas[id_objeto])
+
+        # buscamos hacia atras la ultima instantanea y reaplicamos desde ahi
+        inicio = len(pasos) - 1
+        while id_objeto not in pasos[inicio].instantaneas:
+            inicio -= 1
+
+        puntos = self._descomprimir(pasos[inicio].instantaneas[id_objeto])
+        for i in range(inicio, len(pasos)):
+            puntos = self._aplicar(pasos[i].matriz(id_objeto), puntos)
+
+        self._pasos_desde_instantanea[id_objeto] = len(pasos) - inicio
+        return puntos
+
+    def _contar_desde_instantanea(self, id_objeto: int, pasos: deque) -> int:
+        """Cuenta los pasos del objeto desde su última instantánea."""
+        for atras, paso in enumerate(reversed(pasos)):
+            if id_objeto in paso.instantaneas:
+                return atras + 1
+        return self.intervalo_instantaneas
+
+    @staticmethod
+    def _aplicar(matriz: np.ndarray, puntos: np.ndarray) -> np.ndarray:
+        """Aplica una matriz con el mismo cálculo que la transformación original."""
+        return TransformacionLote.aplicar_matrices(
+            matriz[None], np.zeros(puntos.shape[1], dtype=int), puntos
+        )
+
+    @staticmethod
+    def _comprimir(puntos: np.ndarray) -> np.ndarray:
+        """Guarda solo las filas x e y de los puntos como int32."""
+        return puntos[:2].astype(np.int32)
+
+    @staticmethod
+    def _descomprimir(puntos: np.ndarray) -> np.ndarray:
+        """Recupera los puntos (3 x n) añadiendo la fila de unos."""
+        return np.vstack(
+            [puntos.astype(int), np.ones((1, puntos.shape[1]), dtype=int)]
+        )
+
+    ########### Getters ###########
+
+    @property
+    def memoria(self) -> int:
+        """Devuelve los bytes que ocupa el historial."""
+        return self._memoria
+
+    @property
+    def puede_deshacer(self) -> bool:
+        """Indica si queda algún paso por deshacer."""
+        return bool(self._pasos)
+
+    @property
+    def puede_rehacer(self) -> bool:
+        """Indica si queda algún paso por rehacer."""
+        return bool(self._pasos_rehacer)
@@ -8,6 +8,9 @@ Autor: Gabriel Gomez Garcia
 Fecha: 17 de septiembre de 2024
 """
 
+# Imports estándar
+import logging
+
 # Imports locales
 from constantes import Default
 from algoritmos_dibujo import AlgoritmoDibujo
@@ -29,6 +32,9 @@ def main() -> None:
     Esta funcion inicializa la ventana principal de la aplicación, configurando su tamaño,
     titulo y color de fondo. También establece la herramienta y tamaño de dibujo por defecto.
     """
+    # Mensajes de la animación; con logging.DEBUG se ven también los puntos de cada frame
+    logging.basicConfig(level=Default.LOG_LEVEL, format="%(message)s")
+
     # Crear una instancia de VentanaMenuCanvasAnimacion
     ventana = VentanaMenuCanvasAnimacion(width, height, title, color, tool, drawing_size)
 
@@ -0,0 +1,135 @@
+"""
+Archivo: planificador.py
+
+Descripción:
+    Este archivo define el planificador de frames de la animación. En lugar de
+    esperar un retraso fijo después de dibujar cada frame (lo que suma el tiempo
+    de dibujo al periodo), calcula el instante exacto en el que toca cada frame
+    desde que empezó la reproducción, y si se va con retraso salta frames para
+    no acumularlo. También mide los FPS reales y los tiempos entre frames.
+
+Autor: Gabriel Gomez Garcia
+Fecha: 19 de octubre de 2026
+"""
+
+# Librerías estándar
+import time
+from collections import deque
+
+# Imports de terceros
+import numpy as np
+
+# Módulos locales
+from constantes import Default
+
+
+class PlanificadorFrames:
+    """
+    Calcula cuándo mostrar cada frame para mantener los FPS pedidos.
+
+    El frame k debe mostrarse en inicio + k * periodo. Tras mostrar un frame se
+    pide el siguiente: si aún no ha llegado su hora se espera lo que falte, y si
+    ya ha pasado la hora de varios frames se saltan todos menos el último.
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        muestras: int = Default.PLANIFICADOR_MUESTRAS,
+        reloj=time.perf_counter,
+    ) -> None:
+        """
+        Inicializa el planificador.
+
+        Args:
+            fps (float): Frames por segundo que se quieren conseguir.
+            muestras (int): Número de tiempos entre frames que se guardan para las estadísticas.
+            reloj (callable): Función que devuelve el tiempo actual en segundos.
+        """
+        self._reloj = reloj
+        self.periodo = 1 / fps
+        self._tiempos = deque(maxlen=muestras)  # Segundos entre frames mostrados
+        self.frames_mostrados = 0
+        self.frames_descartados = 0
+        self._inicio = None  # Instante en el que toca el frame 0
+        self._frame = 0  # Número del próximo frame desde el inicio
+        self._ultimo_mostrado = None
+
+    def cambiar_fps(self, fps: float) -> None:
+        """
+        Cambia los FPS sin saltos: los siguientes frames se cuentan desde ahora.
+
+        Args:
+            fps (float): Nuevos frames por segundo.
+        """
+        if 1 / fps != self.periodo:
+            self.periodo = 1 / fps
+            self.reiniciar()
+
+    def reiniciar(self, estadisticas: bool = False) -> None:
+        """
+        Empieza a contar los frames desde ahora, por ejemplo al reanudar.
+
+        Args:
+            estadisticas (bool): Si es True, también se borran las estadísticas.
+        """
+        self._inicio = None
+        self._ultimo_mostrado = None
+        if estadisticas:
+            self._tiempos.clear()
+            self.frames_mostrados = 0
+            self.frames_descartados = 0
+
+    def frame_mostrado(self) -> tuple[int, int]:
+        """
+        Registra que se acaba de mostrar un frame y calcula el siguiente.
+
+        Returns:
+            tuple: Cuántos frames hay que avanzar (1 si se va a tiempo, más si hay
+                que saltar alguno) y cuántos milisegundos esperar hasta mostrarlo.
+        """
+        ahora = self._reloj()
+        if self._inicio is None:
+            self._inicio = ahora
+            self._frame = 0
+        elif self._ultimo_mostrado is not None:
+            self._tiempos.append(ahora - self._ultimo_mostrado)
+        self._ultimo_mostrado = ahora
+        self.frames_mostrados += 1
+
+        # primer frame cuya hora todavia no ha pasado
+        siguiente = max(self._frame + 1, int((ahora - self._inicio) / self.periodo) + 1)
+        avance = siguiente - self._frame
+        self.frames_descartados += avance - 1
+        self._frame = siguiente
+
+        espera = self._inicio + siguiente * self.periodo - ahora
+        return avance, max(int(round(espera * 1000)), 0)
+
+    @property
+    def fps_medidos(self) -> float:
+        """Devuelve los FPS reales de los últimos frames mostrados."""
+        total = sum(self._tiempos)
+        return len(self._tiempos) / total if total > 0 else 0.0
+
+    def percentiles(self, valores: tuple = (50, 95, 99)) -> list[float]:
+        """
+        Devuelve percentiles del tiempo entre frames, en milisegundos.
+
+        Args:
+            valores (tuple): Percentiles a calcular.
+
+        Returns:
+            list[float]: Un tiempo por percentil, o ceros si aún no hay datos.
+        """
+        if not self._tiempos:
+            return [0.0] * len(valores)
+        return list(np.percentile(np.array(self._tiempos) * 1000, valores))
+
+    def resumen(self) -> str:
+        """Devuelve un texto corto con las estadísticas, para mostrarlo en la ventana."""
+        p50, p95, p99 = self.percentiles()
+        return (
+            f"{self.fps_medidos:.1f} FPS | p50 {p50:.1f} ms | p95 {p95:.1f} ms | "
+            f"p99 {p99:.1f} ms | descartados {self.frames_descartados}"
+        )
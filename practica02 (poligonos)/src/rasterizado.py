@@ -0,0 +1,215 @@
+"""
+Archivo: rasterizado.py
+
+Descripción:
+    Este archivo convierte polígonos en imágenes de NumPy sin usar el lienzo de
+    tkinter. Sigue las mismas reglas que Poligono.dibujar (contorno a bloques del
+    tamaño del pincel y relleno por líneas de escaneo), pero pinta todo el frame
+    de una vez sobre un array (alto x ancho x 3), así que sirve para guardar
+    frames ya renderizados o para exportarlos sin pantalla.
+
+Autor: Gabriel Gomez Garcia
+Fecha: 19 de octubre de 2026
+"""
+
+# Imports de terceros
+import numpy as np
+
+# No se importa constantes, que trae tkinter con algoritmos_dibujo, para que los
+# procesos que exportan no lo carguen
+FONDO = "white"  # Color de fondo por defecto, el mismo que el del canvas
+
+# Colores con nombre que usa la aplicación; el resto llegan en hexadecimal
+COLORES_CON_NOMBRE = {
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "green": (0, 128, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "gray": (190, 190, 190),
+    "grey": (190, 190, 190),
+}
+
+
+def color_a_rgb(color: str) -> tuple[int, int, int]:
+    """
+    Convierte un color de tkinter (nombre o "#rrggbb") a una tupla RGB.
+
+    Args:
+        color (str): Color en formato "#rgb", "#rrggbb" o un nombre conocido.
+
+    Returns:
+        tuple: Componentes (r, g, b) entre 0 y 255. Negro si no se reconoce.
+    """
+    color = color.strip().lower()
+    if color.startswith("#"):
+        cifras = color[1:]
+        if len(cifras) == 3:
+            cifras = "".join(c * 2 for c in cifras)
+        if len(cifras) == 6:
+            try:
+                return tuple(int(cifras[i : i + 2], 16) for i in (0, 2, 4))
+            except ValueError:
+                pass
+    return COLORES_CON_NOMBRE.get(color, (0, 0, 0))
+
+
+def caja_frame(poligonos: list[tuple]) -> tuple[int, int, int, int]:
+    """
+    Calcula la caja en coordenadas del canvas que ocupa un frame.
+
+    Args:
+        poligonos (list[tuple]): Tuplas (puntos, color, tamanho, rellenar).
+
+    Returns:
+        tuple: (x_min, y_min, x_max, y_max) del canvas, con el máximo excluido.
+    """
+    if not poligonos:
+        return 0, 0, 1, 1
+    x_min = y_min = np.inf
+    x_max = y_max = -np.inf
+    for puntos, _, tamanho, _ in poligonos:
+        # el contorno se pinta a bloques alineados con el pincel
+        x_min = min(x_min, (puntos[0].min() // tamanho) * tamanho)
+        x_max = max(x_max, (puntos[0].max() // tamanho) * tamanho + tamanho + 1)
+        y_min = min(y_min, -((puntos[1].max() // tamanho) * tamanho + tamanho))
+        y_max = max(y_max, -((puntos[1].min() // tamanho) * tamanho) + tamanho + 1)
+    return int(x_min), int(y_min), int(x_max), int(y_max)
+
+
+def _pintar_relleno(imagen: np.ndarray, puntos: np.ndarray, rgb, origen) -> None:
+    """
+    Rellena el interior del polígono con líneas de escaneo, todas a la vez.
+
+    Igual que Poligono._rellenar_interior: para cada fila del canvas se buscan
+    los cortes con los lados y se pinta entre cada par de cortes.
+    """
+    x0, y0 = origen
+    x = puntos[0].astype(float)
+    y = puntos[1].astype(float)
+    x_sig, y_sig = np.roll(x, -1), np.roll(y, -1)
+
+    filas = np.arange(int(-y.max()), int(-y.min()) + 1)
+    y_scan = -filas[:, None].astype(float)  # filas x lados
+
+    corta = ((y <= y_scan) & (y_scan < y_sig)) | ((y_sig <= y_scan) & (y_scan < y))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_corte = x + (y_scan - y) * (x_sig - x) / (y_sig - y)
+    x_corte = np.where(corta, np.trunc(x_corte), np.inf)
+    x_corte.sort(axis=1)
+
+    # cada par de cortes (inicio, fin) es un tramo a pintar
+    inicios = x_corte[:, 0::2]
+    fines = x_corte[:, 1::2]
+    num_pares = min(inicios.shape[1], fines.shape[1])
+    inicios, fines = inicios[:, :num_pares], fines[:, :num_pares]
+    validos = np.isfinite(inicios) & np.isfinite(fines)
+    if not validos.any():
+        return
+
+    indice_fila = np.broadcast_to(np.arange(len(filas))[:, None], validos.shape)[validos]
+    alto, ancho = imagen.shape[:2]
+    fila_imagen = filas[indice_fila] - y0
+    inicio_imagen = np.clip(inicios[validos].astype(int) - x0, 0, ancho)
+    fin_imagen = np.clip(fines[validos].astype(int) + 1 - x0, 0, ancho)
+    dentro = (fila_imagen >= 0) & (fila_imagen < alto) & (fin_imagen > inicio_imagen)
+    if not dentro.any():
+        return
+    fila_imagen = fila_imagen[dentro]
+    inicio_imagen = inicio_imagen[dentro]
+    fin_imagen = fin_imagen[dentro]
+
+    # solo se trabaja dentro de la caja del poligono
+    fila_min, columna_min = fila_imagen.min(), inicio_imagen.min()
+    fila_max, columna_max = fila_imagen.max() + 1, fin_imagen.max()
+
+    # +1 al inicio de cada tramo y -1 al final; la suma acumulada marca lo pintado
+    marcas = np.zeros((fila_max - fila_min, columna_max - columna_min + 1), dtype=np.int32)
+    np.add.at(marcas, (fila_imagen - fila_min, inicio_imagen - columna_min), 1)
+    np.add.at(marcas, (fila_imagen - fila_min, fin_imagen - columna_min), -1)
+    pintado = np.cumsum(marcas, axis=1)[:, :-1] > 0
+    imagen[fila_min:fila_max, columna_min:columna_max][pintado] = rgb
+
+
+def _pintar_contorno(
+    imagen: np.ndarray, puntos: np.ndarray, rgb, tamanho: int, origen
+) -> None:
+    """
+    Pinta los lados del polígono con bloques de tamanho x tamanho píxeles.
+
+    Cada lado se muestrea con un punto por bloque, como hacen las estrategias de
+    dibujo de líneas, y cada muestra se ajusta a la rejilla del pincel.
+    """
+    x0, y0 = origen
+    x = puntos[0].astype(float)
+    y = puntos[1].astype(float)
+    x_sig, y_sig = np.roll(x, -1), np.roll(y, -1)
+
+    pasos = (np.maximum(np.abs(x_sig - x), np.abs(y_sig - y)) // tamanho).astype(int) + 1
+    indice_lado = np.repeat(np.arange(len(x)), pasos)
+    inicio_lado = np.repeat(np.cumsum(pasos) - pasos, pasos)
+    t = (np.arange(pasos.sum()) - inicio_lado) / np.maximum(pasos[indice_lado] - 1, 1)
+
+    x_muestra = np.rint(x[indice_lado] + t * (x_sig - x)[indice_lado])
+    y_muestra = np.rint(y[indice_lado] + t * (y_sig - y)[indice_lado])
+    x_bloque = (x_muestra // tamanho * tamanho).astype(int) - x0
+    y_bloque = (-(y_muestra // tamanho * tamanho + tamanho)).astype(int) - y0
+
+    alto, ancho = imagen.shape[:2]
+    for dy in range(tamanho + 1):
+        for dx in range(tamanho + 1):
+            filas = y_bloque + dy
+            columnas = x_bloque + dx
+            dentro = (filas >= 0) & (filas < alto) & (columnas >= 0) & (columnas < ancho)
+            imagen[filas[dentro], columnas[dentro]] = rgb
+
+
+def rasterizar_frame(
+    poligonos: list[tuple],
+    caja: tuple[int, int, int, int] | None = None,
+    fondo: str = FONDO,
+) -> tuple[np.ndarray, tuple[int, int]]:
+    """
+    Pinta un frame completo sobre una imagen de NumPy.
+
+    Args:
+        poligonos (list[tuple]): Tuplas (puntos, color, tamanho, rellenar) en el
+            orden de dibujo. Los puntos son (3 x n) con la y hacia arriba.
+        caja (tuple): Zona del canvas (x_min, y_min, x_max, y_max) que se pinta.
+            Si no se pasa, se usa la que ocupan los polígonos.
+        fondo (str): Color de fondo.
+
+    Returns:
+        tuple: Imagen (alto x ancho x 3) de tipo uint8 y la esquina superior
+            izquierda (x, y) de la imagen en coordenadas del canvas.
+    """
+    if caja is None:
+        caja = caja_frame(poligonos)
+    x_min, y_min, x_max, y_max = caja
+
+    imagen = np.empty((y_max - y_min, x_max - x_min, 3), dtype=np.uint8)
+    imagen[:] = color_a_rgb(fondo)
+
+    for puntos, color, tamanho, rellenar in poligonos:
+        if puntos.shape[1] == 0:
+            continue
+        rgb = color_a_rgb(color)
+        _pintar_contorno(imagen, puntos, rgb, max(int(tamanho), 1), (x_min, y_min))
+        if rellenar:
+            _pintar_relleno(imagen, puntos, rgb, (x_min, y_min))
+    return imagen, (x_min, y_min)
+
+
+def imagen_a_ppm(imagen: np.ndarray) -> bytes:
+    """
+    Codifica la imagen como PPM binario, formato que tkinter.PhotoImage lee directamente.
+
+    Args:
+        imagen (np.ndarray): Imagen (alto x ancho x 3) de tipo uint8.
+
+    Returns:
+        bytes: Los datos del PPM.
+    """
+    alto, ancho = imagen.shape[:2]
+    return f"P6 {ancho} {alto} 255 ".encode() + imagen.tobytes()
@@ -4,17 +4,22 @@ from constantes import Texts
 
 
 class Transformacion:
-    def __init__(self, transformaciones, puntos_poligono):
+    def __init__(self, transformaciones, puntos_poligono=None, centro=None):
         """
         Inicializa la clase Transformacion, creando matrices de transformación e inversa.
 
         Argumentos:
             transformaciones (dict): Diccionario con parámetros de cada tipo de transformación.
+            puntos_poligono (np.ndarray): Puntos (3 x n) del polígono, usados para calcular su centro.
+            centro (tuple): Centro (x, y) ya calculado. Si se pasa, no se usan los puntos.
         """
         self._puntos = puntos_poligono
         # calculamos directamente el centro del poligono por si lo usamos
-        self.x_center = np.mean(self._puntos[0, :])
-        self.y_center = np.mean(self._puntos[1, :])
+        if centro is not None:
+            self.x_center, self.y_center = centro
+        else:
+            self.x_center = np.mean(self._puntos[0, :])
+            self.y_center = np.mean(self._puntos[1, :])
     
         self.matriz_transformacion, self.matriz_inversa = self._crear_matrices(
             transformaciones
@@ -283,3 +288,118 @@ class Transformacion:
             np.ndarray: Los puntos transformados.
         """
         return (self.matriz_inversa @ puntos).astype(int)
+
+
+class TransformacionLote:
+    """
+    Aplica una misma transformación a varios polígonos de una sola vez.
+
+    Todos los vértices se juntan en una única matriz (3 x N) y las matrices se
+    construyen una sola vez por cada centro distinto, en lugar de una vez por polígono.
+    """
+
+    def __init__(self, transformaciones, lista_puntos, centro=None):
+        """
+        Inicializa el lote calculando los centros y las matrices de cada uno.
+
+        Argumentos:
+            transformaciones (dict): Diccionario con parámetros de cada tipo de transformación.
+            lista_puntos (list[np.ndarray]): Puntos (3 x n) de cada polígono del lote.
+            centro (tuple): Centro (x, y) común a todos los polígonos. Si no se pasa,
+                cada polígono gira y escala alrededor de su propio centro.
+        """
+        self.transformaciones = transformaciones
+        self._tamanhos = np.array([puntos.shape[1] for puntos in lista_puntos])
+        self._cortes = np.cumsum(self._tamanhos)[:-1]
+        self._puntos = np.hstack(lista_puntos)
+
+        if centro is not None:
+            # todos los poligonos comparten una unica matriz
+            self.centros = np.array([centro], dtype=float)
+            self.indice_poligono = np.zeros(len(lista_puntos), dtype=np.intp)
+        else:
+            # centro de cada poligono con una sola pasada sobre todos los vertices
+            inicios = np.concatenate(([0], self._cortes))
+            sumas = np.add.reduceat(self._puntos[:2, :], inicios, axis=1)
+            centros = (sumas / self._tamanhos).T
+
+            # solo se crean matrices para los centros distintos
+            self.centros, indice_poligono = np.unique(centros, axis=0, return_inverse=True)
+            self.indice_poligono = indice_poligono.ravel()
+        self._indice_columna = np.repeat(self.indice_poligono, self._tamanhos)
+
+        self.matrices_transformacion, self.matrices_inversas = self._crear_matrices(
+            transformaciones, self.centros
+        )
+
+    def _crear_matrices(self, transformaciones, centros):
+        """
+        Genera la matriz de transformación y su inversa para cada centro.
+
+        El centro solo afecta a la columna de traslación y lo hace de forma lineal,
+        así que basta con crear las matrices para los centros (0, 0), (1, 0) y (0, 1)
+        y combinarlas para todos los centros a la vez.
+
+        Argumentos:
+            transformaciones (dict): Diccionario con parámetros para cada transformación.
+            centros (np.ndarray): Centros (k x 2) de los polígonos.
+
+        Retorna:
+            tuple: Matrices de transformación (k x 3 x 3) y matrices inversas (k x 3 x 3).
+        """
+        origen = Transformacion(transformaciones, centro=(0.0, 0.0))
+        eje_x = Transformacion(transformaciones, centro=(1.0, 0.0))
+        eje_y = Transformacion(transformaciones, centro=(0.0, 1.0))
+
+        cx = centros[:, 0, None, None]
+        cy = centros[:, 1, None, None]
+
+        matrices = (
+            origen.matriz_transformacion
+            + cx * (eje_x.matriz_transformacion - origen.matriz_transformacion)
+            + cy * (eje_y.matriz_transformacion - origen.matriz_transformacion)
+        )
+        inversas = (
+            origen.matriz_inversa
+            + cx * (eje_x.matriz_inversa - origen.matriz_inversa)
+            + cy * (eje_y.matriz_inversa - origen.matriz_inversa)
+        )
+        return matrices, inversas
+
+    @staticmethod
+    def aplicar_matrices(matrices, indice_columna, puntos):
+        """
+        Multiplica cada columna de puntos por su matriz.
+
+        Argumentos:
+            matrices (np.ndarray): Matrices (k x 3 x 3) disponibles.
+            indice_columna (np.ndarray): Índice de la matriz que usa cada columna.
+            puntos (np.ndarray): Puntos (3 x N) a transformar.
+
+        Retorna:
+            np.ndarray: Los puntos transformados (3 x N) como enteros.
+        """
+        return np.einsum("nij,jn->in", matrices[indice_columna], puntos).astype(int)
+
+    def _aplicar(self, matrices, puntos):
+        """Aplica a cada polígono la matriz de su centro y separa el resultado."""
+        resultado = self.aplicar_matrices(matrices, self._indice_columna, puntos)
+        return np.split(resultado, self._cortes, axis=1)
+
+    def transformar(self):
+        """
+        Aplica las transformaciones a todos los polígonos del lote.
+
+        Retorna:
+            list[np.ndarray]: Los puntos transformados de cada polígono, en el mismo orden.
+        """
+        return self._aplicar(self.matrices_transformacion, self._puntos)
+
+    def revertir(self, lista_puntos):
+        """
+        Aplica las matrices inversas a los puntos dados (uno por polígono del lote).
+
+        Retorna:
+            list[np.ndarray]: Los puntos revertidos de cada polígono.
+        """
+        return self._aplicar(self.matrices_inversas, np.hstack(lista_puntos))
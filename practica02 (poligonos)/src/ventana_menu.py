@@ -656,9 +656,53 @@ class VentanaMenu(Ventana):
         self.input_fps.insert(0, "2")  # Valor predeterminado de FPS
         self.input_fps.grid(row=3, column=2, padx=10, pady=5, sticky="w")
 
-        # Tercera fila: Botón para iniciar la animación
+        # Tercera fila: frames intermedios y suavizado hasta la siguiente clave
+        label_intermedios = ctk.CTkLabel(frame_peli, text=Texts.TRANS_PELI_INTERMEDIOS)
+        label_intermedios.grid(row=4, column=0, padx=10, pady=5, sticky="e")
+        self.input_intermedios = ctk.CTkEntry(frame_peli, width=50)
+        self.input_intermedios.insert(0, str(Default.ANIMACION_INTERMEDIOS))
+        self.input_intermedios.grid(row=4, column=1, padx=10, pady=5, sticky="w")
+
+        self.opcion_suavizado = ctk.CTkOptionMenu(
+            frame_peli,
+            values=[
+                Texts.SUAVIZADO_LINEAL,
+                Texts.SUAVIZADO_ENTRADA,
+                Texts.SUAVIZADO_SALIDA,
+                Texts.SUAVIZADO_ENTRADA_SALIDA,
+            ],
+        )
+        self.opcion_suavizado.set(Default.ANIMACION_SUAVIZADO)
+        self.opcion_suavizado.grid(row=4, column=2, padx=10, pady=5, sticky="w")
+
+        # Cuarta fila: reproducir frames ya renderizados como imágenes
+        self.prerenderizar = ctk.BooleanVar(value=True)
+        checkbox_prerenderizar = ctk.CTkCheckBox(
+            frame_peli, text=Texts.TRANS_PELI_PRERENDERIZAR, variable=self.prerenderizar
+        )
+        checkbox_prerenderizar.grid(row=5, column=0, padx=10, pady=5, sticky="w")
+
+        # FPS medidos, tiempos entre frames y frames descartados de la reproducción
+        self.label_estadisticas_peli = ctk.CTkLabel(frame_peli, text="")
+        self.label_estadisticas_peli.grid(
+            row=5, column=1, columnspan=2, padx=10, pady=5, sticky="w"
+        )
+
+        # Quinta fila: Botón para iniciar la animación
         boton_iniciar = ctk.CTkButton(frame_peli, text="Iniciar Animación", command=self._generar_peli)
-        boton_iniciar.grid(row=4, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+        boton_iniciar.grid(row=6, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+
+        # Sexta fila: exportar la animación a un archivo
+        boton_exportar = ctk.CTkButton(
+            frame_peli, text=Texts.TRANS_PELI_EXPORTAR, command=self._exportar_peli
+        )
+        boton_exportar.grid(row=7, column=0, padx=10, pady=5, sticky="w")
+
+        self.opcion_formato_peli = ctk.CTkOptionMenu(
+            frame_peli, values=Texts.TRANS_PELI_FORMATOS
+        )
+        self.opcion_formato_peli.set(Default.EXPORTAR_FORMATO)
+        self.opcion_formato_peli.grid(row=7, column=1, padx=10, pady=5, sticky="w")
 
 
     def _borrar_ultimo_frame(self):
@@ -694,6 +738,12 @@ class VentanaMenu(Ventana):
         """
         print("Guardando frame...")
 
+    def _exportar_peli(self):
+        """
+        Método que maneja la lógica para exportar la animación a un archivo.
+        """
+        print("Exportando animación...")
+
     def _crear_frame_izquierdo(self, ventana) -> ctk.CTkFrame:
         """
         Crea y retorna el frame izquierdo para el área de contenido.
@@ -1106,6 +1156,7 @@ class VentanaMenu(Ventana):
         - Ctrl + Z: Deshacer transformaciones
         - Ctrl + Y: Rehacer transformaciones
         - Espacio: Guardar frame
+        - Arrastrar manejadores verdes: Mover, rotar y escalar la selección
 
         Otros:
         - Ctrl Izq: Terminar dibujo
@@ -21,7 +21,8 @@ from punto import Punto
 from forma import Poligono, Figura
 from algoritmos_dibujo import AlgoritmoDibujo
 from constantes import Default, UserEvents, Color, Texts
-from transformaciones import Transformacion
+from transformaciones import Transformacion, TransformacionLote
+from historial import HistorialTransformaciones
 
 class VentanaMenuCanvas(VentanaMenu):
     """
@@ -74,9 +75,14 @@ class VentanaMenuCanvas(VentanaMenu):
         self._puntos_poligono = np.empty(
             (3, 0)
         )  # Un array de 3 filas vacio para guardar los puntos
-        
-        self.lista_transformaciones: list[(Poligono, np.ndarray)] = []  # Lista de transformaciones aplicadas a los poligonos
-        self.lista_transformaciones_rehacer: list[(Poligono, np.ndarray)] = []  # Lista de transformaciones que se pueden rehacer
+
+        self.historial = HistorialTransformaciones()  # Historial para deshacer y rehacer transformaciones
+        self._arrastre: dict | None = None  # Estado del arrastre de un manejador
+        self._vista_previa_pendiente = None  # Id del `after` de la siguiente vista previa
+        self._linea_temporal: int | None = None  # Polilínea con los vértices ya fijados
+        self._segmento_temporal: int | None = None  # Segmento del último vértice al cursor
+        self._cursor_temporal: tuple | None = None  # Última posición del ratón al dibujar
+        self._linea_temporal_pendiente = None  # Id del `after` de la siguiente actualización
 
     def _crear_contenido_ventana(self) -> None:
         """
@@ -103,6 +109,10 @@ class VentanaMenuCanvas(VentanaMenu):
 
         lienzo.bind(UserEvents.RIGHT_CLICK, self._seleccionar_poligono)
 
+        # Arrastre de los manejadores de la selección
+        lienzo.bind(UserEvents.LEFT_DRAG, self._mover_arrastre)
+        lienzo.bind(UserEvents.LEFT_RELEASE, self._terminar_arrastre)
+
         # # Asignar eventos para comandos adicionales
         self.ventana.bind(UserEvents.ALT_LEFT, self._realizar_accion)
 
@@ -176,11 +186,19 @@ class VentanaMenuCanvas(VentanaMenu):
     def _iniciar_dibujo(self, evento: tk.Event) -> None:
         """Inicia el proceso de dibujo cuando el usuario hace clic izquierdo en el lienzo."""
 
+        # si se pulsa un manejador de la seleccion se arrastra en vez de dibujar
+        manejador = self._manejador_en(evento)
+        if manejador is not None and self._puntos_poligono.size == 0:
+            self._iniciar_arrastre(manejador, evento)
+            return
+
         # va a servir tanto para empezar el dibujo como para anhadir mas puntos
         # ya que es al terminar cuando gestionamos que se borre todo lo demas
         # conseguimos toda la info del punto  donde se hizo clic
         punto_actual = self._crear_punto(evento.x, evento.y)
 
+        num_puntos_antes = self._puntos_poligono.shape[1]
+
         # posibles casos:
 
         # con 2 o menos puntos no va a haber poligono, anhadimos el punto sin mas
@@ -218,63 +236,93 @@ class VentanaMenuCanvas(VentanaMenu):
                     axis=1,
                 )
 
-        # print(self._puntos_poligono)
+        # si el punto se ha anhadido, pasa a formar parte de la linea temporal
+        if self._puntos_poligono.shape[1] > num_puntos_antes:
+            self._anhadir_vertice_temporal(punto_actual.x, punto_actual.y)
 
     def _dibujar_en_movimiento(self, evento: tk.Event) -> None:
         """
         Dibuja una línea temporal en el lienzo mientras el ratón se mueve,
         mostrando una vista previa de la línea.
 
+        Los eventos de movimiento solo guardan la posición; la línea se
+        actualiza como mucho una vez por frame.
+
         Args:
             evento (tk.Event): Evento de movimiento del ratón.
         """
         if self._puntos_poligono.size != 0:
             punto_provisional = self._crear_punto(evento.x, evento.y)
-            self._actualizar_linea_temporal(punto_provisional.x, punto_provisional.y)
+            self._cursor_temporal = (punto_provisional.x, punto_provisional.y)
+            if self._linea_temporal_pendiente is None:
+                self._linea_temporal_pendiente = self.ventana.after(
+                    Default.VISTA_PREVIA_INTERVALO_MS, self._refrescar_linea_temporal
+                )
+
+    def _refrescar_linea_temporal(self) -> None:
+        """Actualiza la línea temporal con la última posición guardada del ratón."""
+        self._linea_temporal_pendiente = None
+        if self._puntos_poligono.size != 0 and self._cursor_temporal is not None:
+            self._actualizar_linea_temporal(*self._cursor_temporal)
+
+    def _anhadir_vertice_temporal(self, x: int, y: int) -> None:
+        """
+        Añade un vértice ya fijado a la polilínea temporal sin volver a crearla.
+
+        Args:
+            x (int): Coordenada X del vértice.
+            y (int): Coordenada Y del vértice.
+        """
+        if self._linea_temporal is None:
+            # una linea necesita dos puntos, el primero se repite
+            self._linea_temporal = self._lienzo.create_line(
+                x, y, x, y, fill=self.color_seleccionado, tags="linea_temporal"
+            )
+            self._segmento_temporal = self._lienzo.create_line(
+                x, y, x, y, fill=self.color_seleccionado, tags="linea_temporal"
+            )
+        else:
+            self._lienzo.insert(self._linea_temporal, "end", (x, y))
+
+        # el segmento hasta el cursor sale ahora del nuevo vertice
+        x_cursor, y_cursor = self._cursor_temporal or (x, y)
+        self._lienzo.coords(self._segmento_temporal, x, y, x_cursor, y_cursor)
 
     def _actualizar_linea_temporal(self, x: int, y: int) -> None:
         """
-        Actualiza las líneas temporales en el lienzo, mostrando una vista previa
+        Actualiza la línea temporal en el lienzo, mostrando una vista previa
         de todo el polígono mientras el usuario está dibujando.
 
+        Los vértices fijados ya están en la polilínea, así que solo se mueve
+        el último segmento, el que va hasta el cursor.
+
         Args:
             x (int): Coordenada X del punto actual.
             y (int): Coordenada Y del punto actual.
         """
-        self._lienzo.delete("linea_temporal")  # Elimina las líneas temporales previas
-
-        # Dibuja líneas entre los puntos existentes
-        num_puntos = self._puntos_poligono.shape[1]  # Número de puntos en el polígono
-
-        for i in range(num_puntos - 1):
-            p1 = self._puntos_poligono[:, i]  # Punto i
-            p2 = self._puntos_poligono[:, i + 1]  # Punto i+1
-            self._lienzo.create_line(
-                p1[0],
-                p1[1],
-                p2[0],
-                p2[1],
-                fill=self.color_seleccionado,
-                tags="linea_temporal",  # Etiqueta usada para identificar la línea temporal
-            )
-
-        # Dibuja la línea desde el último punto hasta el punto actual
+        if self._segmento_temporal is None:
+            return
         ultimo_punto = self._puntos_poligono[:, -1]
-        self._lienzo.create_line(
-            ultimo_punto[0],
-            ultimo_punto[1],
-            x,
-            y,
-            fill=self.color_seleccionado,
-            tags="linea_temporal",
+        self._lienzo.coords(
+            self._segmento_temporal, ultimo_punto[0], ultimo_punto[1], x, y
         )
 
+    def _limpiar_linea_temporal(self) -> None:
+        """Quita la línea temporal y cancela la actualización pendiente."""
+        self._lienzo.delete("linea_temporal")
+        if self._linea_temporal_pendiente is not None:
+            self.ventana.after_cancel(self._linea_temporal_pendiente)
+            self._linea_temporal_pendiente = None
+        self._linea_temporal = None
+        self._segmento_temporal = None
+        self._cursor_temporal = None
+
     def _terminar_dibujo(self, evento: tk.Event) -> None:
         """
         Completa el proceso de dibujo y almacena el nuevo polígono en la colección de figuras.
         """
         # lo pirmero quitar todas las lineas temporales qe hayamos hecho
-        self._lienzo.delete("linea_temporal")  # Elimina la línea temporal
+        self._limpiar_linea_temporal()
 
         if self._puntos_poligono.size == 0:
             print("prueba a poner algunos puntos en el lienzo!!")
@@ -364,6 +412,8 @@ class VentanaMenuCanvas(VentanaMenu):
                     figura.cambiar_outline(figura.color)
                 break  # Deja de buscar después de encontrar la primera figura
 
+        self._actualizar_manejadores()
+
     def _es_dentro_figura(self, x: int, y: int, figura: Figura) -> bool:
         """
         Verifica si un punto está cerca de una figura compuesta por poligonos.
@@ -464,11 +514,13 @@ class VentanaMenuCanvas(VentanaMenu):
         Borra todo el contenido del lienzo y resetea el estado de las figuras dibujadas.
         """
         super()._borrar_todo()
+        self._limpiar_linea_temporal()
         self._lienzo.delete("all")
         self._figuras.eliminar_todo()
         self._crear_ejes()
-        self.lista_transformaciones.clear()
-        self.lista_transformaciones_rehacer.clear()
+        self.historial.limpiar()
+        self._poligonos_seleccionados.clear()
+        self._arrastre = None
 
     def _mover_canvas(self, dx: int, dy: int) -> None:
         """
@@ -529,6 +581,7 @@ class VentanaMenuCanvas(VentanaMenu):
             for poligono in self._poligonos_seleccionados:
                 poligono.cambiar_outline(poligono.color)
             self._poligonos_seleccionados.clear()
+            self._actualizar_manejadores()
 
     def _desagrupar_figuras(self) -> None:
         """
@@ -553,6 +606,7 @@ class VentanaMenuCanvas(VentanaMenu):
                     for poligono in self._poligonos_seleccionados:
                         poligono.cambiar_outline(poligono.color)
                     self._poligonos_seleccionados.clear()
+                    self._actualizar_manejadores()
                     return
 
     def _cambiar_color(self):
@@ -582,8 +636,8 @@ class VentanaMenuCanvas(VentanaMenu):
     def _borrar(self) -> None:
         """
         Borra los polígonos seleccionados del lienzo y de la lista de figuras.
-        Además, actualiza las listas de deshacer y rehacer para eliminar 
-        cualquier transformación asociada a los polígonos eliminados.
+        Además, hace que el historial olvide las transformaciones
+        asociadas a los polígonos eliminados.
         """
         # Crear una copia de los polígonos seleccionados para evitar modificaciones durante la iteración
         poligonos_a_borrar = self._poligonos_seleccionados.copy()
@@ -596,29 +650,15 @@ class VentanaMenuCanvas(VentanaMenu):
             self._poligonos_seleccionados.remove(poligono)
             self._figuras.eliminar(poligono)
 
-            # Eliminar transformaciones asociadas al polígono de las listas de deshacer y rehacer
-            self._actualizar_listas_deshacer_rehacer(poligono)
+            # Olvidar las transformaciones asociadas al polígono en el historial
+            self.historial.invalidar(poligono)
 
             # Si el polígono pertenece a un grupo, borrar el grupo
             grupo = self.pertenece_grupo(poligono)
             if grupo is not None:
                 grupo.borrar()
 
-    def _actualizar_listas_deshacer_rehacer(self, poligono):
-        """
-        Actualiza las listas de deshacer y rehacer para eliminar 
-        cualquier transformación asociada con el polígono dado.
-        """
-        def filtrar_lista(lista):
-            return [tupla for tupla in lista if tupla[0] != poligono]
-
-        # Actualizar las listas
-        self.lista_transformaciones = filtrar_lista(self.lista_transformaciones)
-        self.lista_transformaciones_rehacer = filtrar_lista(self.lista_transformaciones_rehacer)
-
-        # Depuración: imprime el estado de las figuras y polígonos seleccionados
-        print("Figuras restantes:", self._figuras.elementos)
-        print("Polígonos seleccionados restantes:", self._poligonos_seleccionados)
+        self._actualizar_manejadores()
 
     def _realizar_accion(self, event: tk.Event):
         if self._accion == Texts.SECTION_ACTIONS_DELETE:
@@ -629,39 +669,297 @@ class VentanaMenuCanvas(VentanaMenu):
 
     def _aplicar_transformaciones(self) -> dict:
         transformaciones = super()._aplicar_transformaciones()
+        self._transformar_seleccion(transformaciones)
+        return transformaciones
+
+    def _poligonos_de_seleccion(self) -> list[Poligono]:
+        """
+        Devuelve los polígonos seleccionados; los grupos se transforman a través de sus polígonos.
+        """
+        poligonos = []
+        for figura in self._poligonos_seleccionados:
+            if isinstance(figura, Figura):
+                poligonos.extend(
+                    p for p in figura.elementos if isinstance(p, Poligono)
+                )
+            else:
+                poligonos.append(figura)
+        return poligonos
+
+    def _transformar_seleccion(self, transformaciones: dict, centro=None) -> None:
+        """
+        Aplica las transformaciones a todos los polígonos seleccionados en un solo lote.
+
+        Args:
+            transformaciones (dict): Diccionario con las transformaciones a aplicar.
+            centro (tuple | None): Centro (x, y) común sobre el que girar y escalar.
+                Si es None, cada polígono usa el suyo.
+        """
+        poligonos = self._poligonos_de_seleccion()
+        if not poligonos:
+            return
+
+        # todas las matrices y todos los vertices de una vez
+        lote = TransformacionLote(transformaciones, [p.puntos for p in poligonos], centro)
+        nuevos_puntos = lote.transformar()
+
+        # si no se mueve ningun vertice no se guarda un paso vacio en el historial
+        if all(np.array_equal(p.puntos, puntos) for p, puntos in zip(poligonos, nuevos_puntos)):
+            return
+
+        # guardamos las matrices (no los puntos) para poder deshacer
+        self.historial.registrar(
+            poligonos,
+            [p.puntos for p in poligonos],
+            lote.matrices_transformacion,
+            lote.indice_poligono,
+        )
+
+        # un unico borrado para todos, luego se redibujan con los puntos nuevos
+        self._redibujar_poligonos(zip(poligonos, nuevos_puntos))
 
-        # aplicamos la transformacion a cada poligono seleccionado
-        for poligono in self._poligonos_seleccionados:
-            # guardamos los puntos antes de transformar para poder volver a ellos
-            self.lista_transformaciones.append((poligono, poligono.puntos))
-            poligono.transformar(transformaciones)
-            
-            # print(self.lista_transformaciones)
-            
     def _deshacer_transformaciones(self):
-        if len(self.lista_transformaciones) != 0:
+        cambios = self.historial.deshacer()
+        if cambios:
             super()._deshacer_transformaciones()
-            poligono, puntos = self.lista_transformaciones.pop()
-            # guardamos los puntos antes de transformar para poder volver a ellos
-            self.lista_transformaciones_rehacer.append((poligono, poligono.puntos))
-            # ahora ponemos al poligono en los puntos anteriores
-            poligono.borrar()
-            poligono.puntos = puntos
-            poligono.dibujar()
+            # ponemos a los poligonos en los puntos anteriores
+            self._redibujar_poligonos(cambios)
         else:
             print("No hay transformaciones para deshacer")
-    
+
     def _rehacer_transformaciones(self):
-        if len(self.lista_transformaciones_rehacer) != 0:
+        cambios = self.historial.rehacer()
+        if cambios:
             super()._rehacer_transformaciones()
-            poligono, puntos = self.lista_transformaciones_rehacer.pop()
-            # ya no guardamos nada, se pierde
-            # ahora ponemos al poligono en los puntos anteriores
-            poligono.borrar()
-            poligono.puntos = puntos
-            poligono.dibujar()
+            self._redibujar_poligonos(cambios)
         else:
             print("No hay transformaciones para rehacer")
+
+    def _redibujar_poligonos(self, cambios) -> None:
+        """
+        Borra de una vez los polígonos indicados y los vuelve a dibujar con sus nuevos puntos.
+
+        Args:
+            cambios (Iterable[tuple[Poligono, np.ndarray]]): Cada polígono con sus nuevos puntos.
+        """
+        cambios = list(cambios)
+        Poligono.borrar_varios([poligono for poligono, _ in cambios])
+        for poligono, puntos in cambios:
+            poligono.puntos = puntos
+            poligono.dibujar()
+
+        # los que siguen seleccionados se vuelven a marcar
+        for figura in self._poligonos_seleccionados:
+            figura.cambiar_outline("red")
+        self._actualizar_manejadores()
+
+    ########### Arrastre de transformaciones ###########
+
+    def _actualizar_manejadores(self) -> None:
+        """
+        Dibuja los manejadores de mover, rotar y escalar alrededor de la selección.
+        """
+        self._lienzo.delete("manejador")
+        poligonos = self._poligonos_de_seleccion()
+        if not poligonos:
+            return
+
+        x_min, y_min, x_max, y_max = self._caja_seleccion(poligonos)
+        x_centro = (x_min + x_max) / 2
+        y_centro = (y_min + y_max) / 2
+        lado = Default.MANEJADOR_TAMANHO
+
+        self._lienzo.create_rectangle(
+            x_min, y_min, x_max, y_max, outline=Color.GREEN, dash=(4, 2),
+            tags="manejador",
+        )
+        self._lienzo.create_rectangle(
+            x_centro - lado, y_centro - lado, x_centro + lado, y_centro + lado,
+            fill=Color.GREEN, tags=("manejador", "manejador_mover"),
+        )
+        y_rotar = y_min - Default.MANEJADOR_DISTANCIA_ROTACION
+        self._lienzo.create_line(
+            x_centro, y_min, x_centro, y_rotar, fill=Color.GREEN, tags="manejador"
+        )
+        self._lienzo.create_oval(
+            x_centro - lado, y_rotar - lado, x_centro + lado, y_rotar + lado,
+            fill=Color.GREEN, tags=("manejador", "manejador_rotar"),
+        )
+        self._lienzo.create_rectangle(
+            x_max - lado, y_max - lado, x_max + lado, y_max + lado,
+            fill=Color.GREEN, tags=("manejador", "manejador_escalar"),
+        )
+
+    def _caja_seleccion(self, poligonos: list[Poligono]) -> tuple:
+        """
+        Calcula la caja que envuelve a los polígonos en coordenadas del lienzo.
+
+        Returns:
+            tuple: (x_min, y_min, x_max, y_max) en coordenadas del lienzo.
+        """
+        puntos = np.hstack([p.puntos for p in poligonos])
+        # en el lienzo la y va hacia abajo
+        return (
+            puntos[0].min(),
+            -puntos[1].max(),
+            puntos[0].max(),
+            -puntos[1].min(),
+        )
+
+    def _manejador_en(self, evento: tk.Event) -> str | None:
+        """
+        Devuelve el tipo de manejador que hay bajo el ratón, o None si no hay ninguno.
+        """
+        for item in self._lienzo.find_withtag("current"):
+            for tag in self._lienzo.gettags(item):
+                if tag in ("manejador_mover", "manejador_rotar", "manejador_escalar"):
+                    return tag
+        return None
+
+    def _iniciar_arrastre(self, tipo: str, evento: tk.Event) -> None:
+        """
+        Empieza a arrastrar un manejador: crea un contorno ligero por polígono
+        que se moverá con `coords` mientras dure el arrastre.
+
+        Args:
+            tipo (str): Manejador pulsado.
+            evento (tk.Event): Evento del clic.
+        """
+        poligonos = self._poligonos_de_seleccion()
+        x_min, y_min, x_max, y_max = self._caja_seleccion(poligonos)
+        inicio = self._crear_punto(evento.x, evento.y)
+
+        self._arrastre = {
+            "tipo": tipo,
+            "poligonos": poligonos,
+            "puntos": [p.puntos for p in poligonos],
+            "centro": ((x_min + x_max) / 2, (y_min + y_max) / 2),
+            "inicio": (inicio.x, inicio.y),
+            "actual": (inicio.x, inicio.y),
+            "contornos": [
+                self._lienzo.create_line(
+                    *self._coords_contorno(p.puntos), fill="red", dash=(3, 3),
+                    tags="vista_previa",
+                )
+                for p in poligonos
+            ],
+        }
+        self._lienzo.itemconfigure("manejador", state="hidden")
+
+    def _coords_contorno(self, puntos: np.ndarray) -> list:
+        """Devuelve las coordenadas del lienzo de un contorno cerrado."""
+        xs = np.append(puntos[0], puntos[0, 0])
+        ys = -np.append(puntos[1], puntos[1, 0])
+        return np.column_stack((xs, ys)).ravel().tolist()
+
+    def _mover_arrastre(self, evento: tk.Event) -> None:
+        """
+        Guarda la posición del ratón durante el arrastre. La vista previa se
+        actualiza como mucho una vez por frame de pantalla.
+        """
+        if self._arrastre is None:
+            self._dibujar_en_movimiento(evento)
+            return
+
+        punto = self._crear_punto(evento.x, evento.y)
+        self._arrastre["actual"] = (punto.x, punto.y)
+        if self._vista_previa_pendiente is None:
+            self._vista_previa_pendiente = self.ventana.after(
+                Default.VISTA_PREVIA_INTERVALO_MS, self._actualizar_vista_previa
+            )
+
+    def _actualizar_vista_previa(self) -> None:
+        """
+        Mueve los contornos de la vista previa a la posición que tendrán al soltar.
+        """
+        self._vista_previa_pendiente = None
+        if self._arrastre is None:
+            return
+
+        lote = TransformacionLote(
+            self._transformaciones_arrastre(), self._arrastre["puntos"], self._centro_arrastre()
+        )
+        for contorno, puntos in zip(self._arrastre["contornos"], lote.transformar()):
+            self._lienzo.coords(contorno, self._coords_contorno(puntos))
+
+    def _terminar_arrastre(self, evento: tk.Event) -> None:
+        """
+        Termina el arrastre: quita la vista previa y aplica la transformación de
+        verdad, rasterizando una sola vez.
+        """
+        if self._arrastre is None:
+            return
+
+        if self._vista_previa_pendiente is not None:
+            self.ventana.after_cancel(self._vista_previa_pendiente)
+            self._vista_previa_pendiente = None
+
+        punto = self._crear_punto(evento.x, evento.y)
+        self._arrastre["actual"] = (punto.x, punto.y)
+        movido = self._arrastre["actual"] != self._arrastre["inicio"]
+        transformaciones = self._transformaciones_arrastre()
+        centro = self._centro_arrastre()
+
+        self._lienzo.delete("vista_previa")
+        self._arrastre = None
+
+        # un clic sin arrastrar no cambia nada ni se guarda en el historial
+        if movido:
+            self._transformar_seleccion(transformaciones, centro)
+        self._actualizar_manejadores()
+
+    def _centro_arrastre(self) -> tuple[float, float]:
+        """
+        Devuelve el centro de la caja de la selección en las coordenadas de los
+        puntos, para que todos los polígonos giren y escalen alrededor del manejador.
+        """
+        x_centro, y_centro = self._arrastre["centro"]
+        # en el lienzo la y va hacia abajo
+        return x_centro, -y_centro
+
+    def _transformaciones_arrastre(self) -> dict:
+        """
+        Traduce el arrastre actual al mismo diccionario de transformaciones que usa el menú.
+
+        Returns:
+            dict: Transformaciones equivalentes al arrastre.
+        """
+        tipo = self._arrastre["tipo"]
+        x_inicio, y_inicio = self._arrastre["inicio"]
+        x_actual, y_actual = self._arrastre["actual"]
+        x_centro, y_centro = self._arrastre["centro"]
+        transformaciones = {}
+
+        if tipo == "manejador_mover":
+            # en el lienzo la y va hacia abajo
+            transformaciones[Texts.TRANS_TRASLACION] = (
+                x_actual - x_inicio,
+                y_inicio - y_actual,
+            )
+
+        elif tipo == "manejador_rotar":
+            angulo_inicio = np.arctan2(y_centro - y_inicio, x_inicio - x_centro)
+            angulo_actual = np.arctan2(y_centro - y_actual, x_actual - x_centro)
+            angulo = np.degrees(angulo_actual - angulo_inicio)
+            angulo = (angulo + 180) % 360 - 180
+            # angulo positivo = antihorario
+            transformaciones[Texts.TRANS_ROTACION] = (float(abs(angulo)), bool(angulo < 0))
+
+        elif tipo == "manejador_escalar":
+            transformaciones[Texts.TRANS_ESCALADO] = (
+                self._factor_escala(x_inicio, x_actual, x_centro),
+                self._factor_escala(y_inicio, y_actual, y_centro),
+            )
+
+        return transformaciones
+
+    def _factor_escala(self, inicio: float, actual: float, centro: float) -> float:
+        """Calcula el factor de escala de un eje según lo que se ha alejado el ratón del centro."""
+        distancia_inicio = inicio - centro
+        if abs(distancia_inicio) < 1:
+            return 1.0
+        return max((actual - centro) / distancia_inicio, Default.ESCALA_MINIMA)
+
     ########### Getters y setters ###########
 
     @property
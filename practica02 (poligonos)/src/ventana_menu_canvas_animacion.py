@@ -11,10 +11,28 @@ Fecha: 21 de septiembre de 2024
 """
 
 # Importaciones estándar
+import logging
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import filedialog
 import numpy as np
+from cache_frames import CacheFrames
+from constantes import Default, Texts
+from exportar import (
+    FORMATO_APNG,
+    FORMATO_GIF,
+    FORMATO_PNG,
+    exportar_animacion,
+    frames_a_poligonos,
+)
+from fotogramas_clave import AlmacenFotogramasClave, AnimacionFotogramasClave
+from planificador import PlanificadorFrames
+from rasterizado import imagen_a_ppm, rasterizar_frame
 from ventana_menu_canvas import VentanaMenuCanvas
 
+logger = logging.getLogger(__name__)
+
 
 class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
     """
@@ -34,9 +52,19 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
         """
         super().__init__(*args, **kwargs)
         self.animacion_activa = False  # Indica si la animación está activa
-        self.lista_frames: list = []  # Lista de frames para la animación
+        # Fotogramas clave de la animación, guardados como cambios sobre el anterior
+        self.lista_frames = AlmacenFotogramasClave()
+        # Frames que se reproducen, los intermedios se calculan al pedirlos
+        self.peli = AnimacionFotogramasClave([])
         self.frame_index = 0  # Índice del frame actual
         self.delay = 2  # Retraso entre frames (2 FPS por defecto)
+        self.planificador = PlanificadorFrames(2)  # Decide cuándo toca cada frame
+        self._exportacion = None  # Exportación en curso, si la hay
+        self._siguiente_frame = None  # Id del `after` del siguiente frame
+        self._ultimas_estadisticas = 0.0  # Última vez que se mostraron las estadísticas
+        self._cache_frames = CacheFrames()  # Frames ya renderizados como imagen
+        self._imagen_frame: int | None = None  # Item del canvas que muestra el frame
+        self._frame_mostrado: int | None = None  # Índice del último frame mostrado
 
     def iniciar_animacion(self) -> None:
         """
@@ -44,9 +72,10 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
         """
         if not self.animacion_activa and self.lista_frames:
             self.animacion_activa = True
-            if self.frame_index >= len(self.lista_frames):  # Si se llegó al final
+            if self.frame_index >= len(self.peli):  # Si se llegó al final
                 self.frame_index = 0  # Reiniciar desde el principio
             self.lienzo.delete("all")  # Limpiar el lienzo
+            self.planificador.reiniciar(estadisticas=True)
             self.actualizar_fps()
             self._ejecutar_animacion()
 
@@ -56,6 +85,8 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
         """
         super()._pausar_animacion()
         self.animacion_activa = False
+        self._cancelar_siguiente_frame()
+        self._fijar_frame_mostrado()
 
     def _reanudar_animacion(self) -> None:
         """
@@ -64,6 +95,7 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
         super()._reanudar_animacion()
         if not self.animacion_activa:
             self.animacion_activa = True
+            self.planificador.reiniciar()  # el tiempo en pausa no cuenta como retraso
             self.actualizar_fps()
             self._ejecutar_animacion()
 
@@ -73,41 +105,74 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
         """
         self.animacion_activa = False
         self.frame_index = 0
+        self._cancelar_siguiente_frame()
+        self._fijar_frame_mostrado()
         print("Animación detenida")
 
     def _ejecutar_animacion(self) -> None:
         """
         Método privado que ejecuta la lógica de la animación.
         Este método se llamará repetidamente mientras la animación esté activa.
+
+        Cada frame se programa para la hora que le toca según los FPS, contando
+        desde el inicio, así que el tiempo de dibujo no retrasa la animación.
+        Si aun así se va con retraso, se saltan frames.
         """
+        self._siguiente_frame = None
         if self.animacion_activa:
             self._actualizar_canvas()  # Dibujar el frame actual
-            self.frame_index += 1  # Pasar al siguiente frame
+            avance, espera = self.planificador.frame_mostrado()
+            self.frame_index += avance  # Pasar al siguiente frame que toque
+            self._mostrar_estadisticas()
 
-            if self.frame_index >= len(self.lista_frames):  # Fin de frames
+            if self.frame_index >= len(self.peli):  # Fin de frames
                 self.loop_activo = bool(
                     self.bucle_animacion.get()
                 )  # Obtener valor del checkbox
                 # print(self.loop_activo)
                 if self.loop_activo:  # Si el bucle está activo
                     self.actualizar_fps()
-                    self.frame_index = 0  # Reiniciar
+                    self.frame_index %= len(self.peli)  # Reiniciar
                 else:
                     self.detener_animacion()  # Detener la animación
                     return
 
             # Programar la siguiente ejecución de la animación
-            self.ventana.after(self.delay, self._ejecutar_animacion)
+            self._siguiente_frame = self.ventana.after(espera, self._ejecutar_animacion)
+
+    def _cancelar_siguiente_frame(self) -> None:
+        """Cancela el frame programado, para que al reanudar no haya dos bucles."""
+        if self._siguiente_frame is not None:
+            self.ventana.after_cancel(self._siguiente_frame)
+            self._siguiente_frame = None
+
+    def _mostrar_estadisticas(self) -> None:
+        """Muestra en el panel los FPS medidos, los tiempos entre frames y los descartados."""
+        ahora = time.perf_counter()
+        if (ahora - self._ultimas_estadisticas) * 1000 >= Default.PLANIFICADOR_REFRESCO_MS:
+            self._ultimas_estadisticas = ahora
+            self.label_estadisticas_peli.configure(text=self.planificador.resumen())
 
     def _actualizar_canvas(self) -> None:
         """
         Actualiza el contenido del canvas para reflejar los cambios de la animación.
         """
+        self._frame_mostrado = self.frame_index
+        if self.prerenderizar.get():
+            self._mostrar_frame_renderizado()
+        else:
+            self._dibujar_frame(self.peli[self.frame_index])
+
+    def _dibujar_frame(self, frame_actual: dict) -> None:
+        """
+        Dibuja todas las figuras de un frame en el canvas.
+
+        Args:
+            frame_actual (dict): Para cada figura, una tupla (puntos, color).
+        """
         # Limpiar el lienzo para dibujar el siguiente frame
         self.lienzo.delete("all")
-
-        # Obtener el frame actual
-        frame_actual = self.lista_frames[self.frame_index]
+        self._imagen_frame = None
 
         # Dibujar cada figura con sus puntos en el frame actual
         for figura, (puntos, color) in frame_actual.items():
@@ -115,33 +180,172 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
             figura.color = color
             figura.dibujar()  # Dibujar la figura en el canvas
 
+    def _mostrar_frame_renderizado(self) -> None:
+        """
+        Muestra el frame actual como una única imagen del canvas.
+
+        La primera vez el frame se pinta fuera del canvas y se guarda en la caché;
+        las siguientes solo se cambia la imagen del item, así que el coste no
+        depende del número de figuras.
+        """
+        entrada = self._cache_frames.obtener(self.frame_index)
+        if entrada is None:
+            entrada = self._renderizar_frame(self.peli[self.frame_index])
+
+        foto, (x, y) = entrada
+        if self._imagen_frame is None or not self.lienzo.find_withtag(self._imagen_frame):
+            self.lienzo.delete("all")
+            self._imagen_frame = self.lienzo.create_image(x, y, image=foto, anchor=tk.NW)
+        else:
+            self.lienzo.itemconfigure(self._imagen_frame, image=foto)
+            self.lienzo.coords(self._imagen_frame, x, y)
+
+    def _renderizar_frame(self, frame: dict) -> tuple:
+        """
+        Pinta un frame en una imagen y la guarda en la caché.
+
+        Args:
+            frame (dict): Para cada figura, una tupla (puntos, color).
+
+        Returns:
+            tuple: El PhotoImage y la esquina superior izquierda donde va en el canvas.
+        """
+        poligonos = [
+            (puntos, color, figura.tamanho, figura.rellenar)
+            for figura, (puntos, color) in frame.items()
+        ]
+        imagen, origen = rasterizar_frame(poligonos, fondo=Default.CANVAS_BACKGROUND_COLOR)
+        foto = tk.PhotoImage(data=imagen_a_ppm(imagen), format="PPM")
+
+        # tkinter guarda cada píxel con 4 bytes
+        memoria = imagen.shape[0] * imagen.shape[1] * 4
+        self._cache_frames.guardar(self.frame_index, (foto, origen), memoria)
+        return foto, origen
+
+    def _fijar_frame_mostrado(self) -> None:
+        """
+        Sustituye la imagen del frame por sus figuras, para poder seguir editándolas.
+        """
+        if self._imagen_frame is not None and self._frame_mostrado is not None:
+            self._dibujar_frame(self.peli[self._frame_mostrado])
+
     def _guardar_frame(self):
         """
-        Guarda un frame con las figuras actuales y sus puntos.
+        Guarda un fotograma clave con las figuras actuales y sus puntos.
+
+        Los frames intermedios y el suavizado elegidos en el panel se usan
+        para el tramo que va desde esta clave hasta la siguiente.
         """
         super()._guardar_frame()
 
-        # Crear un diccionario para almacenar las figuras y sus puntos en este frame
-        info_frame = {}
+        # Añadir este fotograma clave, solo se guardan las figuras que han cambiado
+        cambiadas = self.lista_frames.anhadir(
+            list(self._figuras), self._leer_intermedios(), self.opcion_suavizado.get()
+        )
+
+        logger.info(
+            "Frame %d guardado (%d figuras cambiadas)", len(self.lista_frames), cambiadas
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for figura in self._figuras:
+                logger.debug("  Figura: %s, Puntos: %s", figura, figura.puntos)
 
-        for figura in self._figuras:
-            # Registrar cada figura y sus puntos actuales
-            info_frame[figura] = (figura.puntos.copy(), figura.color)
+    def _leer_intermedios(self) -> int:
+        """
+        Lee el número de frames intermedios del panel.
 
-        # Añadir este frame a la lista de frames
-        self.lista_frames.append(info_frame)
+        Returns:
+            int: Frames intermedios, o el valor por defecto si no es válido.
+        """
+        try:
+            return max(int(self.input_intermedios.get()), 0)
+        except ValueError:
+            print("Número de intermedios inválido. Usando el valor por defecto.")
+            return Default.ANIMACION_INTERMEDIOS
 
-        print(f"Frame {len(self.lista_frames)} guardado:")
-        for figura, (puntos, color) in info_frame.items():
-            print(f"  Figura: {figura}, Puntos: {puntos}")
+    def _borrar_ultimo_frame(self):
+        """
+        Borra el último fotograma clave guardado.
+        """
+        super()._borrar_ultimo_frame()
+        if self.lista_frames:
+            self.lista_frames.pop()
 
     def _generar_peli(self):
         """
         Genera la animación iniciándola desde el principio.
         """
         super()._generar_peli()
+        self.peli = AnimacionFotogramasClave(self.lista_frames)
+        self._cache_frames.limpiar()
+        self.frame_index = 0
         self.iniciar_animacion()
 
+    def _exportar_peli(self):
+        """
+        Exporta la animación al formato elegido en el panel.
+
+        Los frames se pintan fuera del canvas en varios procesos, así que el
+        resultado no depende del zoom ni de lo que se vea en pantalla. La
+        exportación se hace en otro hilo para que la ventana siga respondiendo.
+        """
+        super()._exportar_peli()
+        if self._exportacion is not None:
+            print("Ya se está exportando una animación.")
+            return
+        if not self.lista_frames:
+            print("No hay frames que exportar.")
+            return
+
+        formato = {
+            Texts.TRANS_PELI_FORMATOS[0]: FORMATO_APNG,
+            Texts.TRANS_PELI_FORMATOS[1]: FORMATO_GIF,
+            Texts.TRANS_PELI_FORMATOS[2]: FORMATO_PNG,
+        }[self.opcion_formato_peli.get()]
+        extension = ".gif" if formato == FORMATO_GIF else ".png"
+        ruta = filedialog.asksaveasfilename(
+            defaultextension=extension, filetypes=[(formato.upper(), "*" + extension)]
+        )
+        if not ruta:
+            return
+
+        self.actualizar_fps()
+        # los polígonos se copian aquí, así que se puede seguir dibujando mientras tanto
+        frames = frames_a_poligonos(AnimacionFotogramasClave(self.lista_frames))
+        hilo = ThreadPoolExecutor(max_workers=1)
+        self._exportacion = hilo.submit(
+            exportar_animacion,
+            frames,
+            ruta,
+            formato,
+            fps=1000 / max(self.delay, 1),
+            fondo=Default.CANVAS_BACKGROUND_COLOR,
+        )
+        hilo.shutdown(wait=False)
+        print(f"Exportando {len(frames)} frames...")
+        self.ventana.after(Default.EXPORTAR_SONDEO_MS, self._comprobar_exportacion, len(frames))
+
+    def _comprobar_exportacion(self, num_frames: int) -> None:
+        """
+        Avisa del resultado de la exportación cuando termina; si no, vuelve a mirar más tarde.
+
+        Args:
+            num_frames (int): Frames que se están exportando.
+        """
+        if not self._exportacion.done():
+            self.ventana.after(
+                Default.EXPORTAR_SONDEO_MS, self._comprobar_exportacion, num_frames
+            )
+            return
+
+        exportacion, self._exportacion = self._exportacion, None
+        try:
+            archivos = exportacion.result()
+        except (OSError, RuntimeError, ValueError) as error:
+            print(f"No se pudo exportar la animación: {error}")
+            return
+        logger.info("Animación exportada: %d frames en %d archivo(s)", num_frames, len(archivos))
+
     def actualizar_fps(self) -> None:
         """
         Actualiza el delay de la animación basado en los FPS ingresados.
@@ -150,6 +354,7 @@ class VentanaMenuCanvasAnimacion(VentanaMenuCanvas):
             fps = float(self.input_fps.get())
             if fps > 0:
                 self.delay = int(1000 / fps)  # Convertir FPS a milisegundos
+                self.planificador.cambiar_fps(fps)
                 # print(f"FPS actualizado: {fps}")
         except ValueError:
             print("FPS inválido. Usando el valor anterior.")
@@ -0,0 +1,28 @@
+from cache_frames import CacheFrames
+
+# Comprueba que la cache respeta la memoria y descarta el frame menos usado
+
+
+def test_descarta_el_menos_usado():
+    cache = CacheFrames(memoria_maxima=300)
+    cache.guardar(0, "frame 0", 100)
+    cache.guardar(1, "frame 1", 100)
+    cache.guardar(2, "frame 2", 100)
+
+    # usar el 0 hace que el descartado sea el 1
+    assert cache.obtener(0) == "frame 0"
+    cache.guardar(3, "frame 3", 100)
+
+    assert 1 not in cache
+    assert cache.obtener(1) is None
+    assert [i in cache for i in (0, 2, 3)] == [True, True, True]
+    assert cache.memoria == 300
+
+    # un frame mas grande que el limite no se guarda
+    cache.guardar(4, "frame 4", 400)
+    assert 4 not in cache and len(cache) == 3
+
+
+if __name__ == "__main__":
+    test_descarta_el_menos_usado()
+    print("Caché de frames correcta")
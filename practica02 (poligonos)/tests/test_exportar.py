@@ -0,0 +1,133 @@
+import os
+import struct
+import subprocess
+import sys
+import zlib
+
+import numpy as np
+
+from exportar import FORMATO_APNG, FORMATO_PNG, exportar_animacion
+from rasterizado import caja_frame
+
+# Exporta una animacion corta a APNG y a una secuencia de PNG y lee lo escrito:
+# numero de frames, tamaño y paleta
+
+
+def cuadrado(x, y, lado):
+    """Puntos (3 x 4) de un cuadrado con la esquina inferior izquierda en (x, y)."""
+    return np.array(
+        [[x, x + lado, x + lado, x], [y, y, y + lado, y + lado], [1, 1, 1, 1]], dtype=float
+    )
+
+
+FRAMES = [
+    [
+        (cuadrado(10 + 5 * i, 10, 20), "#ff0000", 1, True),
+        (cuadrado(40, 5 * i, 8), "blue", 2, False),
+    ]
+    for i in range(3)
+]
+
+
+def leer_trozos(ruta):
+    """Devuelve los trozos (tipo, datos) de un PNG."""
+    with open(ruta, "rb") as archivo:
+        contenido = archivo.read()
+    assert contenido[:8] == b"\x89PNG\r\n\x1a\n"
+    trozos, posicion = [], 8
+    while posicion < len(contenido):
+        (longitud,) = struct.unpack(">I", contenido[posicion : posicion + 4])
+        tipo = contenido[posicion + 4 : posicion + 8]
+        datos = contenido[posicion + 8 : posicion + 8 + longitud]
+        (crc,) = struct.unpack(">I", contenido[posicion + 8 + longitud : posicion + 12 + longitud])
+        assert crc == zlib.crc32(tipo + datos) & 0xFFFFFFFF
+        trozos.append((tipo, datos))
+        posicion += 12 + longitud
+    assert trozos[-1][0] == b"IEND"
+    return trozos
+
+
+def tamanho_esperado():
+    cajas = np.array([caja_frame(poligonos) for poligonos in FRAMES])
+    return cajas[:, 2].max() - cajas[:, 0].min(), cajas[:, 3].max() - cajas[:, 1].min()
+
+
+def comprobar_cabecera(trozos):
+    """Comprueba el IHDR y el PLTE y devuelve el tamaño de la imagen."""
+    tipos = dict(trozos)
+    ancho, alto, bits, tipo_color = struct.unpack(">IIBB", tipos[b"IHDR"][:10])
+    assert (ancho, alto) == tamanho_esperado()
+    # fondo blanco, rojo y azul: caben en una paleta
+    assert bits == 8 and tipo_color == 3
+    paleta = set(struct.iter_unpack("BBB", tipos[b"PLTE"]))
+    assert paleta == {(255, 255, 255), (255, 0, 0), (0, 0, 255)}
+    return ancho, alto
+
+
+def comprobar_pixeles(datos, ancho, alto):
+    filas = np.frombuffer(zlib.decompress(datos), dtype=np.uint8).reshape(alto, ancho + 1)
+    assert np.all(filas[:, 0] == 0)
+    # se usan los tres colores de la paleta
+    assert set(np.unique(filas[:, 1:])) == {0, 1, 2}
+
+
+def test_exportar_apng(tmp_path):
+    ruta = str(tmp_path / "peli.png")
+    assert exportar_animacion(FRAMES, ruta, FORMATO_APNG, fps=4, procesos=2) == [ruta]
+
+    trozos = leer_trozos(ruta)
+    ancho, alto = comprobar_cabecera(trozos)
+    tipos = [tipo for tipo, _ in trozos]
+    assert tipos.index(b"acTL") < tipos.index(b"IDAT")
+    (num_frames,) = struct.unpack(">I", dict(trozos)[b"acTL"][:4])
+    assert num_frames == len(FRAMES)
+    assert tipos.count(b"fcTL") == len(FRAMES)
+    assert tipos.count(b"IDAT") + tipos.count(b"fdAT") == len(FRAMES)
+
+    # los números de secuencia de fcTL y fdAT van seguidos
+    secuencias = [
+        struct.unpack(">I", datos[:4])[0] for tipo, datos in trozos if tipo in (b"fcTL", b"fdAT")
+    ]
+    assert secuencias == list(range(len(secuencias)))
+    for tipo, datos in trozos:
+        if tipo == b"fcTL":
+            assert struct.unpack(">II", datos[4:12]) == (ancho, alto)
+            assert struct.unpack(">HH", datos[20:24]) == (250, 1000)
+        elif tipo == b"IDAT":
+            comprobar_pixeles(datos, ancho, alto)
+        elif tipo == b"fdAT":
+            comprobar_pixeles(datos[4:], ancho, alto)
+
+
+def test_exportar_secuencia_png(tmp_path):
+    rutas = exportar_animacion(FRAMES, str(tmp_path / "frame.png"), FORMATO_PNG, procesos=2)
+    assert [os.path.basename(ruta) for ruta in rutas] == [
+        f"frame_{indice:04d}.png" for indice in range(len(FRAMES))
+    ]
+
+    imagenes = []
+    for ruta in rutas:
+        trozos = leer_trozos(ruta)
+        ancho, alto = comprobar_cabecera(trozos)
+        assert b"acTL" not in dict(trozos)
+        comprobar_pixeles(dict(trozos)[b"IDAT"], ancho, alto)
+        imagenes.append(zlib.decompress(dict(trozos)[b"IDAT"]))
+    # el cuadrado se mueve, así que los frames son distintos
+    assert len(set(imagenes)) == len(FRAMES)
+
+
+def test_exportar_no_carga_tkinter():
+    codigo = "import sys, exportar; sys.exit('tkinter' in sys.modules)"
+    carpeta = os.path.join(os.path.dirname(__file__), "..", "src")
+    assert subprocess.run([sys.executable, "-c", codigo], cwd=carpeta).returncode == 0
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        test_exportar_apng(Path(carpeta))
+        test_exportar_secuencia_png(Path(carpeta))
+    test_exportar_no_carga_tkinter()
+    print("Exportación correcta")
@@ -0,0 +1,90 @@
+import numpy as np
+
+from constantes import Texts
+from fotogramas_clave import (
+    AlmacenFotogramasClave,
+    AnimacionFotogramasClave,
+    FotogramaClave,
+)
+
+# Comprueba que los frames intermedios empiezan y acaban en las claves y que
+# una rotacion se interpola girando, no acortando el poligono
+
+
+CUADRADO = np.array([[-50, 50, 50, -50], [-50, -50, 50, 50], [1, 1, 1, 1]])
+
+
+def test_interpolacion_entre_claves():
+    # la segunda clave es el cuadrado girado 90 grados y desplazado
+    girado = np.array([[50, 50, -50, -50], [-50, 50, 50, -50], [1, 1, 1, 1]])
+    girado[:2] += np.array([[200], [100]])
+
+    claves = [
+        FotogramaClave({"cuadrado": (CUADRADO, "red")}, 3, Texts.SUAVIZADO_LINEAL),
+        FotogramaClave({"cuadrado": (girado, "red")}),
+    ]
+    peli = AnimacionFotogramasClave(claves)
+
+    assert len(peli) == 5
+    assert np.array_equal(peli[0]["cuadrado"][0], CUADRADO)
+    assert np.array_equal(peli[4]["cuadrado"][0], girado)
+
+    # en la mitad el centro esta a medio camino y el cuadrado no encoge
+    puntos, color = peli[2]["cuadrado"]
+    centro = puntos[:2].mean(axis=1)
+    assert np.allclose(centro, [100, 50], atol=1)
+    radios = np.hypot(*(puntos[:2] - centro[:, None]))
+    assert np.allclose(radios, 50 * np.sqrt(2), atol=1)
+    assert color == "red"
+
+
+class PoligonoFalso:
+    """Solo necesitamos un objeto con puntos y color."""
+
+    def __init__(self, puntos, color="black"):
+        self.puntos = puntos
+        self.color = color
+
+
+def test_almacen_reconstruye_las_claves():
+    rng = np.random.default_rng(2)
+    poligonos = [PoligonoFalso(CUADRADO.copy()) for _ in range(5)]
+    almacen = AlmacenFotogramasClave(intervalo_completos=4)
+    esperadas = []
+
+    for numero in range(13):
+        # cada clave se mueve un poligono, se edita un vertice o se cambia un color
+        poligono = poligonos[numero % len(poligonos)]
+        if numero % 3 == 0:
+            poligono.puntos = poligono.puntos + np.array([[7], [-3], [0]])
+        elif numero % 3 == 1:
+            poligono.puntos = poligono.puntos.copy()
+            poligono.puntos[:2, 0] += rng.integers(-5, 5, 2)
+        else:
+            poligono.color = "red"
+        if numero == 6:
+            poligonos.pop()
+
+        almacen.anhadir(poligonos)
+        esperadas.append({p: (p.puntos.copy(), p.color) for p in poligonos})
+
+    # las claves sin cambios no guardan los poligonos que no se han movido
+    assert almacen.memoria < sum(
+        puntos.nbytes for clave in esperadas for puntos, _ in clave.values()
+    ) / 2
+
+    for indice in rng.permutation(len(esperadas)).tolist() + list(range(len(esperadas))):
+        figuras = almacen[indice].figuras
+        assert figuras.keys() == esperadas[indice].keys()
+        for poligono, (puntos, color) in esperadas[indice].items():
+            assert np.array_equal(figuras[poligono][0], puntos)
+            assert figuras[poligono][1] == color
+
+    almacen.pop()
+    assert len(almacen) == 12
+
+
+if __name__ == "__main__":
+    test_interpolacion_entre_claves()
+    test_almacen_reconstruye_las_claves()
+    print("Fotogramas clave correctos")
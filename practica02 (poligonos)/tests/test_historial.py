@@ -0,0 +1,102 @@
+import numpy as np
+
+from constantes import Texts
+from transformaciones import TransformacionLote
+from historial import HistorialTransformaciones
+
+# Comprueba que deshacer y rehacer devuelven exactamente los puntos de cada paso
+# aunque solo se guarden instantaneas de vez en cuando
+
+
+class PoligonoFalso:
+    """Solo necesitamos un objeto con puntos para el historial."""
+
+    def __init__(self, puntos):
+        self.puntos = puntos
+
+
+TRANSFORMACIONES = {
+    Texts.TRANS_TRASLACION: (7, -4),
+    Texts.TRANS_ESCALADO: (1.1, 0.9),
+    Texts.TRANS_ROTACION: (17, False),
+    Texts.TRANS_SHEARING: (0.1, 0),
+    Texts.TRANS_REFLEXION: (Texts.REFLEXION_NINGUNA, 0, 0),
+}
+
+
+def transformar(historial, poligonos):
+    lote = TransformacionLote(TRANSFORMACIONES, [p.puntos for p in poligonos])
+    historial.registrar(
+        poligonos,
+        [p.puntos for p in poligonos],
+        lote.matrices_transformacion,
+        lote.indice_poligono,
+    )
+    for poligono, puntos in zip(poligonos, lote.transformar()):
+        poligono.puntos = puntos
+
+
+def crear_poligonos(n):
+    rng = np.random.default_rng(1)
+    return [
+        PoligonoFalso(
+            np.vstack([rng.integers(-100, 100, (2, 5)), np.ones((1, 5), dtype=int)])
+        )
+        for _ in range(n)
+    ]
+
+
+def test_deshacer_y_rehacer_exactos():
+    historial = HistorialTransformaciones(intervalo_instantaneas=4)
+    poligonos = crear_poligonos(3)
+
+    estados = []
+    for _ in range(10):
+        estados.append([p.puntos for p in poligonos])
+        transformar(historial, poligonos)
+    final = [p.puntos for p in poligonos]
+
+    for esperados in reversed(estados):
+        for poligono, puntos in historial.deshacer():
+            poligono.puntos = puntos
+        for poligono, puntos in zip(poligonos, esperados):
+            assert np.array_equal(poligono.puntos, puntos)
+    assert historial.deshacer() == []
+
+    for _ in estados:
+        for poligono, puntos in historial.rehacer():
+            poligono.puntos = puntos
+    for poligono, puntos in zip(poligonos, final):
+        assert np.array_equal(poligono.puntos, puntos)
+
+
+def test_invalidar_olvida_el_objeto():
+    historial = HistorialTransformaciones(max_invalidados=1)
+    poligonos = crear_poligonos(2)
+    transformar(historial, poligonos[:1])
+    transformar(historial, poligonos)
+
+    historial.invalidar(poligonos[0])
+    cambios = historial.deshacer()
+    assert [p for p, _ in cambios] == [poligonos[1]]
+    # el primer paso solo tenia al poligono borrado
+    assert historial.deshacer() == []
+
+
+def test_memoria_limitada():
+    historial = HistorialTransformaciones(intervalo_instantaneas=5, memoria_maxima=2000)
+    poligonos = crear_poligonos(4)
+    for _ in range(200):
+        transformar(historial, poligonos)
+    assert historial.memoria <= 2000
+
+    # se puede seguir deshaciendo lo que queda sin errores
+    while historial.deshacer():
+        pass
+
+
+if __name__ == "__main__":
+    test_deshacer_y_rehacer_exactos()
+    test_invalidar_olvida_el_objeto()
+    test_memoria_limitada()
+    print("Historial correcto")
@@ -0,0 +1,33 @@
+from planificador import PlanificadorFrames
+
+# Comprueba que el planificador no acumula el tiempo de dibujo y que salta
+# frames cuando va con retraso
+
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def test_compensa_el_tiempo_de_dibujo():
+    reloj = RelojFalso()
+    planificador = PlanificadorFrames(10, reloj=reloj)  # 100 ms por frame
+
+    assert planificador.frame_mostrado() == (1, 100)
+    # dibujar el frame ha costado 30 ms, asi que solo hay que esperar 70
+    reloj.ahora = 0.130
+    assert planificador.frame_mostrado() == (1, 70)
+
+    # un frame muy lento hace saltar los que ya no llegan a tiempo
+    reloj.ahora = 0.450
+    assert planificador.frame_mostrado() == (3, 50)
+    assert planificador.frames_descartados == 2
+    assert planificador.percentiles((50,))[0] > 0
+
+
+if __name__ == "__main__":
+    test_compensa_el_tiempo_de_dibujo()
+    print("Planificador correcto")
@@ -0,0 +1,57 @@
+import numpy as np
+
+from constantes import Texts
+from transformaciones import Transformacion, TransformacionLote
+
+# Comprueba que transformar muchos poligonos en lote da lo mismo que
+# transformarlos uno a uno con Transformacion
+
+
+def test_lote_igual_que_uno_a_uno():
+    rng = np.random.default_rng(0)
+    lista_puntos = [
+        np.vstack([rng.integers(-300, 300, (2, n)), np.ones((1, n), dtype=int)])
+        for n in rng.integers(3, 12, 200)
+    ]
+    # un poligono repetido comparte centro con el primero
+    lista_puntos.append(lista_puntos[0].copy())
+
+    transformaciones = {
+        Texts.TRANS_TRASLACION: (5, -3),
+        Texts.TRANS_ESCALADO: (1.5, 0.7),
+        Texts.TRANS_ROTACION: (33, True),
+        Texts.TRANS_SHEARING: (0.2, 0.1),
+        Texts.TRANS_REFLEXION: (Texts.REFLEXION_LINE, 2, 3),
+    }
+
+    lote = TransformacionLote(transformaciones, lista_puntos)
+    resultado = lote.transformar()
+
+    assert len(lote.centros) == 200
+    for puntos, transformados in zip(lista_puntos, resultado):
+        esperado = Transformacion(transformaciones, puntos).transformar(puntos)
+        assert np.array_equal(transformados, esperado)
+
+
+def test_lote_con_centro_comun():
+    # dos cuadrados a cada lado de (0, 0): al girar 180 grados sobre el centro
+    # comun se cambian de sitio, en vez de girar cada uno en el suyo
+    izquierda = np.array([[-30, -10, -10, -30], [-10, -10, 10, 10], [1, 1, 1, 1]])
+    derecha = np.array([[10, 30, 30, 10], [-10, -10, 10, 10], [1, 1, 1, 1]])
+    transformaciones = {Texts.TRANS_ROTACION: (180, False)}
+
+    lote = TransformacionLote(transformaciones, [izquierda, derecha], centro=(0, 0))
+    nueva_izquierda, nueva_derecha = lote.transformar()
+
+    assert len(lote.centros) == 1
+    # los puntos se truncan a enteros, asi que puede faltar una unidad
+    assert np.allclose(np.sort(nueva_izquierda[0]), np.sort(derecha[0]), atol=1)
+    assert np.allclose(np.sort(nueva_derecha[0]), np.sort(izquierda[0]), atol=1)
+    esperado = Transformacion(transformaciones, centro=(0, 0)).transformar(izquierda)
+    assert np.array_equal(nueva_izquierda, esperado)
+
+
+if __name__ == "__main__":
+    test_lote_igual_que_uno_a_uno()
+    test_lote_con_centro_comun()
+    print("Transformación en lote correcta")
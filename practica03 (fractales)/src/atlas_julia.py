@@ -0,0 +1,231 @@
+"""
+Archivo: atlas_julia.py
+
+Descripción:
+Este archivo calcula atlas de conjuntos de Julia: una rejilla de miniaturas, una
+por cada valor de c de una rejilla del plano complejo (por ejemplo, la del conjunto
+de Mandelbrot). Se puede usar desde Python o desde la línea de comandos, sin abrir
+ninguna ventana.
+
+Características principales:
+- Las miniaturas se reparten en grupos entre los procesos de `motor_fractal`, que
+  son los mismos durante todo el programa, con varios grupos por proceso para que
+  todos los núcleos estén ocupados hasta el final.
+- Cada grupo de miniaturas se calcula con una sola llamada al núcleo vectorizado:
+  el c de cada punto es el de su miniatura.
+- Las miniaturas se escriben directamente en un mosaico en memoria compartida, que
+  se guarda en un PNG junto con un PNG por miniatura.
+
+Uso:
+    python atlas_julia.py --columnas 32 --filas 32 --lado 64 --salida atlas
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import argparse
+import math
+import os
+from multiprocessing import shared_memory
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from constantes import Default, Texts  # Constantes predeterminadas.
+from nucleo_fractal import elegir_precision, tiempo_escape  # Cálculo vectorizado.
+from motor_fractal import ImagenCompartida, obtener_pool  # Procesos compartidos.
+from colores import crear_lut, guardar_png  # Colores de las iteraciones.
+
+# Grupos de miniaturas que se mandan por cada proceso
+GRUPOS_POR_PROCESO = 4
+
+
+def rejilla_c(re_min, re_max, im_min, im_max, columnas, filas) -> np.ndarray:
+    """
+    Devuelve una rejilla de valores de c, con la fila 0 arriba (la de mayor parte
+    imaginaria), como se ven en una imagen.
+
+    Args:
+        re_min, re_max (float): Límites de la parte real.
+        im_min, im_max (float): Límites de la parte imaginaria.
+        columnas, filas (int): Número de valores en cada dirección.
+
+    Returns:
+        np.ndarray: Valores de c complejos (filas x columnas).
+    """
+    reales = np.linspace(re_min, re_max, columnas)
+    imaginarios = np.linspace(im_max, im_min, filas)
+    return reales[np.newaxis, :] + 1j * imaginarios[:, np.newaxis]
+
+
+def _escribir_miniaturas(
+    nombre, forma, tipo_datos, posiciones, cs, lado, limites, max_iter, precision
+):
+    """
+    Calcula un grupo de miniaturas y las escribe en el mosaico compartido. Se
+    ejecuta en los procesos del grupo.
+    """
+    suave = np.dtype(tipo_datos).kind == "f"
+    x_min, x_max, y_min, y_max = limites
+    # centro de cada píxel; la fila 0 de cada miniatura es la de arriba
+    x = x_min + (np.arange(lado) + 0.5) * (x_max - x_min) / lado
+    y = y_max - (np.arange(lado) + 0.5) * (y_max - y_min) / lado
+    cuentas = tiempo_escape(
+        x[np.newaxis, np.newaxis, :],
+        y[np.newaxis, :, np.newaxis],
+        cs.real[:, np.newaxis, np.newaxis],
+        cs.imag[:, np.newaxis, np.newaxis],
+        max_iter,
+        periodicidad=Default.FRACTAL_PERIODICIDAD,
+        suave=suave,
+        precision=precision,
+    )
+
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        img = np.ndarray(forma, dtype=tipo_datos, buffer=memoria.buf)
+        for miniatura, (fila, columna) in zip(cuentas, posiciones):
+            img[fila * lado : (fila + 1) * lado, columna * lado : (columna + 1) * lado] = (
+                miniatura
+            )
+        del img  # el array no puede seguir vivo al cerrar la memoria
+    finally:
+        memoria.close()
+
+
+def renderizar_atlas(
+    cs: np.ndarray, lado: int = Default.ATLAS_LADO, limites=Default.ATLAS_LIMITES,
+    max_iter: int = Default.ATLAS_ITERACIONES, suave: bool = Default.FRACTAL_SUAVE,
+    procesos: int | None = Default.FRACTAL_PROCESOS,
+    precision: str = Default.FRACTAL_PRECISION,
+) -> ImagenCompartida:
+    """
+    Calcula el mosaico de los conjuntos de Julia de una rejilla de valores de c.
+
+    Args:
+        cs (np.ndarray): Valores de c (filas x columnas), como los de `rejilla_c`.
+        lado (int): Lado en píxeles de cada miniatura.
+        limites (tuple): (x_min, x_max, y_min, y_max) de cada miniatura en el plano.
+        max_iter (int): Número máximo de iteraciones.
+        suave (bool): Calcular las iteraciones continuas.
+        procesos (int | None): Procesos de cálculo si aún no se ha creado el grupo.
+        precision (str): "float32", "float64" o "auto" (según el tamaño de los píxeles).
+
+    Returns:
+        ImagenCompartida: Iteraciones del mosaico (filas·lado x columnas·lado), con
+            la fila 0 arriba. Hay que liberarla cuando ya no se use.
+    """
+    filas, columnas = cs.shape
+    x_min, x_max, y_min, y_max = limites
+    precision = elegir_precision(precision, max(x_max - x_min, y_max - y_min) / lado)
+    imagen = ImagenCompartida(columnas * lado, filas * lado, suave)
+    try:
+        pool = obtener_pool(procesos)
+        posiciones = [(fila, columna) for fila in range(filas) for columna in range(columnas)]
+        valores = cs.ravel()
+        por_grupo = max(
+            math.ceil(len(posiciones) / (GRUPOS_POR_PROCESO * (procesos or os.cpu_count()))), 1
+        )
+        futuros = [
+            pool.submit(
+                _escribir_miniaturas,
+                imagen.nombre,
+                imagen.forma,
+                imagen.tipo_datos,
+                posiciones[inicio : inicio + por_grupo],
+                valores[inicio : inicio + por_grupo],
+                lado,
+                tuple(limites),
+                max_iter,
+                precision,
+            )
+            for inicio in range(0, len(posiciones), por_grupo)
+        ]
+        for futuro in futuros:
+            futuro.result()
+    except BaseException:
+        imagen.liberar()
+        raise
+    return imagen
+
+
+def guardar_atlas(
+    carpeta: str, cuentas: np.ndarray, cs: np.ndarray, lado: int, max_iter: int,
+    mapa: str = Texts.JULIA_COLORES_DEFAULT, miniaturas: bool = True,
+) -> None:
+    """
+    Guarda el mosaico en `carpeta/atlas.png` y, si se pide, cada miniatura en
+    `carpeta/julia_<fila>_<columna>.png`.
+
+    Args:
+        carpeta (str): Carpeta de salida; se crea si no existe.
+        cuentas (np.ndarray): Iteraciones del mosaico de `renderizar_atlas`.
+        cs (np.ndarray): Valores de c del mosaico.
+        lado (int): Lado en píxeles de cada miniatura.
+        max_iter (int): Número máximo de iteraciones.
+        mapa (str): Mapa de colores de Matplotlib.
+        miniaturas (bool): Guardar también cada miniatura por separado.
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    lut = crear_lut(mapa)
+    guardar_png(os.path.join(carpeta, "atlas.png"), cuentas, max_iter, lut)
+    if not miniaturas:
+        return
+    filas, columnas = cs.shape
+    for fila in range(filas):
+        for columna in range(columnas):
+            miniatura = cuentas[
+                fila * lado : (fila + 1) * lado, columna * lado : (columna + 1) * lado
+            ]
+            guardar_png(
+                os.path.join(carpeta, f"julia_{fila:03d}_{columna:03d}.png"),
+                miniatura,
+                max_iter,
+                lut,
+            )
+
+
+def main() -> None:
+    """Calcula un atlas con los argumentos de la línea de comandos y lo guarda."""
+    parser = argparse.ArgumentParser(
+        description="Calcula un atlas de conjuntos de Julia para una rejilla de valores de c."
+    )
+    parser.add_argument("--real", type=float, nargs=2, default=(-2.0, 1.0),
+                        metavar=("MIN", "MAX"), help="Límites de la parte real de c.")
+    parser.add_argument("--imaginario", type=float, nargs=2, default=(-1.5, 1.5),
+                        metavar=("MIN", "MAX"), help="Límites de la parte imaginaria de c.")
+    parser.add_argument("--columnas", type=int, default=32, help="Valores de c por fila.")
+    parser.add_argument("--filas", type=int, default=32, help="Valores de c por columna.")
+    parser.add_argument("--lado", type=int, default=Default.ATLAS_LADO,
+                        help="Lado de cada miniatura en píxeles.")
+    parser.add_argument("--limites", type=float, nargs=4, default=Default.ATLAS_LIMITES,
+                        metavar=("XMIN", "XMAX", "YMIN", "YMAX"),
+                        help="Zona del plano que muestra cada miniatura.")
+    parser.add_argument("--iteraciones", type=int, default=Default.ATLAS_ITERACIONES,
+                        help="Número máximo de iteraciones.")
+    parser.add_argument("--mapa", default=Texts.JULIA_COLORES_DEFAULT,
+                        help="Mapa de colores de Matplotlib.")
+    parser.add_argument("--procesos", type=int, default=Default.FRACTAL_PROCESOS,
+                        help="Procesos de cálculo (por defecto, uno por núcleo).")
+    parser.add_argument("--salida", default="atlas", help="Carpeta de salida.")
+    parser.add_argument("--sin-miniaturas", action="store_true",
+                        help="Guardar solo el mosaico.")
+    argumentos = parser.parse_args()
+
+    cs = rejilla_c(*argumentos.real, *argumentos.imaginario, argumentos.columnas,
+                   argumentos.filas)
+    print(f"Calculando {cs.size} conjuntos de Julia de {argumentos.lado}x{argumentos.lado}...")
+    with renderizar_atlas(
+        cs, argumentos.lado, argumentos.limites, argumentos.iteraciones,
+        procesos=argumentos.procesos,
+    ) as imagen:
+        guardar_atlas(
+            argumentos.salida, imagen.img, cs, argumentos.lado, argumentos.iteraciones,
+            argumentos.mapa, not argumentos.sin_miniaturas,
+        )
+    print(f"Atlas guardado en {argumentos.salida}")
+
+
+if __name__ == "__main__":
+    main()
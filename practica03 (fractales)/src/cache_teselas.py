@@ -0,0 +1,194 @@
+"""
+Archivo: cache_teselas.py
+
+Descripción:
+Este archivo contiene la caché de teselas ya calculadas de los fractales de tiempo
+de escape, para que al volver a una zona o al alejar el zoom no haya que calcularla
+otra vez.
+
+Características principales:
+- El plano complejo se divide en un árbol cuaternario (quadtree): en el nivel n
+  cada tesela mide TAMANHO_NIVEL_0 / 2**n unidades y tiene 4 hijas en el nivel n + 1.
+- Cada tesela se identifica por (fractal, nivel, tx, ty), donde el fractal incluye
+  el tipo, su parámetro y el algoritmo. El número máximo de iteraciones, que crece
+  con el nivel, se guarda con cada tesela: una tesela solo sirve con el suyo, pero
+  sus antecesoras sirven para aproximarla aunque se calcularan con menos.
+- Las iteraciones enteras se guardan en el tipo entero más pequeño que las admite,
+  y las continuas en float32.
+- La memoria está limitada: se descartan las teselas usadas hace más tiempo (LRU).
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import math
+from collections import OrderedDict
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from constantes import Default  # Constantes predeterminadas.
+
+TAMANHO_NIVEL_0 = 4.0  # Lado en el plano complejo de las teselas del nivel 0
+
+
+def tamanho_tesela(nivel: int) -> float:
+    """Devuelve el lado en el plano complejo de las teselas de un nivel."""
+    return TAMANHO_NIVEL_0 / 2**nivel
+
+
+def nivel_para(tamanho_pixel: float, pixeles: int = Default.FRACTAL_TESELA) -> int:
+    """
+    Elige el nivel menos profundo cuyos píxeles no sean mayores que los de la vista,
+    para que la imagen no se vea pixelada.
+
+    Args:
+        tamanho_pixel (float): Lado de un píxel de la vista en el plano complejo.
+        pixeles (int): Lado de cada tesela en píxeles.
+
+    Returns:
+        int: Nivel del árbol.
+    """
+    return max(math.ceil(math.log2(TAMANHO_NIVEL_0 / (pixeles * tamanho_pixel))), 0)
+
+
+def teselas_visibles(x_min, x_max, y_min, y_max, nivel):
+    """
+    Calcula qué teselas de un nivel cubren una zona del plano complejo.
+
+    Args:
+        x_min, x_max (float): Límites del eje real.
+        y_min, y_max (float): Límites del eje imaginario.
+        nivel (int): Nivel del árbol.
+
+    Returns:
+        tuple: Índices (tx, ty) de la primera tesela y número de teselas en cada eje.
+    """
+    lado = tamanho_tesela(nivel)
+    tx0, ty0 = math.floor(x_min / lado), math.floor(y_min / lado)
+    tx1, ty1 = math.ceil(x_max / lado), math.ceil(y_max / lado)
+    return tx0, ty0, max(tx1 - tx0, 1), max(ty1 - ty0, 1)
+
+
+def tipo_compacto(max_iter: int):
+    """Devuelve el tipo entero más pequeño que puede guardar hasta max_iter."""
+    for tipo in (np.uint8, np.uint16):
+        if max_iter <= np.iinfo(tipo).max:
+            return tipo
+    return np.int32
+
+
+class CacheTeselas:
+    """
+    Caché LRU de teselas calculadas, con un máximo de memoria.
+    """
+
+    def __init__(self, memoria_maxima: int = Default.FRACTAL_CACHE_MEMORIA) -> None:
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            memoria_maxima (int): Bytes máximos que pueden ocupar las teselas guardadas.
+        """
+        self.memoria_maxima = memoria_maxima
+        self._teselas: OrderedDict = OrderedDict()  # Clave -> (iteraciones, max_iter)
+        self._memoria = 0
+
+    def obtener(self, clave, max_iter: int | None = None) -> np.ndarray | None:
+        """
+        Devuelve las iteraciones de una tesela y la marca como la más reciente.
+
+        Args:
+            clave (tuple): (fractal, nivel, tx, ty).
+            max_iter (int | None): Si se indica, la tesela solo se devuelve si se
+                calculó con ese número máximo de iteraciones.
+
+        Returns:
+            np.ndarray | None: Las iteraciones, o None si no está en la caché.
+        """
+        guardada = self._teselas.get(clave)
+        if guardada is None or (max_iter is not None and guardada[1] != max_iter):
+            return None
+        self._teselas.move_to_end(clave)
+        return guardada[0]
+
+    def guardar(self, clave, cuentas: np.ndarray, max_iter: int) -> None:
+        """
+        Guarda una tesela y descarta las más antiguas si no cabe.
+
+        Args:
+            clave (tuple): (fractal, nivel, tx, ty).
+            cuentas (np.ndarray): Iteraciones de la tesela.
+            max_iter (int): Número máximo de iteraciones con el que se calculó.
+        """
+        if cuentas.dtype.kind == "f":
+            datos = cuentas.astype(np.float32)
+        else:
+            datos = cuentas.astype(tipo_compacto(max_iter))
+        if clave in self._teselas:
+            self._memoria -= self._teselas.pop(clave)[0].nbytes
+        if datos.nbytes > self.memoria_maxima:
+            return
+
+        while self._teselas and self._memoria + datos.nbytes > self.memoria_maxima:
+            _, (descartada, _) = self._teselas.popitem(last=False)
+            self._memoria -= descartada.nbytes
+
+        self._teselas[clave] = (datos, max_iter)
+        self._memoria += datos.nbytes
+
+    def aproximar(self, clave, max_iter: int | None = None) -> np.ndarray | None:
+        """
+        Aproxima una tesela que no está en la caché con la parte que le toca de su
+        antecesora más cercana, ampliada. Sirve para mostrar algo mientras se calcula.
+
+        Args:
+            clave (tuple): (fractal, nivel, tx, ty).
+            max_iter (int | None): Número máximo de iteraciones de la tesela. Los
+                píxeles de la antecesora que llegaron al suyo pasan a tener este.
+
+        Returns:
+            np.ndarray | None: Iteraciones aproximadas, o None si no hay ninguna antecesora.
+        """
+        fractal, nivel, tx, ty = clave
+        for subida in range(1, nivel + 1):
+            guardada = self._teselas.get((fractal, nivel - subida, tx >> subida, ty >> subida))
+            if guardada is None:
+                continue
+            antecesora, max_iter_antecesora = guardada
+            pixeles = antecesora.shape[0]
+            factor = 2**subida
+            lado = pixeles // factor
+            if lado == 0:
+                return None  # Demasiado lejos para que sirva de algo
+            # posición de la tesela dentro de la antecesora (la fila 0 es la de abajo)
+            fila = (ty - ((ty >> subida) << subida)) * lado
+            columna = (tx - ((tx >> subida) << subida)) * lado
+            trozo = antecesora[fila : fila + lado, columna : columna + lado]
+            if max_iter is not None and max_iter != max_iter_antecesora:
+                trozo = np.where(
+                    trozo >= max_iter_antecesora,
+                    max_iter,
+                    trozo.astype(np.float32 if trozo.dtype.kind == "f" else np.int32),
+                )
+            return np.repeat(np.repeat(trozo, factor, axis=0), factor, axis=1)
+        return None
+
+    def limpiar(self) -> None:
+        """Vacía la caché."""
+        self._teselas.clear()
+        self._memoria = 0
+
+    @property
+    def memoria(self) -> int:
+        """Devuelve los bytes que ocupan las teselas guardadas."""
+        return self._memoria
+
+    def __len__(self) -> int:
+        """Devuelve el número de teselas guardadas."""
+        return len(self._teselas)
+
+    def __contains__(self, clave) -> bool:
+        """Indica si la tesela está en la caché."""
+        return clave in self._teselas
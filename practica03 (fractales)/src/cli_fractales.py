@@ -0,0 +1,256 @@
+"""
+Archivo: cli_fractales.py
+
+Descripción:
+Este archivo permite calcular los fractales de la aplicación desde la línea de
+comandos y guardarlos en un archivo, sin abrir ninguna ventana. Sirve para
+trabajos por lotes en servidores sin pantalla.
+
+Características principales:
+- Mandelbrot y Julia se calculan con los mismos procesos y núcleos vectorizados
+  que las ventanas (`motor_fractal`) y se colorean con `colores`.
+- IFS, fractales recursivos y L-systems se dibujan con Matplotlib sobre una figura
+  sin pantalla (Agg), con los mismos cálculos que las ventanas.
+- No importa CustomTkinter, Tkinter ni pyplot.
+- La salida es un PNG o, si el archivo termina en .npy, el array de NumPy: las
+  iteraciones en Mandelbrot y Julia y la imagen RGBA en los demás. La fila 0 es
+  la de arriba.
+
+Uso:
+    python cli_fractales.py mandelbrot --ancho 1920 --alto 1080 --salida m.png
+    python cli_fractales.py julia --c -0.7 0.27015 --iteraciones 300 --salida j.npy
+    python cli_fractales.py ifs --ejemplo Fern --salida helecho.png
+    python cli_fractales.py recursivo --ejemplo "Curva de Koch" --nivel 5 --salida k.png
+    python cli_fractales.py lsystem --ejemplo "Arbol Fibo" --iteraciones 5 --salida a.png
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import argparse
+import os
+import sys
+
+import numpy as np  # Para cálculos numéricos avanzados.
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # Dibujo sin pantalla.
+from matplotlib.collections import LineCollection  # Muchos segmentos a la vez.
+from matplotlib.figure import Figure  # Figura sin pyplot.
+
+# Imports locales
+from constantes import Default, Texts  # Constantes y textos predeterminados.
+from motor_fractal import (
+    ALGORITMO_DISTANCIA,
+    ALGORITMO_FUERZA_BRUTA,
+    ALGORITMO_ITERACION_INVERSA,
+    ALGORITMO_MARIANI_SILVER,
+    TIPO_JULIA,
+    TIPO_MANDELBROT,
+    obtener_pool,
+    renderizar,
+)  # Cálculo repartido por teselas.
+from nucleo_fractal import (
+    PRECISION_AUTOMATICA,
+    PRECISION_FLOAT32,
+    PRECISION_FLOAT64,
+)  # Precisiones del cálculo.
+from colores import crear_lut, guardar_png  # Colores de las iteraciones.
+from nucleo_ifs import puntos_ifs  # Puntos de los fractales IFS.
+from dibujo_recursivo import dibujar_recursivo  # Dibujo de los fractales recursivos.
+
+# Carpeta de la práctica de L-systems, que no es un paquete
+CARPETA_LSYSTEMS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "practica04 (L-systems)"
+)
+
+# Color de fondo de las figuras, el mismo que en las ventanas
+FONDO = "#121212"
+
+# Puntos por pulgada de las figuras: el tamaño en píxeles es ancho x alto
+PPP = 100
+
+
+def _guardar_iteraciones(ruta, cuentas, max_iter, mapa, ecualizar):
+    """Guarda las iteraciones (fila 0 abajo, como las calcula el motor) en PNG o NPY."""
+    cuentas = np.flipud(cuentas)
+    if ruta.endswith(".npy"):
+        np.save(ruta, cuentas)
+    else:
+        guardar_png(ruta, cuentas, max_iter, crear_lut(mapa), ecualizar)
+
+
+def _crear_figura(ancho, alto):
+    """Crea una figura sin pantalla de ancho x alto píxeles y sus ejes, sin márgenes."""
+    figura = Figure(figsize=(ancho / PPP, alto / PPP), dpi=PPP, facecolor=FONDO)
+    FigureCanvasAgg(figura)
+    ax = figura.add_axes((0, 0, 1, 1))
+    ax.set_aspect("equal")
+    ax.axis("off")
+    ax.set_facecolor(FONDO)
+    return figura, ax
+
+
+def _guardar_figura(ruta, figura):
+    """Guarda la figura en PNG o, si la ruta termina en .npy, su imagen RGBA."""
+    if ruta.endswith(".npy"):
+        figura.canvas.draw()
+        np.save(ruta, np.asarray(figura.canvas.buffer_rgba()))
+    else:
+        figura.savefig(ruta, dpi=PPP, facecolor=FONDO)
+
+
+def renderizar_escape(argumentos) -> None:
+    """Calcula Mandelbrot o Julia con el motor de teselas y guarda el resultado."""
+    obtener_pool(argumentos.procesos)
+    if argumentos.fractal == "julia":
+        tipo, parametro = TIPO_JULIA, complex(*argumentos.c)
+    else:
+        tipo, parametro = TIPO_MANDELBROT, argumentos.grado
+    print(
+        f"Calculando {argumentos.fractal} de {argumentos.ancho}x{argumentos.alto} "
+        f"con {argumentos.iteraciones} iteraciones..."
+    )
+    with renderizar(
+        tipo, parametro, argumentos.ancho, argumentos.alto, *argumentos.limites,
+        argumentos.iteraciones, algoritmo=argumentos.algoritmo,
+        suave=not argumentos.enteras, precision=argumentos.precision,
+    ) as imagen:
+        _guardar_iteraciones(
+            argumentos.salida, imagen.img, argumentos.iteraciones, argumentos.mapa,
+            argumentos.ecualizar,
+        )
+
+
+def renderizar_ifs(argumentos) -> None:
+    """Calcula un fractal IFS predefinido y guarda su dibujo."""
+    lista_funciones = Texts.IFS_PREDEFINIDOS[argumentos.ejemplo]
+    puntos_x, puntos_y, funciones = puntos_ifs(
+        lista_funciones, argumentos.iteraciones, argumentos.umbral,
+        argumentos.determinante, semilla=argumentos.semilla,
+    )
+    figura, ax = _crear_figura(argumentos.ancho, argumentos.alto)
+    colores = np.array([color for _, _, color in lista_funciones])
+    ax.scatter(puntos_x, puntos_y, s=0.1, c=colores[funciones], linewidths=0)
+    _guardar_figura(argumentos.salida, figura)
+
+
+def renderizar_recursivo(argumentos) -> None:
+    """Dibuja un fractal recursivo y lo guarda."""
+    figura, ax = _crear_figura(argumentos.ancho, argumentos.alto)
+    dibujar_recursivo(ax, argumentos.ejemplo, argumentos.nivel, argumentos.color)
+    ax.autoscale_view()
+    _guardar_figura(argumentos.salida, figura)
+
+
+def renderizar_lsystem(argumentos) -> None:
+    """Calcula los segmentos de un L-system de ejemplo y los guarda dibujados."""
+    sys.path.insert(0, CARPETA_LSYSTEMS)
+    from lsystem import LSystem  # Práctica 4, sin abrir la tortuga.
+    from ejemplos import Ejemplos  # Ejemplos de la práctica 4.
+
+    ejemplo = Ejemplos.EJEMPLOS_LSYSTEM[argumentos.ejemplo]
+    lsystem = LSystem(
+        ejemplo["axioma"],
+        ejemplo["reglas"],
+        angle=ejemplo["angulo"],
+        iterations=argumentos.iteraciones,
+        start_point=ejemplo["punto_inicial"],
+        rotation_offset=ejemplo["rotacion"],
+        color_map=ejemplo["colormap"],
+    )
+    segmentos = lsystem.segments()
+    figura, ax = _crear_figura(argumentos.ancho, argumentos.alto)
+    ax.add_collection(
+        LineCollection(
+            [(inicio, fin) for inicio, fin, _ in segmentos],
+            colors=[color for _, _, color in segmentos],
+            linewidths=argumentos.grosor,
+        )
+    )
+    ax.autoscale_view()
+    _guardar_figura(argumentos.salida, figura)
+
+
+def _crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de la línea de comandos, con un subcomando por fractal."""
+    parser = argparse.ArgumentParser(
+        description="Calcula fractales sin interfaz gráfica y los guarda en PNG o NPY."
+    )
+    subparsers = parser.add_subparsers(dest="fractal", required=True)
+
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("--ancho", type=int, default=1000, help="Ancho en píxeles.")
+    comunes.add_argument("--alto", type=int, default=1000, help="Alto en píxeles.")
+    comunes.add_argument("--salida", required=True, help="Archivo .png o .npy.")
+
+    escape = argparse.ArgumentParser(add_help=False, parents=[comunes])
+    escape.add_argument("--iteraciones", type=int, default=100,
+                        help="Número máximo de iteraciones.")
+    escape.add_argument("--mapa", default=Texts.MANDELBROT_COLORES_DEFAULT,
+                        help="Mapa de colores de Matplotlib.")
+    escape.add_argument("--procesos", type=int, default=Default.FRACTAL_PROCESOS,
+                        help="Procesos de cálculo (por defecto, uno por núcleo).")
+    escape.add_argument("--precision", default=Default.FRACTAL_PRECISION,
+                        choices=[PRECISION_AUTOMATICA, PRECISION_FLOAT32, PRECISION_FLOAT64])
+    escape.add_argument("--enteras", action="store_true",
+                        help="Iteraciones enteras en lugar de continuas.")
+    escape.add_argument("--ecualizar", action="store_true",
+                        help="Ecualizar el histograma de colores.")
+
+    mandelbrot = subparsers.add_parser("mandelbrot", parents=[escape])
+    mandelbrot.add_argument("--limites", type=float, nargs=4, default=(-2.0, 1.0, -1.5, 1.5),
+                            metavar=("XMIN", "XMAX", "YMIN", "YMAX"))
+    mandelbrot.add_argument("--grado", type=float, default=2, help="Exponente de z.")
+    mandelbrot.add_argument("--algoritmo", default=ALGORITMO_FUERZA_BRUTA,
+                            choices=[ALGORITMO_FUERZA_BRUTA, ALGORITMO_MARIANI_SILVER])
+
+    julia = subparsers.add_parser("julia", parents=[escape])
+    julia.add_argument("--limites", type=float, nargs=4, default=(-1.5, 1.5, -1.5, 1.5),
+                       metavar=("XMIN", "XMAX", "YMIN", "YMAX"))
+    julia.add_argument("--c", type=float, nargs=2, default=(-0.7, 0.27015),
+                       metavar=("REAL", "IMAGINARIO"), help="Parámetro c.")
+    julia.add_argument("--algoritmo", default=ALGORITMO_FUERZA_BRUTA, choices=[
+        ALGORITMO_FUERZA_BRUTA, ALGORITMO_MARIANI_SILVER, ALGORITMO_ITERACION_INVERSA,
+        ALGORITMO_DISTANCIA,
+    ])
+
+    ifs = subparsers.add_parser("ifs", parents=[comunes])
+    ifs.add_argument("--ejemplo", default=Texts.IFS_ALGORITMOS[0],
+                     choices=list(Texts.IFS_PREDEFINIDOS))
+    ifs.add_argument("--iteraciones", type=int, default=100000, help="Número de puntos.")
+    ifs.add_argument("--umbral", type=int, default=50,
+                     help="Iteraciones de cada cadena que no se dibujan.")
+    ifs.add_argument("--determinante", action="store_true",
+                     help="Probabilidades proporcionales al determinante de cada función.")
+    ifs.add_argument("--semilla", type=int, default=None, help="Semilla aleatoria.")
+
+    recursivo = subparsers.add_parser("recursivo", parents=[comunes])
+    recursivo.add_argument("--ejemplo", default=Texts.RECURSIVO_ALGORITMOS_DEFAULT,
+                           choices=Texts.RECURSIVO_ALGORITMOS)
+    recursivo.add_argument("--nivel", type=int, default=Texts.RECURSIVO_NIVEL_DEFAULT)
+    recursivo.add_argument("--color", default=Texts.RECURSIVO_COLOR_DEFAULT)
+
+    lsystem = subparsers.add_parser("lsystem", parents=[comunes])
+    lsystem.add_argument("--ejemplo", default="Arbol Fibo",
+                         help="Nombre de uno de los ejemplos de la práctica 4.")
+    lsystem.add_argument("--iteraciones", type=int, default=5)
+    lsystem.add_argument("--grosor", type=float, default=1.0, help="Grosor de las líneas.")
+    return parser
+
+
+def main() -> None:
+    """Calcula el fractal indicado en la línea de comandos y lo guarda."""
+    argumentos = _crear_parser().parse_args()
+    if argumentos.fractal in ("mandelbrot", "julia"):
+        renderizar_escape(argumentos)
+    elif argumentos.fractal == "ifs":
+        renderizar_ifs(argumentos)
+    elif argumentos.fractal == "recursivo":
+        renderizar_recursivo(argumentos)
+    else:
+        renderizar_lsystem(argumentos)
+    print(f"Guardado en {argumentos.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,19 @@ class Texts:
     JULIA_ALGORITMOS = ["Ninguno", "Algoritmo1", "Algoritmo2", "Algoritmo3"]
     JULIA_ALGORITMOS_DEFAULT = JULIA_ALGORITMOS[0]
 
+    JULIA_MODO = "Algoritmo:"
+    JULIA_MODOS = [
+        "Tiempo de escape",
+        "Mariani-Silver",
+        "Iteración inversa",
+        "Estimación de distancia",
+    ]
+    JULIA_MODOS_DEFAULT = JULIA_MODOS[0]
+    JULIA_AVISO_MIIM = (
+        "Aviso: esta zona apenas crece al iterarla y la iteración inversa llega a "
+        "pocos píxeles; la estimación de distancia la dibuja mejor."
+    )
+
     JULIA_COLOR = "Elegir color:"
     JULIA_COLORES = [
         "inferno",
@@ -444,6 +457,7 @@ class UserEvents:
 
     MOUSE_WHEEL = "<MouseWheel>"  # Movimiento de la rueda del ratón
     MOUSE_WHEEL_DRAG = "<B2-Motion>"  # Arrastre con rueda del ratón
+    MOUSE_WHEEL_PRESS = "<ButtonPress-2>"  # Pulsar la rueda del ratón
 
     MOUSE_MOVE = "<Motion>"
 
@@ -464,6 +478,41 @@ class Default:
     FONT_FAMILY = "Segoe UI"  # Fuente
     FONT_SIZE = 12  # Tamaño de fuente
 
+    # Cálculo de los fractales de tiempo de escape
+    FRACTAL_TESELA = 256  # Lado en píxeles de las teselas que calcula cada proceso
+    FRACTAL_PROCESOS = None  # Procesos de cálculo (None: uno por núcleo)
+    FRACTAL_ALGORITMO = "fuerza_bruta"  # "fuerza_bruta" o "mariani_silver"
+    FRACTAL_CARDIOIDE = True  # No iterar el cardioide ni el círculo de periodo 2
+    FRACTAL_PERIODICIDAD = True  # Dejar de iterar las órbitas periódicas
+    FRACTAL_PASOS = (4, 2, 1)  # Pasadas progresivas: 1/16, 1/4 y todos los píxeles
+    FRACTAL_SONDEO_MS = 15  # Cada cuánto se mira si ha terminado una pasada
+    FRACTAL_CACHE_MEMORIA = 256 * 1024 * 1024  # Bytes máximos de teselas guardadas
+    FRACTAL_ESPERA_VISTA_MS = 150  # Espera tras el último zoom o arrastre antes de recalcular
+    FRACTAL_PIXEL_PROFUNDO = 1e-13  # Tamaño de píxel por debajo del cual se usa perturbación
+    FRACTAL_SUAVE = True  # Iteraciones continuas, para colorear sin bandas
+    FRACTAL_ECUALIZAR = False  # Ecualizar el histograma de colores
+    FRACTAL_LUT = 4096  # Colores de la tabla con la que se colorea (256 o 4096)
+    FRACTAL_PRECISION = "auto"  # "float32", "float64" o "auto" (según el tamaño de píxel)
+    FRACTAL_PIXEL_FLOAT32 = 1e-4  # Tamaño de píxel a partir del cual "auto" usa float32
+    FRACTAL_ITER_ADAPTATIVAS = True  # Ajustar las iteraciones al zoom y a la primera pasada
+    FRACTAL_ITER_POR_OCTAVA = 0.25  # Aumento relativo de las iteraciones al duplicar el zoom
+    FRACTAL_ITER_TARDIOS = 0.02  # Fracción de píxeles que escapan tarde con la que se duplican
+    FRACTAL_ITER_DECIDIDOS = 0.25  # Fracción de píxeles sin decidir que debe decidir cada duplicación
+    FRACTAL_ITER_MAXIMO = 50_000  # Máximo de iteraciones al que se puede llegar al duplicarlas
+    JULIA_MODOS_ALGORITMO = (  # Algoritmo de `motor_fractal` de cada uno de Texts.JULIA_MODOS
+        "fuerza_bruta",
+        "mariani_silver",
+        "iteracion_inversa",
+        "distancia",
+    )
+    JULIA_MIIM_VISITAS = 8  # Veces que la iteración inversa puede pasar por una celda
+    JULIA_MIIM_PUNTOS = 4_000_000  # Puntos máximos de la iteración inversa por vista
+    JULIA_GROSOR_DISTANCIA = 0.5  # Distancia, en píxeles, a la que se pinta la frontera
+    ATLAS_LADO = 64  # Lado en píxeles de las miniaturas del atlas de Julia
+    ATLAS_LIMITES = (-2.0, 2.0, -2.0, 2.0)  # Zona del plano de cada miniatura
+    ATLAS_ITERACIONES = 200  # Iteraciones máximas de las miniaturas
+    IFS_CADENAS = 1024  # Puntos que el juego del caos mueve a la vez
+
 
 class Fractales:
     # ventana
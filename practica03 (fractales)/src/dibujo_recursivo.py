@@ -0,0 +1,254 @@
+"""
+Archivo: dibujo_recursivo.py
+
+Descripción:
+Este archivo contiene el dibujo de los fractales recursivos (triángulo y alfombra de
+Sierpinsky, curvas de Koch y de Hilbert y árbol) sobre unos ejes de Matplotlib,
+separado de las ventanas para poder usarlo sin interfaz gráfica.
+
+Características principales:
+- Cada fractal se dibuja con una función recursiva que recibe los ejes, el nivel de
+  recursión y el color.
+- No importa CustomTkinter ni pyplot: sirve tanto para la ventana como para
+  guardar imágenes desde la línea de comandos.
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import numpy as np  # Para cálculos numéricos avanzados.
+from matplotlib.patches import Polygon  # Polígonos rellenos.
+
+# Imports locales
+from constantes import Texts  # Nombres de los algoritmos.
+
+
+def dibujar_recursivo(ax, algoritmo: str, nivel: int, color: str) -> None:
+    """
+    Dibuja un fractal recursivo en unos ejes de Matplotlib.
+
+    Args:
+        ax (matplotlib.axes.Axes): Ejes en los que se dibuja.
+        algoritmo (str): Uno de Texts.RECURSIVO_ALGORITMOS.
+        nivel (int): Nivel de recursión.
+        color (str): Color del fractal.
+    """
+    if algoritmo == Texts.RECURSIVO_ALGORITMOS[0]:
+        print("Generando Triángulo de Sierpinsky...")
+        # Parámetros para el triángulo inicial (triángulo equilátero)
+        punto_a = np.array([0, 0])
+        punto_b = np.array([1, 0])
+        punto_c = np.array([0.5, np.sqrt(3) / 2])
+        dibujar_triangulo_sierpinsky(ax, punto_a, punto_b, punto_c, nivel, color)
+    elif algoritmo == Texts.RECURSIVO_ALGORITMOS[1]:
+        print("Generando Alfombra de Sierpinsky...")
+        # El cuadrado principal empieza en el origen y mide 1
+        dibujar_alfombra_sierpinsky(ax, np.array([0, 0]), 1, nivel, color)
+    elif algoritmo == Texts.RECURSIVO_ALGORITMOS[2]:
+        print("Generando Curva de Koch...")
+        dibujar_curva_koch(ax, np.array([0, 0]), np.array([1, 0]), nivel, color)
+    elif algoritmo == Texts.RECURSIVO_ALGORITMOS[3]:
+        print("Generando Curva de Hilbert...")
+        # Centro del canvas normalizado a 0-1 y tamaño total de la curva
+        dibujar_curva_hilbert(ax, 0.5, 0.5, 1, nivel, 0, color)
+    elif algoritmo == Texts.RECURSIVO_ALGORITMOS[4]:
+        print("Generando árbol recursivo...")
+        # Punto base, longitud de la primera rama y ángulo inicial (vertical)
+        dibujar_arbol(ax, np.array([0, 0]), 10.0, np.pi / 2, nivel, color)
+    else:
+        print("Algoritmo no reconocido.")
+
+
+def dibujar_triangulo_sierpinsky(ax, punto_a, punto_b, punto_c, nivel, color):
+    """
+    Función recursiva que dibuja el Triángulo de Sierpinsky.
+
+    Args:
+        ax (matplotlib.axes.Axes): El objeto del eje donde se dibuja.
+        punto_a, punto_b, punto_c (np.array): Los tres puntos del triángulo.
+        nivel (int): Nivel de recursión.
+        color (str): Color del fractal.
+    """
+    if nivel == 0:
+        # Dibujar el triángulo base cuando se alcanza el nivel 0
+        triangle = Polygon([punto_a, punto_b, punto_c], closed=True, color=color)
+        ax.add_patch(triangle)
+    else:
+        # Calcular los puntos medios de los lados del triángulo
+        punto_ab = (punto_a + punto_b) / 2
+        punto_bc = (punto_b + punto_c) / 2
+        punto_ca = (punto_c + punto_a) / 2
+
+        # Llamar recursivamente para los tres sub-triángulos
+        dibujar_triangulo_sierpinsky(ax, punto_a, punto_ab, punto_ca, nivel - 1, color)
+        dibujar_triangulo_sierpinsky(ax, punto_ab, punto_b, punto_bc, nivel - 1, color)
+        dibujar_triangulo_sierpinsky(ax, punto_ca, punto_bc, punto_c, nivel - 1, color)
+
+
+def dibujar_alfombra_sierpinsky(ax, punto_inicial, tamaño, nivel, color):
+    """
+    Función recursiva que dibuja la Alfombra de Sierpinsky.
+
+    Args:
+        ax (matplotlib.axes.Axes): El objeto del eje donde se dibuja.
+        punto_inicial (np.array): El punto (x, y) donde empieza el cuadrado.
+        tamaño (float): El tamaño del cuadrado.
+        nivel (int): Nivel de recursión.
+        color (str): Color del fractal.
+    """
+    if nivel == 0:
+        # Dibujar un cuadrado cuando se alcanza el nivel 0
+        square = Polygon(
+            [
+                punto_inicial,
+                punto_inicial + np.array([tamaño, 0]),
+                punto_inicial + np.array([tamaño, tamaño]),
+                punto_inicial + np.array([0, tamaño]),
+            ],
+            closed=True,
+            color=color,
+        )
+        ax.add_patch(square)
+    else:
+        # Dividir el cuadrado en una malla 3x3
+        nuevo_tamaño = tamaño / 3
+        for i in range(3):
+            for j in range(3):
+                if i == 1 and j == 1:  # Eliminar el cuadrado central
+                    continue
+                # Calcular la posición del nuevo cuadrado
+                nuevo_punto = punto_inicial + np.array([i * nuevo_tamaño, j * nuevo_tamaño])
+                # Llamar recursivamente para los sub-cuadrados
+                dibujar_alfombra_sierpinsky(ax, nuevo_punto, nuevo_tamaño, nivel - 1, color)
+
+
+def dibujar_curva_koch(ax, punto_a, punto_b, nivel, color):
+    """
+    Función recursiva que dibuja la Curva de Koch.
+
+    Args:
+        ax (matplotlib.axes.Axes): El objeto del eje donde se dibuja.
+        punto_a, punto_b (np.array): Los dos puntos iniciales de la curva.
+        nivel (int): Nivel de recursión.
+        color (str): Color del fractal.
+    """
+    if nivel == 0:
+        # Dibujar una línea entre los puntos cuando se alcanza el nivel 0
+        ax.plot([punto_a[0], punto_b[0]], [punto_a[1], punto_b[1]], color=color, lw=2)
+    else:
+        # Calcular los puntos que forman la curva de Koch
+        punto_c = (2 * punto_a + punto_b) / 3  # Primer punto
+        punto_d = (punto_a + 2 * punto_b) / 3  # Segundo punto
+
+        # Calcular el punto pico
+        punto_medio = (punto_a + punto_b) / 2
+        altura = (
+            np.sqrt(3) / 6 * np.linalg.norm(punto_b - punto_a)
+        )  # Altura del triángulo equilátero
+        vector = punto_b - punto_a
+        rotacion = np.array([[0, -1], [1, 0]])  # Rotación 60 grados en sentido antihorario
+        punto_pico = punto_medio + np.dot(rotacion, vector) * (altura / np.linalg.norm(vector))
+
+        # Llamada recursiva para los cuatro segmentos
+        dibujar_curva_koch(ax, punto_a, punto_c, nivel - 1, color)
+        dibujar_curva_koch(ax, punto_c, punto_pico, nivel - 1, color)
+        dibujar_curva_koch(ax, punto_pico, punto_d, nivel - 1, color)
+        dibujar_curva_koch(ax, punto_d, punto_b, nivel - 1, color)
+
+
+def dibujar_curva_hilbert(ax, cx, cy, size, nivel, angulo, color):
+    """
+    Dibuja la curva de Hilbert recursivamente.
+
+    Args:
+        ax (matplotlib.axes.Axes): El eje donde se dibuja.
+        cx, cy (float): Coordenadas del centro actual de la curva.
+        size (float): Tamaño del lado actual de la curva.
+        nivel (int): Nivel de recursión.
+        angulo (int): Rotación actual en grados (0, 90, -90).
+        color (str): Color del fractal.
+    """
+    if nivel == 0:
+        return
+
+    # Coordenadas del tamaño reducido
+    mitad = size / 2
+    cuarto = size / 4
+
+    # Definir los puntos de cada sección (sin rotar aún)
+    puntos = [
+        (cuarto, -cuarto),  # Arriba derecha
+        (cuarto, cuarto),  # Abajo derecha
+        (-cuarto, cuarto),  # Abajo izquierda
+        (-cuarto, -cuarto),  # Arriba izquierda
+    ]
+
+    # Llamadas recursivas para subdivisiones
+    # Aplicamos rotación a las líneas de conexión, no a las posiciones
+    dibujar_curva_hilbert(ax, cx + puntos[0][0], cy + puntos[0][1], mitad, nivel - 1, 0, color)
+    dibujar_curva_hilbert(ax, cx + puntos[1][0], cy + puntos[1][1], mitad, nivel - 1, 0, color)
+    dibujar_curva_hilbert(ax, cx + puntos[2][0], cy + puntos[2][1], mitad, nivel - 1, 90, color)
+    dibujar_curva_hilbert(ax, cx + puntos[3][0], cy + puntos[3][1], mitad, nivel - 1, -90, color)
+
+    # Dibujar las líneas conectando los puntos, pero solo después de la recursión
+    # Aquí calculamos las líneas entre los puntos, pero sin rotarlos
+    for i in range(len(puntos) - 1):
+        x0, y0 = cx + puntos[i][0], cy + puntos[i][1]
+        x1, y1 = cx + puntos[i + 1][0], cy + puntos[i + 1][1]
+        ax.plot([x0, x1], [y0, y1], color=color, lw=2)
+
+    # Comentar o descomentar si se quieren cuadraditos
+    # x0, y0 = cx + puntos[-1][0], cy + puntos[-1][1]
+    # x1, y1 = cx + puntos[0][0], cy + puntos[0][1]
+    # ax.plot([x0, x1], [y0, y1], color=color, lw=2)
+
+
+def rotar_punto(x, y, angulo):
+    """
+    Rota un punto en 2D alrededor del origen por un ángulo dado.
+
+    Args:
+        x, y (float): Coordenadas iniciales del punto.
+        angulo (float): Ángulo de rotación en grados.
+
+    Returns:
+        tuple: Coordenadas del punto rotado.
+    """
+    rad = np.radians(angulo)
+    x_rot = x * np.cos(rad) - y * np.sin(rad)
+    y_rot = x * np.sin(rad) + y * np.cos(rad)
+    return x_rot, y_rot
+
+
+def dibujar_arbol(ax, punto_a, longitud, angulo, nivel, color):
+    """
+    Función recursiva que dibuja el árbol recursivo en el eje de Matplotlib.
+
+    Args:
+        ax (matplotlib.axes.Axes): El objeto del eje donde se dibuja.
+        punto_a (np.array): El punto inicial de la rama.
+        longitud (float): La longitud de la rama.
+        angulo (float): El ángulo de inclinación de la rama.
+        nivel (int): Nivel de recursión.
+        color (str): Color del fractal.
+    """
+    if nivel == 0:
+        return  # Si hemos llegado al nivel base, terminamos la recursión
+
+    # Calcular el punto final de la rama
+    punto_b = punto_a + longitud * np.array([np.cos(angulo), np.sin(angulo)])
+
+    # Dibujar la rama (línea entre punto_a y punto_b)
+    ax.plot([punto_a[0], punto_b[0]], [punto_a[1], punto_b[1]], color=color, lw=2)
+
+    # Calcular la nueva longitud de las ramas hijas
+    nueva_longitud = longitud * 0.7  # Reducir la longitud de las ramas
+
+    # Ángulos para las ramas hijas (inclinación hacia la izquierda y derecha)
+    angulo_izquierda = angulo + np.pi / 6  # Ángulo para la rama izquierda
+    angulo_derecha = angulo - np.pi / 6  # Ángulo para la rama derecha
+
+    # Llamadas recursivas para las ramas hijas
+    dibujar_arbol(ax, punto_b, nueva_longitud, angulo_izquierda, nivel - 1, color)
+    dibujar_arbol(ax, punto_b, nueva_longitud, angulo_derecha, nivel - 1, color)
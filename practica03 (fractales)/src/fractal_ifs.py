@@ -10,6 +10,7 @@ Características principales:
 - Configuración personalizada mediante una lista de funciones y opciones adicionales.
 - Uso de CustomTkinter para una interfaz gráfica moderna.
 - Integración con Matplotlib para futuras visualizaciones del fractal.
+- Los puntos se calculan en `nucleo_ifs`, que no depende de la ventana.
 
 Autor: Gabriel Gómez García
 Fecha: 27 de Noviembre de 2024
@@ -30,8 +31,7 @@ import customtkinter as ctk  # Biblioteca para interfaces gráficas modernas.
 # Imports locales
 from ventana_fractal import VentanaFractal  # Clase base para ventanas.
 from constantes import Default, Texts  # Constantes y textos predeterminados.
-
-import random
+from nucleo_ifs import puntos_ifs  # Puntos del fractal con el juego del caos.
 
 class FractalIFS(VentanaFractal):
     """
@@ -83,112 +83,24 @@ class FractalIFS(VentanaFractal):
             print("Error: No se ha definido ninguna función en lista_funciones.")
             return
 
-        # Inicializar el punto inicial
-        x, y = 0, 0  # El punto inicial
-
-        # Crear una estructura para almacenar los puntos y colores por función
-        puntos_por_funcion = {i: [] for i in range(len(self.lista_funciones))}
-
-        for i in range(self.iterations):
-            funcion_seleccionada = self._seleccionar_funcion()
-            valores, prob, color = funcion_seleccionada
-            a, b, c, d, e, f = (
-                float(valores["a"]),
-                float(valores["b"]),
-                float(valores["c"]),
-                float(valores["d"]),
-                float(valores["e"]),
-                float(valores["f"]),
-            )
-
-            # Calcular el nuevo punto transformado
-            x_nuevo = a * x + c * y + e
-            y_nuevo = b * x + d * y + f
-
-            # Solo almacenar puntos después de superar el umbral
-            if i >= self.threshold:
-                # Identificar el índice de la función seleccionada
-                index_funcion = self.lista_funciones.index(funcion_seleccionada)
-                puntos_por_funcion[index_funcion].append((x_nuevo, y_nuevo))
-
-            # Actualizar el punto para la siguiente iteración
-            x, y = x_nuevo, y_nuevo
+        # Calcular los puntos con el juego del caos
+        puntos_x, puntos_y, funciones = puntos_ifs(
+            self.lista_funciones,
+            self.iterations,
+            self.threshold,
+            self.checkbox_default_pro,
+        )
 
         # Dibujar los puntos agrupados por función
-        for i, puntos in puntos_por_funcion.items():
-            if puntos:  # Asegurarse de que haya puntos para la función
-                color = self.lista_funciones[i][2]  # Obtener el color asociado a la función
-                puntos_x = [p[0] for p in puntos]
-                puntos_y = [p[1] for p in puntos]
-                self.ax.scatter(puntos_x, puntos_y, s=0.1, c=color)  # Dibujar los puntos
+        for i, (_, _, color) in enumerate(self.lista_funciones):
+            de_la_funcion = funciones == i
+            if de_la_funcion.any():  # Asegurarse de que haya puntos para la función
+                self.ax.scatter(
+                    puntos_x[de_la_funcion], puntos_y[de_la_funcion], s=0.1, c=color
+                )  # Dibujar los puntos
 
         self.canvas.draw()
 
-    # Chaos game
-    ###################################################################################
-
-    def _seleccionar_funcion(self):
-        """
-        Selecciona una función de lista_funciones basada en un algoritmo tipo Chaos Game.
-
-        Returns:
-            tuple: Función seleccionada, Matriz de transformación, vector de traslación y color asociado.
-        """
-
-        # Probabilidades uniformes si se activa la opción avanzada
-        if self.checkbox_default_pro:
-            # Probabilidad uniforme si está activa la opción avanzada
-            probabilidades = self._chaos_game()
-            # print("Probabilidades uniformes:", probabilidades)
-        else:
-            # Usar probabilidades definidas en lista_funciones
-            probabilidades = [float(prob) for _, prob, _ in self.lista_funciones]
-            # print("Probabilidades definidas:", probabilidades)
-
-        # Crear probabilidades acumulativas
-        probabilidades_acumuladas = self._calcular_probabilidades_acumuladas(
-            probabilidades
-        )
-        # print(probabilidades_acumuladas)
-
-        # Elegir un número aleatorio entre 0 y 1
-        num_aleatorio = random.random()
-        # print(f"Valor aleatorio: {num_aleatorio}")
-
-        # Seleccionar la función en función del número aleatorio
-        for i, prob_acumulada in enumerate(probabilidades_acumuladas):
-            if num_aleatorio < prob_acumulada:
-                # Retornar la función y su información asociada
-                return self.lista_funciones[i]
-
-    def _calcular_probabilidades_acumuladas(self, probabilidades):
-        """
-        Calcula las probabilidades acumulativas a partir de las probabilidades individuales.
-
-        Args:
-            probabilidades (list): Lista de probabilidades.
-
-        Returns:
-            list: Lista de probabilidades acumuladas.
-        """
-        acumuladas = []
-        acumulado = 0.0
-        for prob in probabilidades:
-            acumulado += prob
-            acumuladas.append(acumulado)
-        return acumuladas
-
-    def _chaos_game(self):
-        """"""
-        
-        determinantes = [abs(float(valores["a"]) * float(valores["d"]) - float(valores["b"]) * float(valores["c"])) for valores, _, _ in self.lista_funciones]
-        total_prob = sum(determinantes)
-        
-        probabilidades = []
-        for det in determinantes:
-            probabilidades.append(det / total_prob)
-        return probabilidades
-    
 ###################################################################################
 
 if __name__ == "__main__":
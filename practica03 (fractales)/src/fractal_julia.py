@@ -16,56 +16,31 @@ Fecha: 27 de Noviembre de 2024
 
 # Imports estándar
 import numpy as np  # Para cálculos numéricos avanzados.
-import matplotlib.pyplot as plt  # Para gráficos y visualizaciones.
 
 # Imports locales
-from ventana_fractal import VentanaFractal  # Clase base para ventanas.
+from ventana_escape import VentanaEscape  # Clase base para ventanas.
 from constantes import Default, Texts, Fractales  # Constantes y textos predeterminados.
-from concurrent.futures import ProcessPoolExecutor
+from nucleo_fractal import ejes, julia  # Cálculo vectorizado del fractal.
+from motor_fractal import TIPO_JULIA, renderizar  # Cálculo repartido por teselas.
 
 
 def calcular_fila_julia(row, width, height, x_min, x_max, y_min, y_max, max_iter, c):
-    x, y = np.linspace(x_min, x_max, width), np.linspace(y_min, y_max, height)
-    Z = x + 1j * y[row]
-    img_row = np.zeros(width)
-    for col in range(width):
-        z = Z[col]
-        iterations = 0
-        while abs(z) <= 2 and iterations < max_iter:
-            z = z * z + c
-            iterations += 1
-        img_row[col] = iterations
-    return img_row
+    x, y = ejes(x_min, x_max, y_min, y_max, width, height)
+    return julia(x, y[row : row + 1], c, max_iter)[0]
 
 
 def generar_fractal_julia(width, height, x_min, x_max, y_min, y_max, max_iter, c):
-    img = np.zeros((height, width))
-    with ProcessPoolExecutor() as executor:
-        futures = [
-            executor.submit(
-                calcular_fila_julia,
-                row,
-                width,
-                height,
-                x_min,
-                x_max,
-                y_min,
-                y_max,
-                max_iter,
-                c,
-            )
-            for row in range(height)
-        ]
-        for row, future in enumerate(futures):
-            img[row, :] = future.result()
-    return img
-
-
-class FractalJulia(VentanaFractal):
+    with renderizar(
+        TIPO_JULIA, c, width, height, x_min, x_max, y_min, y_max, max_iter
+    ) as imagen:
+        return imagen.img.copy()
+
+
+class FractalJulia(VentanaEscape):
     """
     Clase que representa una ventana interactiva para la visualización de fractales de Julia.
 
-    Esta clase hereda de `VentanaFractal` y permite la configuración de parámetros esenciales
+    Esta clase hereda de `VentanaEscape` y permite la configuración de parámetros esenciales
     para la generación del fractal, incluyendo el plano complejo, los colores y el conjunto
     específico de Julia.
     """
@@ -82,6 +57,7 @@ class FractalJulia(VentanaFractal):
         julia_ymin: float = -1.5,
         julia_ymax: float = 1.5,
         julia_color_seleccionado: str = Texts.JULIA_COLORES_DEFAULT,
+        algoritmo: str = Default.FRACTAL_ALGORITMO,
     ) -> None:
         """
         Inicializa una nueva instancia de la clase `FractalJulia`.
@@ -97,8 +73,10 @@ class FractalJulia(VentanaFractal):
             julia_ymin (float): Límite mínimo del eje Y en el plano complejo.
             julia_ymax (float): Límite máximo del eje Y en el plano complejo.
             julia_color_seleccionado (str): Color seleccionado para el fractal.
+            algoritmo (str): Algoritmo de cálculo: "fuerza_bruta", "mariani_silver",
+                "iteracion_inversa" (MIIM) o "distancia" (estimación de distancia).
         """
-        super().__init__(width, height, title)
+        super().__init__(width, height, title, algoritmo)
         self.julia_real = julia_real
         self.julia_imaginario = julia_imaginario
         self.julia_xmin = julia_xmin
@@ -107,43 +85,27 @@ class FractalJulia(VentanaFractal):
         self.julia_ymax = julia_ymax
         self.julia_color_seleccionado = julia_color_seleccionado
 
-        self.max_iter = 300  # Número máximo de iteraciones para el cálculo
+        self.max_iter = 300  # Iteraciones de la vista inicial; crecen con el zoom
 
     def _generar_fractal(self) -> None:
         """
         Genera el fractal del conjunto de Julia y lo muestra en el canvas.
         """
-        # Definir el número complejo c para el fractal de Julia
-        c = complex(self.julia_real, self.julia_imaginario)
-
         # Inicializar el área de visualización del fractal
         self.x_min, self.x_max = self.julia_xmin, self.julia_xmax
         self.y_min, self.y_max = self.julia_ymin, self.julia_ymax
 
-        # Llamar a la función que dibuja el fractal en el canvas
-        self._dibujar_julia(c)
-
         # Depuración: Mostrar el color seleccionado en la consola
         print("Color seleccionado:", self.julia_color_seleccionado)
-        # Actualizar el canvas con el nuevo fractal
-        self.canvas.draw()
-
-    ###################################################################################
-
-    def _dibujar_julia(self, c):
-        width, height = 2000, 2000
-        img = generar_fractal_julia(
-            width,
-            height,
-            self.x_min,
-            self.x_max,
-            self.y_min,
-            self.y_max,
-            self.max_iter,
-            c,
-        )
-        plt.imshow(
-            img,
-            cmap=self.julia_color_seleccionado,
-            extent=(self.x_min, self.x_max, self.y_min, self.y_max),
-        )
+        # Calcular el fractal y mostrarlo de forma progresiva
+        self._renderizar_vista()
+
+    def _tipo_fractal(self) -> str:
+        return TIPO_JULIA
+
+    def _parametro_fractal(self) -> complex:
+        # Número complejo c del fractal de Julia
+        return complex(self.julia_real, self.julia_imaginario)
+
+    def _mapa_colores(self) -> str:
+        return self.julia_color_seleccionado
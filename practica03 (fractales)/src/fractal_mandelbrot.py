@@ -15,63 +15,60 @@ Fecha: 27 de Noviembre de 2024
 """
 
 # Imports estándar
+import math
+
 import numpy as np  # Para cálculos numéricos avanzados.
-import matplotlib.pyplot as plt  # Para gráficos y visualizaciones.
 
 # Imports locales
-from ventana_fractal import VentanaFractal  # Clase base para ventanas.
+from ventana_escape import VentanaEscape  # Clase base para ventanas.
 from constantes import Default, Texts  # Constantes y textos predeterminados.
-from concurrent.futures import ProcessPoolExecutor
+from nucleo_fractal import ejes, mandelbrot  # Cálculo vectorizado del fractal.
+from motor_fractal import (
+    TIPO_MANDELBROT,
+    TIPO_MANDELBROT_PROFUNDO,
+    renderizar,
+)  # Cálculo repartido por teselas.
+from perturbacion import OrbitaReferencia  # Órbita de referencia para zoom profundo.
 
 
 def calcular_fila_mandelbrot(
     row, width, height, x_min, x_max, y_min, y_max, max_iter, complejidad
 ):
-    x, y = np.linspace(x_min, x_max, width), np.linspace(y_min, y_max, height)
-    C = x + 1j * y[row]
-    Z = np.zeros_like(C)
-    img_row = np.zeros(width)
-    for col in range(width):
-        z = 0
-        c = C[col]
-        iterations = 0
-        while abs(z) <= 2 and iterations < max_iter:
-            z = (z**complejidad) + c
-            iterations += 1
-        img_row[col] = iterations
-    # processor_id = os.getpid()
-    # print(f"Procesador {processor_id} está procesando la fila {row}")
-    return img_row
+    x, y = ejes(x_min, x_max, y_min, y_max, width, height)
+    return mandelbrot(x, y[row : row + 1], max_iter, complejidad)[0]
 
 
 def generar_fractal(width, height, x_min, x_max, y_min, y_max, max_iter, complejidad):
-    img = np.zeros((height, width))
-    with ProcessPoolExecutor() as executor:
-        futures = [
-            executor.submit(
-                calcular_fila_mandelbrot,
-                row,
-                width,
-                height,
-                x_min,
-                x_max,
-                y_min,
-                y_max,
-                max_iter,
-                complejidad,
-            )
-            for row in range(height)
-        ]
-        for row, future in enumerate(futures):
-            img[row, :] = future.result()
-    return img
-
-
-class FractalMandelbrot(VentanaFractal):
+    with renderizar(
+        TIPO_MANDELBROT, complejidad, width, height, x_min, x_max, y_min, y_max, max_iter
+    ) as imagen:
+        return imagen.img.copy()
+
+
+def generar_fractal_profundo(width, height, centro_r, centro_i, radio, max_iter):
+    """
+    Calcula Mandelbrot (grado 2) con zoom profundo alrededor de un centro.
+
+    Args:
+        width, height (int): Tamaño de la imagen en píxeles.
+        centro_r, centro_i (str | Decimal): Centro de la imagen, con todas sus cifras.
+        radio (float): Mitad del ancho de la imagen en el plano complejo.
+        max_iter (int): Número máximo de iteraciones.
+    """
+    medio_alto = radio * height / width
+    orbita = OrbitaReferencia(centro_r, centro_i, math.hypot(radio, medio_alto), max_iter)
+    with renderizar(
+        TIPO_MANDELBROT_PROFUNDO, orbita, width, height,
+        -radio, radio, -medio_alto, medio_alto, max_iter,
+    ) as imagen:
+        return imagen.img.copy()
+
+
+class FractalMandelbrot(VentanaEscape):
     """
     Clase que representa una ventana interactiva para la visualización de fractales de Mandelbrot.
 
-    Esta clase hereda de `Ventana` y permite la personalización del color del fractal,
+    Esta clase hereda de `VentanaEscape` y permite la personalización del color del fractal,
     mostrando una representación gráfica basada en los parámetros seleccionados.
 
     Atributos:
@@ -85,6 +82,7 @@ class FractalMandelbrot(VentanaFractal):
         title: str = Default.WINDOW_TITLE,
         color_seleccionado: str = Texts.MANDELBROT_COLORES_DEFAULT,
         complejidad: int = 2,
+        algoritmo: str = Default.FRACTAL_ALGORITMO,
     ) -> None:
         """
         Inicializa una nueva instancia de la clase FractalMandelbrot.
@@ -95,8 +93,10 @@ class FractalMandelbrot(VentanaFractal):
             title (str): Título de la ventana. Valor por defecto definido en Default.WINDOW_TITLE.
             color_seleccionado (str): Color seleccionado para el fractal.
                 Valor por defecto definido en Texts.MANDELBROT_COLORES_DEFAULT.
+            complejidad (int): Exponente de z.
+            algoritmo (str): Algoritmo de cálculo ("fuerza_bruta" o "mariani_silver").
         """
-        super().__init__(width, height, title)
+        super().__init__(width, height, title, algoritmo)
         self.color_seleccionado = color_seleccionado
         self.complejidad = complejidad
 
@@ -122,28 +122,21 @@ class FractalMandelbrot(VentanaFractal):
     ###################################################################################
 
     def _generar_fractal(self) -> None:
-        self.max_iter = 100  # Número máximo de iteraciones
+        self.max_iter = 100  # Iteraciones de la vista inicial; crecen con el zoom
         self.x_min, self.x_max = -2.0, 1.0
         self.y_min, self.y_max = -1.5, 1.5
-        self._dibujar_mandelbrot()
         print("Color seleccionado:", self.color_seleccionado)
         print("Complejidad seleccionada: ", self.complejidad)
-        self.canvas.draw()
+        self._renderizar_vista()
+
+    def _tipo_fractal(self) -> str:
+        return TIPO_MANDELBROT
+
+    def _parametro_fractal(self) -> int:
+        return self.complejidad
+
+    def _admite_zoom_profundo(self) -> bool:
+        return self.complejidad == 2
 
-    def _dibujar_mandelbrot(self):
-        width, height = 2000, 2000
-        img = generar_fractal(
-            width,
-            height,
-            self.x_min,
-            self.x_max,
-            self.y_min,
-            self.y_max,
-            self.max_iter,
-            self.complejidad,
-        )
-        plt.imshow(
-            img,
-            cmap=self.color_seleccionado,
-            extent=(self.x_min, self.x_max, self.y_min, self.y_max),
-        )
+    def _mapa_colores(self) -> str:
+        return self.color_seleccionado
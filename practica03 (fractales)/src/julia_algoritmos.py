@@ -0,0 +1,299 @@
+"""
+Archivo: julia_algoritmos.py
+
+Descripción:
+Este archivo contiene dos formas de dibujar los conjuntos de Julia (z -> z² + c)
+distintas del tiempo de escape, pensadas para ver bien la frontera del conjunto.
+
+Características principales:
+- Método de iteración inversa modificado (MIIM): se parte del punto fijo repulsor,
+  que está en el conjunto, y se calculan sus antecesores z -> ±sqrt(z - c), que
+  también lo están. Una rejilla de ocupación corta las ramas que llegan a una celda
+  ya visitada bastantes veces, así que no se repite trabajo en las zonas en las
+  que las órbitas inversas se acumulan. Con zoom, los puntos se llevan hasta la
+  vista por las imágenes de la vista hacia delante, para que lleguen con la
+  resolución de sus píxeles.
+- Estimación de distancia: junto con z se itera su derivada dz -> 2·z·dz, y al
+  escapar se calcula la distancia a la frontera 0.5·|z|·log|z| / |dz|. Los
+  filamentos más finos que un píxel se ven aunque ningún píxel caiga dentro.
+- Las dos van por bloques de puntos y con NumPy, como `nucleo_fractal`.
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from constantes import Default  # Constantes predeterminadas.
+from nucleo_fractal import PUNTOS_POR_BLOQUE  # Tamaño de los bloques de puntos.
+
+# Radio de escape de la estimación de distancia: cuanto mayor, más precisa
+RADIO_DISTANCIA = 1000.0
+
+# Lado máximo en celdas de la rejilla de ocupación de la iteración inversa
+LADO_REJILLA = 2048
+
+# Muestras por lado de la vista que se llevan hacia delante en la iteración inversa
+MUESTRAS_VISTA = 64
+
+# Máximo de veces que se lleva la vista hacia delante
+NIVELES_VISTA = 64
+
+# Iteraciones con las que se busca qué muestras de la vista están junto a la frontera
+ITERACIONES_VISTA = 200
+
+
+def radio_julia(c: complex) -> float:
+    """Devuelve el radio de un círculo centrado en 0 que contiene el conjunto de Julia."""
+    return 0.5 + (0.25 + abs(c)) ** 0.5
+
+
+def iteracion_inversa(
+    c: complex, x: np.ndarray, y: np.ndarray, visitas: int = Default.JULIA_MIIM_VISITAS,
+    max_puntos: int = Default.JULIA_MIIM_PUNTOS,
+) -> tuple[np.ndarray, bool]:
+    """
+    Calcula qué píxeles de una rejilla tocan el conjunto de Julia de parámetro c
+    con el método de iteración inversa modificado.
+
+    Se marcan los puntos del recorrido inverso que caen en la vista. Con zoom,
+    además, la vista se lleva hacia delante con z -> z² + c hasta que su
+    imagen es del tamaño del conjunto, se buscan los puntos del recorrido inverso
+    que caen en esa imagen y se traen de vuelta nivel a nivel, quedándose en cada
+    uno con el antecesor que está en la imagen anterior. Como traerlos de vuelta
+    contrae las distancias tanto como el zoom, llegan a la vista igual de juntos
+    que sin zoom.
+
+    Args:
+        c (complex): Parámetro del conjunto de Julia.
+        x (np.ndarray): Parte real de cada columna (equiespaciadas).
+        y (np.ndarray): Parte imaginaria de cada fila (equiespaciadas).
+        visitas (int): Veces que se puede pasar por una celda antes de cortar la rama.
+        max_puntos (int): Número máximo de puntos que se calculan.
+
+    Returns:
+        tuple[np.ndarray, bool]: Máscara booleana (len(y) x len(x)) de los píxeles
+            del conjunto, y si la vista está en una zona que apenas crece al
+            iterarla, a cuyos píxeles la iteración inversa llega mal.
+    """
+    dx, dy = x[1] - x[0], y[1] - y[0]
+    mascara = np.zeros((len(y), len(x)), dtype=bool)
+
+    def marcar(puntos):
+        columnas = np.rint((puntos.real - x[0]) / dx).astype(np.intp)
+        filas = np.rint((puntos.imag - y[0]) / dy).astype(np.intp)
+        dentro = (columnas >= 0) & (columnas < len(x)) & (filas >= 0) & (filas < len(y))
+        mascara[filas[dentro], columnas[dentro]] = True
+        return dentro
+
+    imagenes = _imagenes_vista(c, x, y)
+    # los puntos del recorrido que caen en la vista se marcan directamente y, si
+    # hay zoom, se guardan los que caen en la última imagen de la vista
+    guardados = []
+    for frente in _recorrido_inverso(c, visitas, max_puntos, x, y):
+        marcar(frente)
+        if imagenes:
+            guardados.append(frente[_en_imagen(frente, imagenes[-1])])
+    if not imagenes:
+        return mascara, False
+    # cerca de un ciclo parabólico las órbitas casi no se separan
+    poco_crece = len(imagenes) == NIVELES_VISTA
+    puntos = np.concatenate(guardados)
+    # y se traen de vuelta hasta la vista
+    for imagen in reversed(imagenes[:-1]):
+        raiz = np.sqrt(puntos - c)
+        antecesores = np.concatenate([raiz, -raiz])
+        puntos = antecesores[_en_imagen(antecesores, imagen)]
+    raiz = np.sqrt(puntos - c)
+    for antecesores in (raiz, -raiz):
+        marcar(antecesores)
+    return mascara, poco_crece
+
+
+def _recorrido_inverso(c, visitas, max_puntos, x=None, y=None):
+    """
+    Recorre las órbitas inversas desde el punto fijo repulsor y devuelve (con
+    yield) los puntos de cada nivel que no se han cortado.
+
+    La rejilla de ocupación cubre el conjunto entero con celdas de LADO_REJILLA por
+    lado como mucho. Si se pasan los ejes de una vista, dentro de ella las celdas
+    son los píxeles (o las de fuera, si son más pequeñas).
+    """
+    radio = radio_julia(c)
+    celda = 2 * radio / LADO_REJILLA
+    pixeles = 0
+    if x is not None:
+        dx, dy = x[1] - x[0], y[1] - y[0]
+        celda = max(abs(dx), abs(dy), celda)
+        pixeles = len(x) * len(y)
+    lado = int(np.ceil(2 * radio / celda)) + 1
+    # las celdas de la vista van primero y las de fuera detrás
+    ocupacion = np.zeros(pixeles + lado * lado, dtype=np.uint16)
+
+    # el punto fijo repulsor de z² + c está en el conjunto de Julia
+    frente = np.array([0.5 + np.sqrt(complex(0.25 - c))])
+    calculados = 0
+    while frente.size and calculados < max_puntos:
+        yield frente
+        # los dos antecesores de cada punto, y de ellos uno por celda libre
+        raiz = np.sqrt(frente - c)
+        antecesores = np.concatenate([raiz, -raiz])
+        celdas = (
+            pixeles
+            + np.clip(((antecesores.imag + radio) / celda).astype(np.intp), 0, lado - 1) * lado
+            + np.clip(((antecesores.real + radio) / celda).astype(np.intp), 0, lado - 1)
+        )
+        if pixeles:
+            columnas = np.rint((antecesores.real - x[0]) / dx).astype(np.intp)
+            filas = np.rint((antecesores.imag - y[0]) / dy).astype(np.intp)
+            dentro = (columnas >= 0) & (columnas < len(x)) & (filas >= 0) & (filas < len(y))
+            celdas[dentro] = filas[dentro] * len(x) + columnas[dentro]
+        celdas, primeros = np.unique(celdas, return_index=True)
+        libres = ocupacion[celdas] < visitas
+        ocupacion[celdas[libres]] += 1
+        frente = antecesores[primeros[libres]]
+        calculados += antecesores.size
+
+
+def _imagenes_vista(c, x, y):
+    """
+    Lleva una muestra de MUESTRAS_VISTA x MUESTRAS_VISTA puntos de la vista hacia
+    delante con z -> z² + c hasta que su imagen mide tanto como el radio del
+    conjunto, y devuelve cada imagen como una rejilla de celdas ocupadas.
+
+    Returns:
+        list[tuple]: Imágenes 1, 2, ... como (x0, y0, celda, ocupadas), con
+            `ocupadas` booleana (filas x columnas). Vacía si la vista ya es grande.
+    """
+    radio = radio_julia(c)
+    muestras_x = np.linspace(x[0], x[-1], MUESTRAS_VISTA)
+    muestras_y = np.linspace(y[0], y[-1], MUESTRAS_VISTA)
+    z = muestras_x[np.newaxis, :] + 1j * muestras_y[:, np.newaxis]
+    # solo se siguen las muestras de fuera del conjunto que están junto a su
+    # frontera: las de dentro no se alejan y no dejarían crecer la imagen
+    separacion = max(muestras_x[1] - muestras_x[0], muestras_y[1] - muestras_y[0])
+    distancias = distancia_julia(z.real, z.imag, c, ITERACIONES_VISTA)
+    z = np.where((distancias > 0) & (distancias < 2 * separacion), z, np.nan)
+    imagenes = []
+    with np.errstate(over="ignore", invalid="ignore"):
+        while len(imagenes) < NIVELES_VISTA:
+            cerca = np.abs(z) <= 2 * radio
+            if not cerca.any() or max(np.ptp(z.real[cerca]), np.ptp(z.imag[cerca])) >= radio:
+                break
+            z = np.where(cerca, z * z + c, np.nan)
+            # distancia entre las imágenes de muestras vecinas: con celdas de ese
+            # lado, ocupando también las de alrededor, la imagen queda cubierta
+            celda = max(
+                np.nanmax(np.abs(np.diff(z, axis=0)), initial=0.0),
+                np.nanmax(np.abs(np.diff(z, axis=1)), initial=0.0),
+            )
+            puntos = z[np.abs(z) <= radio + celda]
+            if puntos.size == 0:
+                return []  # la vista está fuera del conjunto
+            extension = max(np.ptp(puntos.real), np.ptp(puntos.imag))
+            celda = max(celda, extension / LADO_REJILLA, np.finfo(float).tiny)
+            x0, y0 = puntos.real.min() - celda, puntos.imag.min() - celda
+            columnas = np.rint((puntos.real - x0) / celda).astype(np.intp)
+            filas = np.rint((puntos.imag - y0) / celda).astype(np.intp)
+            ocupadas = np.zeros((filas.max() + 2, columnas.max() + 2), dtype=bool)
+            ocupadas[filas, columnas] = True
+            alrededor = ocupadas.copy()
+            alrededor[1:] |= ocupadas[:-1]
+            alrededor[:-1] |= ocupadas[1:]
+            alrededor[:, 1:] |= alrededor[:, :-1].copy()
+            alrededor[:, :-1] |= alrededor[:, 1:].copy()
+            imagenes.append((x0, y0, celda, alrededor))
+    return imagenes
+
+
+def _en_imagen(puntos, imagen):
+    """Indica qué puntos caen en una celda ocupada de una imagen de `_imagenes_vista`."""
+    x0, y0, celda, ocupadas = imagen
+    columnas = np.rint((puntos.real - x0) / celda).astype(np.intp)
+    filas = np.rint((puntos.imag - y0) / celda).astype(np.intp)
+    dentro = (
+        (columnas >= 0) & (columnas < ocupadas.shape[1])
+        & (filas >= 0) & (filas < ocupadas.shape[0])
+    )
+    dentro[dentro] = ocupadas[filas[dentro], columnas[dentro]]
+    return dentro
+
+
+def distancia_julia(zr, zi, c: complex, max_iter: int) -> np.ndarray:
+    """
+    Estima la distancia de cada punto a la frontera del conjunto de Julia.
+
+    Args:
+        zr, zi (np.ndarray): Parte real e imaginaria de los puntos; se combinan
+            con broadcasting.
+        c (complex): Parámetro del conjunto de Julia.
+        max_iter (int): Número máximo de iteraciones.
+
+    Returns:
+        np.ndarray: Distancia de cada punto (0 para los que no escapan), con la
+            forma de zr y zi.
+    """
+    forma = np.broadcast_shapes(np.shape(zr), np.shape(zi))
+    zr, zi = (
+        np.broadcast_to(np.asarray(a, dtype=np.float64), forma).ravel() for a in (zr, zi)
+    )
+    distancias = np.zeros(zr.size)
+    for inicio in range(0, zr.size, PUNTOS_POR_BLOQUE):
+        bloque = slice(inicio, inicio + PUNTOS_POR_BLOQUE)
+        distancias[bloque] = _distancia_bloque(zr[bloque], zi[bloque], c, max_iter)
+    return distancias.reshape(forma)
+
+
+def _distancia_bloque(zr, zi, c, max_iter):
+    """
+    Itera z y su derivada en un bloque de puntos. Los que escapan se quitan de los
+    arrays en cuanto escapan; los que no escapan se quedan a distancia 0.
+    """
+    radio2 = RADIO_DISTANCIA * RADIO_DISTANCIA
+    distancias = np.zeros(zr.size)
+    activos = np.arange(zr.size)
+    zr, zi = zr.copy(), zi.copy()
+    dr, di = np.ones(zr.size), np.zeros(zr.size)
+
+    # cerca de la frontera la derivada puede desbordarse: la distancia sale 0
+    with np.errstate(over="ignore", invalid="ignore"):
+        for _ in range(max_iter):
+            modulo2 = zr * zr + zi * zi
+            escapados = modulo2 > radio2
+            if escapados.any():
+                indices = np.flatnonzero(escapados)
+                modulo = np.sqrt(modulo2[indices])
+                distancias[activos[indices]] = (
+                    0.5 * modulo * np.log(modulo) / np.hypot(dr[indices], di[indices])
+                )
+                vivos = ~escapados
+                activos, zr, zi, dr, di = (
+                    activos[vivos], zr[vivos], zi[vivos], dr[vivos], di[vivos]
+                )
+                if activos.size == 0:
+                    break
+            # dz -> 2·z·dz y z -> z² + c
+            dr, di = 2 * (zr * dr - zi * di), 2 * (zr * di + zi * dr)
+            zr, zi = zr * zr - zi * zi + c.real, 2 * zr * zi + c.imag
+
+    return np.nan_to_num(distancias, nan=0.0)
+
+
+def sombrear_distancia(distancias, tamanho_pixel, max_iter):
+    """
+    Convierte las distancias en valores que se colorean como iteraciones: max_iter
+    (el color del conjunto) si la frontera pasa por el píxel, y menos cuanto más lejos.
+
+    Args:
+        distancias (np.ndarray): Distancias de `distancia_julia`.
+        tamanho_pixel (float): Lado de un píxel en el plano complejo.
+        max_iter (int): Número máximo de iteraciones.
+
+    Returns:
+        np.ndarray: Valores entre 0 y max_iter (float32).
+    """
+    with np.errstate(divide="ignore"):
+        cercania = Default.JULIA_GROSOR_DISTANCIA * tamanho_pixel / distancias
+    return (np.minimum(cercania, 1.0) * max_iter).astype(np.float32)
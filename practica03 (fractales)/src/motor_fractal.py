@@ -0,0 +1,472 @@
+"""
+Archivo: motor_fractal.py
+
+Descripción:
+Este archivo reparte el cálculo de los fractales de tiempo de escape (Mandelbrot y
+Julia) entre varios procesos.
+
+Características principales:
+- La imagen se divide en teselas cuadradas y cada proceso calcula teselas enteras.
+- Cada tarea recibe solo el origen y el paso de sus coordenadas, no los ejes enteros.
+- Los procesos se crean una sola vez y se reutilizan durante toda la aplicación.
+- Cada tesela se puede calcular píxel a píxel o con el algoritmo de Mariani-Silver.
+- Los conjuntos de Julia se pueden dibujar también por iteración inversa (MIIM) o
+  con la estimación de distancia a la frontera. La iteración inversa recorre el
+  conjunto entero, así que se hace una sola vez para todas las teselas de la vista.
+- Mandelbrot con zoom profundo se calcula por perturbación: las coordenadas de
+  las teselas son entonces distancias a la órbita de referencia.
+- La imagen está en memoria compartida: cada proceso escribe su tesela directamente
+  en ella y no hay que copiar resultados de un proceso a otro.
+- Si la imagen es de floats, se guardan las iteraciones continuas (suavizadas).
+- Los cálculos se pueden hacer en float32 o float64, o elegir según el zoom.
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from constantes import Default, Texts  # Constantes y textos predeterminados.
+from nucleo_fractal import (
+    PRECISION_FLOAT64,
+    elegir_precision,
+    tiempo_escape,
+)  # Cálculo vectorizado del fractal.
+from mariani_silver import mariani_silver  # Cálculo por subdivisión de rectángulos.
+from perturbacion import tiempo_escape_perturbacion  # Cálculo con zoom profundo.
+from julia_algoritmos import (
+    distancia_julia,
+    iteracion_inversa,
+    sombrear_distancia,
+)  # Otras formas de dibujar Julia.
+
+TIPO_MANDELBROT = "mandelbrot"
+TIPO_JULIA = "julia"
+TIPO_MANDELBROT_PROFUNDO = "mandelbrot_profundo"  # Perturbación de una órbita de referencia
+
+ALGORITMO_FUERZA_BRUTA = "fuerza_bruta"  # Se itera cada píxel
+ALGORITMO_MARIANI_SILVER = "mariani_silver"  # Solo se iteran los bordes que hacen falta
+ALGORITMO_ITERACION_INVERSA = "iteracion_inversa"  # Julia: órbitas inversas (MIIM)
+ALGORITMO_DISTANCIA = "distancia"  # Julia: estimación de distancia a la frontera
+
+_pool = None  # Procesos compartidos por todos los fractales
+
+
+def obtener_pool(procesos: int | None = Default.FRACTAL_PROCESOS) -> ProcessPoolExecutor:
+    """
+    Devuelve el grupo de procesos de la aplicación, creándolo la primera vez.
+
+    Args:
+        procesos (int | None): Número de procesos. Por defecto, uno por núcleo.
+            Solo se tiene en cuenta al crear el grupo.
+
+    Returns:
+        ProcessPoolExecutor: El grupo de procesos compartido.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=procesos)
+    return _pool
+
+
+@atexit.register
+def cerrar_pool() -> None:
+    """Cierra el grupo de procesos, si se ha llegado a crear."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def dividir_en_teselas(width: int, height: int, tamanho: int) -> list[tuple]:
+    """
+    Divide una imagen en teselas de tamanho x tamanho píxeles (las del borde
+    pueden ser más pequeñas).
+
+    Args:
+        width (int): Ancho de la imagen en píxeles.
+        height (int): Alto de la imagen en píxeles.
+        tamanho (int): Lado de cada tesela en píxeles.
+
+    Returns:
+        list[tuple]: Teselas como (fila_inicio, fila_fin, columna_inicio, columna_fin).
+    """
+    return [
+        (fila, min(fila + tamanho, height), columna, min(columna + tamanho, width))
+        for fila in range(0, height, tamanho)
+        for columna in range(0, width, tamanho)
+    ]
+
+
+class ImagenCompartida:
+    """
+    Imagen de iteraciones guardada en memoria compartida entre procesos: enteras
+    (int32) o continuas (float32).
+
+    El proceso principal la crea y la lee como un array de NumPy sin copiarla, y
+    los procesos del grupo la abren por su nombre para escribir sus teselas. Hay
+    que liberarla con `liberar` (o usarla con `with`) cuando ya no se necesite.
+    """
+
+    def __init__(self, width: int, height: int, suave: bool = False) -> None:
+        """
+        Reserva la memoria compartida de la imagen.
+
+        Args:
+            width (int): Ancho de la imagen en píxeles.
+            height (int): Alto de la imagen en píxeles.
+            suave (bool): Guardar las iteraciones continuas en lugar de las enteras.
+        """
+        self.forma = (height, width)
+        self.tipo_datos = np.dtype(np.float32 if suave else np.int32).str
+        self._memoria = shared_memory.SharedMemory(
+            create=True, size=max(width * height * np.dtype(self.tipo_datos).itemsize, 1)
+        )
+        self.nombre = self._memoria.name
+        self.img = np.ndarray(self.forma, dtype=self.tipo_datos, buffer=self._memoria.buf)
+
+    def liberar(self) -> None:
+        """Libera la memoria compartida. Después ya no se puede usar `img`."""
+        if self._memoria is not None:
+            self.img = None
+            self._memoria.close()
+            self._memoria.unlink()
+            self._memoria = None
+
+    def liberar_al_terminar(self, futuros) -> None:
+        """
+        Cancela las tareas que aún no han empezado y libera la memoria cuando
+        terminen las demás.
+
+        Una tarea que ya se ha mandado a un proceso no se puede cancelar aunque
+        todavía no haya abierto la memoria, así que no se puede liberar antes.
+
+        Args:
+            futuros (Iterable[Future]): Tareas que escriben en la imagen.
+        """
+        vivos = {futuro for futuro in futuros if not futuro.cancel()}
+        if not vivos:
+            self.liberar()
+            return
+
+        pendientes = [len(vivos)]
+        cerrojo = threading.Lock()
+
+        def terminado(_):
+            # se llama desde el hilo del grupo de procesos
+            with cerrojo:
+                pendientes[0] -= 1
+                ultimo = pendientes[0] == 0
+            if ultimo:
+                self.liberar()
+
+        for futuro in vivos:
+            futuro.add_done_callback(terminado)
+
+    def __enter__(self) -> "ImagenCompartida":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.liberar()
+
+
+def calcular_puntos(
+    tipo, parametro, x, y, max_iter, suave=False,
+    cardioide=Default.FRACTAL_CARDIOIDE, periodicidad=Default.FRACTAL_PERIODICIDAD,
+    precision=PRECISION_FLOAT64,
+):
+    """
+    Calcula las iteraciones de una lista de puntos del plano complejo.
+
+    Args:
+        tipo (str): TIPO_MANDELBROT, TIPO_JULIA o TIPO_MANDELBROT_PROFUNDO.
+        parametro: Exponente de z para Mandelbrot, el c complejo para Julia, o la
+            OrbitaReferencia para Mandelbrot profundo.
+        x, y (np.ndarray): Parte real e imaginaria de cada punto (en Mandelbrot
+            profundo, su distancia a la referencia).
+        max_iter (int): Número máximo de iteraciones.
+        suave (bool): Devolver las iteraciones continuas.
+        cardioide (bool): En Mandelbrot de grado 2, no iterar el cardioide y el
+            círculo de periodo 2.
+        periodicidad (bool): Dejar de iterar las órbitas periódicas.
+        precision (str): "float32" o "float64". Mandelbrot profundo usa siempre
+            float64.
+
+    Returns:
+        np.ndarray: Iteraciones de cada punto.
+    """
+    if tipo == TIPO_MANDELBROT_PROFUNDO:
+        return tiempo_escape_perturbacion(x, y, parametro, max_iter, suave)
+    if tipo == TIPO_JULIA:
+        return tiempo_escape(
+            x, y, parametro.real, parametro.imag, max_iter,
+            periodicidad=periodicidad, suave=suave, precision=precision,
+        )
+    return tiempo_escape(
+        0.0, 0.0, x, y, max_iter, parametro, cardioide and parametro == 2, periodicidad,
+        suave, precision,
+    )
+
+
+def _escribir_tesela(
+    nombre, forma, tipo_datos, tesela, x0, dx, y0, dy, tipo, parametro, max_iter, paso,
+    paso_anterior, algoritmo, precision,
+):
+    """
+    Calcula una tesela y la escribe en la imagen compartida. Se ejecuta en los
+    procesos del grupo.
+
+    Solo se calculan las filas y columnas múltiplo de `paso`, y de ellas se saltan
+    las que ya se calcularon en una pasada anterior con `paso_anterior`. Con
+    Mariani-Silver la tesela se calcula entera. Si la imagen
+    es de floats, se calculan las iteraciones continuas. Los cálculos se hacen
+    con la `precision` indicada.
+    """
+    suave = np.dtype(tipo_datos).kind == "f"
+    fila0, fila1, col0, col1 = tesela
+    filas = np.arange(fila0, fila1, paso)
+    columnas = np.arange(col0, col1, paso)
+    if paso_anterior:
+        nuevos = ~((filas % paso_anterior == 0)[:, np.newaxis] & (columnas % paso_anterior == 0))
+    else:
+        nuevos = np.ones((filas.size, columnas.size), dtype=bool)
+
+    x = x0 + (columnas - col0) * dx
+    y = y0 + (filas - fila0) * dy
+    if algoritmo == ALGORITMO_DISTANCIA and tipo == TIPO_JULIA:
+        x, y = np.meshgrid(x, y)
+        distancias = distancia_julia(x[nuevos], y[nuevos], parametro, max_iter)
+        cuentas = sombrear_distancia(distancias, max(dx, dy), max_iter)
+    elif algoritmo == ALGORITMO_MARIANI_SILVER:
+        cuentas = mariani_silver(
+            lambda xs, ys: calcular_puntos(
+                tipo, parametro, xs, ys, max_iter, suave, precision=precision
+            ),
+            x, y, tipo_datos=tipo_datos,
+        )[nuevos]
+    else:
+        x, y = np.meshgrid(x, y)
+        cuentas = calcular_puntos(
+            tipo, parametro, x[nuevos], y[nuevos], max_iter, suave, precision=precision
+        )
+
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        img = np.ndarray(forma, dtype=tipo_datos, buffer=memoria.buf)
+        region = img[fila0:fila1:paso, col0:col1:paso]
+        region[nuevos] = cuentas
+        del img, region  # los arrays no pueden seguir vivos al cerrar la memoria
+    finally:
+        memoria.close()
+
+
+def _escribir_iteracion_inversa(nombre, forma, tipo_datos, tareas, c, max_iter):
+    """
+    Dibuja por iteración inversa todas las teselas de una vista, con un solo
+    recorrido de las órbitas para la rejilla de píxeles que las cubre, y las
+    escribe en la imagen compartida. Se ejecuta en los procesos del grupo.
+
+    Returns:
+        bool: Si la vista apenas crece al iterarla y la iteración inversa llega a
+            pocos de sus píxeles. El aviso lo da quien espera el resultado.
+    """
+    # todas las teselas tienen sus píxeles en la misma rejilla
+    _, dx, _, dy = tareas[0][1:]
+    x_min = min(x0 for _, x0, _, _, _ in tareas)
+    y_min = min(y0 for _, _, _, y0, _ in tareas)
+    posiciones = [
+        (
+            tesela,
+            int(np.rint((y0 - y_min) / dy)),
+            int(np.rint((x0 - x_min) / dx)),
+        )
+        for tesela, x0, _, y0, _ in tareas
+    ]
+    ancho = max(columna + tesela[3] - tesela[2] for tesela, _, columna in posiciones)
+    alto = max(fila + tesela[1] - tesela[0] for tesela, fila, _ in posiciones)
+    mascara, poco_crece = iteracion_inversa(
+        c, x_min + np.arange(ancho) * dx, y_min + np.arange(alto) * dy
+    )
+
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        img = np.ndarray(forma, dtype=tipo_datos, buffer=memoria.buf)
+        for (fila0, fila1, col0, col1), fila, columna in posiciones:
+            zona = mascara[fila : fila + fila1 - fila0, columna : columna + col1 - col0]
+            # los píxeles de la frontera llevan el color del conjunto
+            img[fila0:fila1, col0:col1] = np.where(zona, max_iter, 0)
+        del img  # el array no puede seguir vivo al cerrar la memoria
+    finally:
+        memoria.close()
+    return poco_crece
+
+
+def enviar_tareas(
+    imagen, tareas, tipo, parametro, max_iter, paso=1, paso_anterior=None,
+    algoritmo=ALGORITMO_FUERZA_BRUTA, precision=PRECISION_FLOAT64,
+):
+    """
+    Manda a los procesos el cálculo de varias zonas de una imagen compartida.
+
+    Con `paso` mayor que 1 solo se calcula uno de cada paso x paso píxeles, lo que
+    permite mostrar primero una versión de baja resolución. Los píxeles que ya
+    calculó una pasada anterior con `paso_anterior` no se vuelven a calcular.
+    La iteración inversa de Julia calcula todas las zonas a la vez y enteras: tienen
+    que ser de la misma vista, con los píxeles en la misma rejilla.
+
+    Args:
+        imagen (ImagenCompartida): Imagen en la que se escriben las iteraciones.
+        tareas (list[tuple]): Cada zona como (tesela, x0, dx, y0, dy): la tesela
+            (fila_inicio, fila_fin, columna_inicio, columna_fin) de la imagen, las
+            coordenadas de su primer píxel y la distancia entre píxeles. Sus
+            límites tienen que ser múltiplos de los pasos.
+        tipo (str): TIPO_MANDELBROT o TIPO_JULIA.
+        parametro: Exponente de z para Mandelbrot, o el c complejo para Julia.
+        max_iter (int): Número máximo de iteraciones.
+        paso (int): Distancia en píxeles entre los puntos que se calculan.
+        paso_anterior (int | None): Paso de la pasada anterior, si la hubo.
+        algoritmo (str): ALGORITMO_FUERZA_BRUTA, ALGORITMO_MARIANI_SILVER o, para
+            Julia, ALGORITMO_ITERACION_INVERSA o ALGORITMO_DISTANCIA.
+        precision (str): "float32" o "float64".
+
+    Returns:
+        list[tuple]: Cada tesela junto con el Future que termina al escribirla.
+    """
+    pool = obtener_pool()
+    if algoritmo == ALGORITMO_ITERACION_INVERSA and tipo == TIPO_JULIA:
+        futuro = pool.submit(
+            _escribir_iteracion_inversa,
+            imagen.nombre,
+            imagen.forma,
+            imagen.tipo_datos,
+            tareas,
+            parametro,
+            max_iter,
+        )
+        return [(tesela, futuro) for tesela, _, _, _, _ in tareas]
+    return [
+        (
+            tesela,
+            pool.submit(
+                _escribir_tesela,
+                imagen.nombre,
+                imagen.forma,
+                imagen.tipo_datos,
+                tesela,
+                x0,
+                dx,
+                y0,
+                dy,
+                tipo,
+                parametro,
+                max_iter,
+                paso,
+                paso_anterior,
+                algoritmo,
+                precision,
+            ),
+        )
+        for tesela, x0, dx, y0, dy in tareas
+    ]
+
+
+def enviar_teselas(
+    imagen, tipo, parametro, x_min, x_max, y_min, y_max, max_iter,
+    tamanho_tesela=Default.FRACTAL_TESELA, paso=1, paso_anterior=None,
+    algoritmo=ALGORITMO_FUERZA_BRUTA, precision=Default.FRACTAL_PRECISION,
+):
+    """
+    Divide una imagen en teselas y manda su cálculo a los procesos con `enviar_tareas`.
+
+    Args:
+        imagen (ImagenCompartida): Imagen en la que se escriben las iteraciones.
+        tipo (str): TIPO_MANDELBROT o TIPO_JULIA.
+        parametro: Exponente de z para Mandelbrot, o el c complejo para Julia.
+        x_min, x_max (float): Límites del eje real.
+        y_min, y_max (float): Límites del eje imaginario.
+        max_iter (int): Número máximo de iteraciones.
+        tamanho_tesela (int): Lado de cada tesela en píxeles. Tiene que ser
+            múltiplo de los pasos.
+        paso (int): Distancia en píxeles entre los puntos que se calculan.
+        paso_anterior (int | None): Paso de la pasada anterior, si la hubo.
+        algoritmo (str): ALGORITMO_FUERZA_BRUTA, ALGORITMO_MARIANI_SILVER o, para
+            Julia, ALGORITMO_ITERACION_INVERSA o ALGORITMO_DISTANCIA.
+        precision (str): "float32", "float64" o "auto" (según la distancia entre píxeles).
+
+    Returns:
+        list[tuple]: Cada tesela junto con el Future que termina al escribirla.
+    """
+    height, width = imagen.forma
+    # mismas coordenadas que np.linspace(x_min, x_max, width)
+    dx = (x_max - x_min) / max(width - 1, 1)
+    dy = (y_max - y_min) / max(height - 1, 1)
+    tareas = [
+        (tesela, x_min + tesela[2] * dx, dx, y_min + tesela[0] * dy, dy)
+        for tesela in dividir_en_teselas(width, height, tamanho_tesela)
+    ]
+    precision = elegir_precision(precision, max(abs(dx), abs(dy)))
+    return enviar_tareas(
+        imagen, tareas, tipo, parametro, max_iter, paso, paso_anterior, algoritmo,
+        precision,
+    )
+
+
+def renderizar(
+    tipo, parametro, width, height, x_min, x_max, y_min, y_max, max_iter,
+    tamanho_tesela=Default.FRACTAL_TESELA, algoritmo=ALGORITMO_FUERZA_BRUTA,
+    comprobar=False, suave=False, precision=Default.FRACTAL_PRECISION,
+):
+    """
+    Calcula una imagen completa repartiendo sus teselas entre los procesos.
+
+    Args:
+        tipo (str): TIPO_MANDELBROT o TIPO_JULIA.
+        parametro: Exponente de z para Mandelbrot, o el c complejo para Julia.
+        width, height (int): Tamaño de la imagen en píxeles.
+        x_min, x_max (float): Límites del eje real.
+        y_min, y_max (float): Límites del eje imaginario.
+        max_iter (int): Número máximo de iteraciones.
+        tamanho_tesela (int): Lado de cada tesela en píxeles.
+        algoritmo (str): ALGORITMO_FUERZA_BRUTA, ALGORITMO_MARIANI_SILVER o, para
+            Julia, ALGORITMO_ITERACION_INVERSA o ALGORITMO_DISTANCIA.
+        comprobar (bool): Si es True y el algoritmo es Mariani-Silver, se calcula
+            también por fuerza bruta y se muestra cuántos píxeles salen distintos.
+        suave (bool): Calcular las iteraciones continuas (float32) en lugar de las enteras.
+        precision (str): "float32", "float64" o "auto" (según la distancia entre píxeles).
+
+    Returns:
+        ImagenCompartida: Iteraciones de cada píxel (height x width). Hay que
+            liberarla cuando ya no se use.
+    """
+    argumentos = (tipo, parametro, x_min, x_max, y_min, y_max, max_iter, tamanho_tesela)
+    imagen = ImagenCompartida(width, height, suave)
+    try:
+        avisos = [
+            futuro.result()
+            for _, futuro in enviar_teselas(
+                imagen, *argumentos, algoritmo=algoritmo, precision=precision
+            )
+        ]
+        if any(avisos):
+            print(Texts.JULIA_AVISO_MIIM)
+
+        if comprobar and algoritmo == ALGORITMO_MARIANI_SILVER:
+            with ImagenCompartida(width, height, suave) as referencia:
+                for _, futuro in enviar_teselas(referencia, *argumentos, precision=precision):
+                    futuro.result()
+                distintos = np.count_nonzero(imagen.img != referencia.img)
+            print(
+                f"Comprobación de {algoritmo}: {distintos} de {width * height} "
+                "píxeles distintos de la fuerza bruta"
+            )
+    except BaseException:
+        imagen.liberar()
+        raise
+    return imagen
@@ -0,0 +1,494 @@
+"""
+Archivo: nucleo_fractal.py
+
+Descripción:
+Este archivo contiene los cálculos de tiempo de escape de los fractales de Mandelbrot
+y de Julia, separados de las ventanas para poder usarlos desde otros procesos o sin
+interfaz gráfica.
+
+Características principales:
+- Itera todos los píxeles de una zona a la vez con NumPy en lugar de uno a uno.
+- Solo sigue iterando los píxeles que aún no han escapado: cuando escapan
+  bastantes, se quitan de los arrays activos.
+- Usa arrays separados para la parte real y la imaginaria y compara |z|² con el
+  radio al cuadrado, sin raíces cuadradas.
+- Los exponentes enteros se calculan con multiplicaciones (fórmulas directas para
+  2, 3 y 4 y exponenciación por cuadrados para el resto), y los no enteros en
+  forma polar, nunca con la potencia compleja genérica.
+- En Mandelbrot de grado 2 descarta sin iterar los puntos del cardioide principal
+  y del círculo de periodo 2, que sabemos que no escapan.
+- Detecta las órbitas periódicas (método de Brent) para dejar de iterar antes de
+  max_iter los puntos que no van a escapar.
+- Puede devolver el número de iteraciones continuo (suavizado) en lugar del
+  entero, para colorear sin bandas.
+- Puede calcular en float32 en lugar de float64: con zoom poco profundo da la
+  misma imagen con la mitad de memoria y de tráfico con ella.
+- Ayuda a elegir el número máximo de iteraciones: crece con la profundidad del
+  zoom y se puede subir si en una primera muestra quedan muchos píxeles sin decidir.
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import math
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from constantes import Default  # Constantes predeterminadas.
+
+# Radio de escape: un punto con |z| > 2 ya no vuelve
+RADIO_ESCAPE = 2.0
+
+# Distancia a la que dos valores de z se consideran el mismo punto de la órbita
+TOLERANCIA_PERIODO = 1e-10
+
+# Puntos que se iteran juntos: así los arrays de trabajo caben en la caché
+PUNTOS_POR_BLOQUE = 32768
+
+# Precisiones de los cálculos
+PRECISION_FLOAT32 = "float32"
+PRECISION_FLOAT64 = "float64"
+PRECISION_AUTOMATICA = "auto"  # float32 si los píxeles son grandes, si no float64
+
+
+def elegir_precision(precision: str, tamanho_pixel: float) -> str:
+    """
+    Devuelve la precisión con la que calcular una vista.
+
+    Args:
+        precision (str): PRECISION_FLOAT32, PRECISION_FLOAT64 o PRECISION_AUTOMATICA.
+        tamanho_pixel (float): Lado de un píxel en el plano complejo.
+
+    Returns:
+        str: PRECISION_FLOAT32 o PRECISION_FLOAT64. La automática es float32
+            mientras los píxeles midan al menos Default.FRACTAL_PIXEL_FLOAT32.
+    """
+    if precision == PRECISION_AUTOMATICA:
+        if tamanho_pixel >= Default.FRACTAL_PIXEL_FLOAT32:
+            return PRECISION_FLOAT32
+        return PRECISION_FLOAT64
+    return precision
+
+
+def iteraciones_para_zoom(base: int, zoom: float) -> int:
+    """
+    Devuelve el número máximo de iteraciones de una vista según su profundidad.
+
+    Args:
+        base (int): Iteraciones de la vista inicial.
+        zoom (float): Cuántas veces es más pequeña la vista que la inicial.
+
+    Returns:
+        int: `base` aumentado en Default.FRACTAL_ITER_POR_OCTAVA veces por cada vez
+            que se ha duplicado el zoom. Solo cambia con cada duplicación completa,
+            para que las vistas parecidas usen el mismo número.
+    """
+    octavas = max(math.floor(math.log2(zoom)), 0) if zoom > 0 else 0
+    return int(round(base * (1 + Default.FRACTAL_ITER_POR_OCTAVA * octavas)))
+
+
+def faltan_iteraciones(
+    cuentas: np.ndarray, max_iter: int, sin_decidir_antes: float | None = None
+) -> bool:
+    """
+    Indica si unas iteraciones de muestra se han quedado cortas: ningún píxel ha
+    escapado, o muchos han escapado en la segunda mitad de las iteraciones (o casi
+    todos los que escapan lo hacen ahí), así que otros tantos estarán aún sin
+    decidir entre los que han llegado a max_iter.
+
+    Args:
+        cuentas (np.ndarray): Iteraciones (enteras o continuas) de una muestra de píxeles.
+        max_iter (int): Número máximo de iteraciones con el que se calcularon.
+        sin_decidir_antes (float | None): Si la muestra se calculó antes con la mitad
+            de iteraciones, la fracción de píxeles que llegaron entonces al máximo.
+            Si al duplicarlas se han decidido pocos, no merece la pena seguir.
+
+    Returns:
+        bool: True si conviene calcular con más iteraciones.
+    """
+    escapados = cuentas[cuentas < max_iter]
+    sin_decidir = 1 - escapados.size / cuentas.size
+    if (
+        sin_decidir_antes is not None
+        and sin_decidir > (1 - Default.FRACTAL_ITER_DECIDIDOS) * sin_decidir_antes
+    ):
+        return False  # También si no escapa ningún píxel, ni antes ni ahora
+    if escapados.size == 0:
+        return True
+    tardios = np.count_nonzero(escapados > max_iter / 2)
+    return tardios > Default.FRACTAL_ITER_TARDIOS * cuentas.size or tardios > escapados.size / 2
+
+
+def ejes(x_min, x_max, y_min, y_max, width, height):
+    """
+    Devuelve las coordenadas de cada columna y de cada fila de la imagen.
+
+    Args:
+        x_min, x_max (float): Límites del eje real.
+        y_min, y_max (float): Límites del eje imaginario.
+        width, height (int): Tamaño de la imagen en píxeles.
+
+    Returns:
+        tuple: Arrays con la parte real de cada columna y la imaginaria de cada fila.
+    """
+    return np.linspace(x_min, x_max, width), np.linspace(y_min, y_max, height)
+
+
+def dentro_cardioide_o_bulbo(cr, ci):
+    """
+    Indica qué puntos c están en el cardioide principal o en el círculo de periodo 2
+    del conjunto de Mandelbrot de grado 2. Esos puntos nunca escapan.
+
+    Args:
+        cr, ci (np.ndarray): Parte real e imaginaria de c.
+
+    Returns:
+        np.ndarray: True para los puntos de dentro.
+    """
+    ci2 = ci * ci
+    q = (cr - 0.25) ** 2 + ci2
+    cardioide = q * (q + (cr - 0.25)) <= 0.25 * ci2
+    bulbo = (cr + 1.0) ** 2 + ci2 <= 1.0 / 16.0
+    return cardioide | bulbo
+
+
+def iteraciones_suaves(cuentas, modulos2, grado, max_iter):
+    """
+    Convierte las iteraciones enteras en continuas con |z| en el momento de escapar:
+    n + 1 - log_grado(log|z| / log R). Valen n + 1 si |z| = R y n si |z| = R**grado,
+    así que no hay saltos entre una iteración y la siguiente.
+
+    Args:
+        cuentas (np.ndarray): Iteraciones enteras de cada punto.
+        modulos2 (np.ndarray): |z|² de cada punto al escapar.
+        grado (int | float): Exponente de z.
+        max_iter (int): Número máximo de iteraciones. Los puntos que no escapan
+            se quedan con este valor.
+
+    Returns:
+        np.ndarray: Iteraciones continuas (float32).
+    """
+    suaves = cuentas.astype(np.float32)
+    escapados = cuentas < max_iter
+    log_modulo = 0.5 * np.log(modulos2[escapados])
+    suaves[escapados] += 1 - np.log(log_modulo / np.log(RADIO_ESCAPE)) / np.log(grado)
+    return suaves
+
+
+def tiempo_escape(
+    zr, zi, cr, ci, max_iter, grado=2, cardioide=False, periodicidad=False, suave=False,
+    precision=PRECISION_FLOAT64,
+):
+    """
+    Calcula cuántas iteraciones de z -> z**grado + c tarda cada punto en escapar.
+
+    Da lo mismo que el bucle `while abs(z) <= 2 and iterations < max_iter` de cada
+    píxel, pero para todos los píxeles a la vez.
+
+    Args:
+        zr, zi (np.ndarray): Parte real e imaginaria del valor inicial de z.
+        cr, ci (np.ndarray): Parte real e imaginaria de c. Se pueden combinar por
+            broadcasting con zr y zi (por ejemplo, un c fijo para Julia).
+        max_iter (int): Número máximo de iteraciones.
+        grado (int | float): Exponente de z.
+        cardioide (bool): Si es True, los puntos del cardioide y del círculo de
+            periodo 2 no se iteran. Solo es válido para Mandelbrot (z0 = 0) de grado 2.
+        periodicidad (bool): Si es True, se dejan de iterar los puntos cuya órbita
+            se repite (solo con exponentes enteros).
+        suave (bool): Si es True, devuelve las iteraciones continuas (float32).
+        precision (str): Tipo de los cálculos, PRECISION_FLOAT32 o PRECISION_FLOAT64.
+
+    Returns:
+        np.ndarray: Iteraciones de cada punto (int32, o float32 si `suave`), con la
+            forma del broadcasting.
+    """
+    forma = np.broadcast_shapes(np.shape(zr), np.shape(zi), np.shape(cr), np.shape(ci))
+    zr, zi, cr, ci = (
+        np.broadcast_to(np.asarray(a, dtype=precision), forma).ravel()
+        for a in (zr, zi, cr, ci)
+    )
+
+    # los puntos de dentro se quedan con max_iter y solo se iteran los demás
+    cuentas = np.full(zr.size, max_iter, dtype=np.int32)
+    modulos2 = np.empty(zr.size) if suave else None  # |z|² de cada punto al escapar
+    if cardioide:
+        pendientes = np.flatnonzero(~dentro_cardioide_o_bulbo(cr, ci))
+    else:
+        pendientes = np.arange(zr.size)
+
+    for inicio in range(0, pendientes.size, PUNTOS_POR_BLOQUE):
+        bloque = pendientes[inicio : inicio + PUNTOS_POR_BLOQUE]
+        argumentos = (zr[bloque], zi[bloque], cr[bloque], ci[bloque], max_iter)
+        if grado >= 1 and float(grado).is_integer():
+            cuentas[bloque], modulos = _tiempo_escape_entero(
+                *argumentos, int(grado), periodicidad
+            )
+        else:
+            cuentas[bloque], modulos = _tiempo_escape_polar(*argumentos, grado)
+        if suave:
+            modulos2[bloque] = modulos
+
+    if suave:
+        return iteraciones_suaves(cuentas, modulos2, grado, max_iter).reshape(forma)
+    return cuentas.reshape(forma)
+
+
+def _potencia_entera(zr, zi, zr2, zi2, grado, trabajo):
+    """
+    Calcula z**grado para un exponente entero mayor que 2 con la parte real y la
+    imaginaria por separado. zr2 y zi2 son zr² y zi², ya calculados.
+
+    Todas las operaciones escriben en los arrays de `trabajo` (6 del tamaño de z),
+    así que no se reserva memoria en cada iteración. Devuelve dos de ellos.
+    """
+    base_r, base_i, resultado_r, resultado_i, auxiliar, auxiliar2 = trabajo
+
+    if grado == 3:
+        # (zr + zi·i)³ = zr·(zr² - 3·zi²) + zi·(3·zr² - zi²)i
+        np.multiply(zi2, 3, out=auxiliar)
+        np.subtract(zr2, auxiliar, out=resultado_r)
+        resultado_r *= zr
+        np.multiply(zr2, 3, out=auxiliar)
+        auxiliar -= zi2
+        np.multiply(zi, auxiliar, out=resultado_i)
+        return resultado_r, resultado_i
+
+    # el primer cuadrado sale de zr² y zi²: z² = (zr² - zi²) + 2·zr·zi·i
+    np.subtract(zr2, zi2, out=base_r)
+    np.multiply(zr, zi, out=base_i)
+    base_i += base_i
+
+    if grado == 4:
+        # (z²)²
+        np.multiply(base_r, base_i, out=resultado_i)
+        resultado_i += resultado_i
+        np.multiply(base_r, base_r, out=resultado_r)
+        np.multiply(base_i, base_i, out=auxiliar)
+        resultado_r -= auxiliar
+        return resultado_r, resultado_i
+
+    # exponenciación por cuadrados: z**grado con log2(grado) cuadrados
+    hay_resultado = bool(grado & 1)
+    if hay_resultado:
+        resultado_r[:], resultado_i[:] = zr, zi
+    grado >>= 1
+    while True:
+        if grado & 1:
+            if hay_resultado:
+                # resultado *= base
+                np.multiply(resultado_r, base_i, out=auxiliar)
+                np.multiply(resultado_i, base_i, out=auxiliar2)
+                resultado_r *= base_r
+                resultado_r -= auxiliar2
+                resultado_i *= base_r
+                resultado_i += auxiliar
+            else:
+                resultado_r[:], resultado_i[:] = base_r, base_i
+                hay_resultado = True
+        grado >>= 1
+        if not grado:
+            return resultado_r, resultado_i
+        # base = base²
+        np.multiply(base_r, base_i, out=auxiliar)
+        base_r *= base_r
+        base_i *= base_i
+        base_r -= base_i
+        np.add(auxiliar, auxiliar, out=base_i)
+
+
+def _tiempo_escape_entero(zr, zi, cr, ci, max_iter, grado=2, periodicidad=False):
+    """
+    Núcleo para z**grado + c con grado entero, con la parte real y la imaginaria
+    por separado.
+
+    En cada iteración se calculan zr² y zi², que sirven tanto para comprobar si
+    el punto ha escapado como para calcular el siguiente z. En grado 2 los arrays
+    auxiliares se reservan una sola vez y las operaciones se hacen sobre ellos;
+    los demás grados usan `_potencia_entera`.
+
+    Con `periodicidad` se guarda un valor de z en las iteraciones potencia de 2 y
+    se compara con los siguientes (método de Brent): si la órbita vuelve a él, es
+    periódica y el punto no escapará nunca.
+
+    Los arrays de trabajo son del tipo de zr (float32 o float64). Devuelve las
+    iteraciones y |z|² de cada punto al escapar.
+    """
+    radio2 = RADIO_ESCAPE * RADIO_ESCAPE
+    tipo = zr.dtype
+    cuentas = np.full(zr.size, max_iter, dtype=np.int32)
+    modulos2 = np.zeros(zr.size)
+    activos = np.arange(zr.size)  # Índice en la imagen de cada punto, -1 si ya escapó
+    zr2, zi2, modulo2 = (np.empty(zr.size, dtype=tipo) for _ in range(3))
+    escapados = np.empty(zr.size, dtype=bool)
+    muertos = 0  # Puntos escapados que siguen en los arrays
+    if grado > 2:
+        # para `_potencia_entera`
+        trabajo = [np.empty(zr.size, dtype=tipo) for _ in range(6)]
+    if periodicidad:
+        # en float32 dos valores no pueden estar más cerca que unos pocos eps
+        tolerancia = max(TOLERANCIA_PERIODO, 4 * np.finfo(tipo).eps)
+        guardado_r, guardado_i = zr.copy(), zi.copy()  # z guardado de cada punto
+        diferencia = np.empty(zr.size, dtype=tipo)
+        repetidos = np.empty(zr.size, dtype=bool)
+        siguiente_guardado = 1
+
+    for iteracion in range(max_iter):
+        np.multiply(zr, zr, out=zr2)
+        np.multiply(zi, zi, out=zi2)
+        np.add(zr2, zi2, out=modulo2)
+        np.greater(modulo2, radio2, out=escapados)
+
+        if escapados.any():
+            indices = np.flatnonzero(escapados)
+            cuentas[activos[indices]] = iteracion
+            modulos2[activos[indices]] = modulo2[indices]
+            activos[indices] = -1
+            muertos += indices.size
+
+            if muertos * 4 > activos.size:
+                # quitar los escapados de los arrays cuando son bastantes
+                vivos = np.flatnonzero(activos >= 0)
+                if vivos.size == 0:
+                    break
+                activos, zr, zi, cr, ci = (
+                    activos[vivos], zr[vivos], zi[vivos], cr[vivos], ci[vivos]
+                )
+                zr2, zi2 = zr2[vivos], zi2[vivos]
+                modulo2, escapados = modulo2[: vivos.size], escapados[: vivos.size]
+                if grado > 2:
+                    trabajo = [array[: vivos.size] for array in trabajo]
+                if periodicidad:
+                    guardado_r, guardado_i = guardado_r[vivos], guardado_i[vivos]
+                    diferencia, repetidos = diferencia[: vivos.size], repetidos[: vivos.size]
+                muertos = 0
+            else:
+                # si son pocos, copiar los arrays cuesta más que seguir iterándolos:
+                # con z = c = 0 se quedan en 0 y no vuelven a escapar
+                for array in (zr, zi, cr, ci, zr2, zi2):
+                    array[indices] = 0
+                if periodicidad:
+                    # y con el valor guardado en infinito tampoco parecen periódicos
+                    guardado_r[indices] = np.inf
+
+        if grado == 2:
+            # z = z**2 + c  ->  (zr² - zi² + cr) + (2·zr·zi + ci)i
+            zi *= zr
+            zi += zi
+            zi += ci
+            np.subtract(zr2, zi2, out=zr)
+            zr += cr
+        else:
+            potencia_r, potencia_i = _potencia_entera(zr, zi, zr2, zi2, grado, trabajo)
+            np.add(potencia_r, cr, out=zr)
+            np.add(potencia_i, ci, out=zi)
+
+        if periodicidad:
+            np.subtract(zr, guardado_r, out=diferencia)
+            np.abs(diferencia, out=diferencia)
+            np.less(diferencia, tolerancia, out=repetidos)
+            np.subtract(zi, guardado_i, out=diferencia)
+            np.abs(diferencia, out=diferencia)
+            repetidos &= diferencia < tolerancia
+            if repetidos.any():
+                # se quedan con max_iter y se tratan como los escapados
+                indices = np.flatnonzero(repetidos)
+                activos[indices] = -1
+                muertos += indices.size
+                for array in (zr, zi, cr, ci):
+                    array[indices] = 0
+                guardado_r[indices] = np.inf
+
+            if iteracion + 1 == siguiente_guardado:
+                muertos_guardados = guardado_r == np.inf
+                guardado_r[:], guardado_i[:] = zr, zi
+                guardado_r[muertos_guardados] = np.inf
+                siguiente_guardado *= 2
+
+    return cuentas, modulos2
+
+
+def _tiempo_escape_polar(zr, zi, cr, ci, max_iter, grado):
+    """
+    Núcleo para exponentes no enteros, en forma polar: z**grado = |z|**grado ·
+    (cos(grado·θ) + sin(grado·θ)i), con |z|**grado = (|z|²)**(grado / 2), sin
+    raíces cuadradas y con la misma rama que la potencia compleja de Python.
+
+    Devuelve las iteraciones y |z|² de cada punto al escapar.
+    """
+    radio2 = RADIO_ESCAPE * RADIO_ESCAPE
+    cuentas = np.full(zr.size, max_iter, dtype=np.int32)
+    modulos2 = np.zeros(zr.size)
+    activos = np.arange(zr.size)
+    zr, zi, cr, ci = zr.copy(), zi.copy(), cr.copy(), ci.copy()
+
+    for iteracion in range(max_iter):
+        modulo2 = zr * zr + zi * zi
+        escapados = modulo2 > radio2
+        if escapados.any():
+            cuentas[activos[escapados]] = iteracion
+            modulos2[activos[escapados]] = modulo2[escapados]
+            seguir = ~escapados
+            activos = activos[seguir]
+            if activos.size == 0:
+                break
+            zr, zi, cr, ci = zr[seguir], zi[seguir], cr[seguir], ci[seguir]
+            modulo2 = modulo2[seguir]
+
+        angulo = np.arctan2(zi, zr)
+        angulo *= grado
+        modulo = modulo2 ** (grado / 2)
+        zr = modulo * np.cos(angulo) + cr
+        zi = modulo * np.sin(angulo) + ci
+
+    return cuentas, modulos2
+
+
+def mandelbrot(
+    x, y, max_iter, complejidad=2, cardioide=False, periodicidad=False, suave=False
+):
+    """
+    Calcula el conjunto de Mandelbrot (z0 = 0) sobre una rejilla.
+
+    Args:
+        x (np.ndarray): Parte real de cada columna.
+        y (np.ndarray): Parte imaginaria de cada fila.
+        max_iter (int): Número máximo de iteraciones.
+        complejidad (int): Exponente de z.
+        cardioide (bool): Descartar sin iterar el cardioide y el círculo de periodo 2
+            (solo se aplica con complejidad 2).
+        periodicidad (bool): Dejar de iterar las órbitas periódicas.
+        suave (bool): Devolver las iteraciones continuas.
+
+    Returns:
+        np.ndarray: Iteraciones (len(y) x len(x)).
+    """
+    cr = np.asarray(x)[np.newaxis, :]
+    ci = np.asarray(y)[:, np.newaxis]
+    return tiempo_escape(
+        0.0, 0.0, cr, ci, max_iter, complejidad, cardioide and complejidad == 2, periodicidad,
+        suave,
+    )
+
+
+def julia(x, y, c, max_iter, periodicidad=False, suave=False):
+    """
+    Calcula el conjunto de Julia de parámetro c sobre una rejilla.
+
+    Args:
+        x (np.ndarray): Parte real de cada columna.
+        y (np.ndarray): Parte imaginaria de cada fila.
+        c (complex): Parámetro del conjunto de Julia.
+        max_iter (int): Número máximo de iteraciones.
+        periodicidad (bool): Dejar de iterar las órbitas periódicas.
+        suave (bool): Devolver las iteraciones continuas.
+
+    Returns:
+        np.ndarray: Iteraciones (len(y) x len(x)).
+    """
+    zr = np.asarray(x)[np.newaxis, :]
+    zi = np.asarray(y)[:, np.newaxis]
+    return tiempo_escape(
+        zr, zi, c.real, c.imag, max_iter, periodicidad=periodicidad, suave=suave
+    )
@@ -0,0 +1,100 @@
+"""
+Archivo: nucleo_ifs.py
+
+Descripción:
+Este archivo contiene el cálculo de los puntos de los fractales IFS (sistemas de
+funciones iteradas) con el juego del caos, separado de las ventanas para poder
+usarlo sin interfaz gráfica.
+
+Características principales:
+- En lugar de un solo punto que salta N veces, se mueven a la vez muchos puntos
+  (cadenas) con NumPy, cada uno con su propia sucesión de funciones al azar.
+- Las primeras iteraciones de cada cadena (el umbral) no se guardan, para que los
+  puntos tengan tiempo de llegar al fractal.
+- Las probabilidades de las funciones pueden ser las indicadas o proporcionales al
+  determinante de cada función (el área que conserva).
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import math
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from constantes import Default  # Constantes predeterminadas.
+
+
+def probabilidades_ifs(lista_funciones: list, por_determinante: bool = False) -> np.ndarray:
+    """
+    Devuelve la probabilidad de elegir cada función.
+
+    Args:
+        lista_funciones (list): Funciones como (valores, probabilidad, color), con los
+            valores "a".."f" de la transformación afín.
+        por_determinante (bool): Si es True, las probabilidades son proporcionales a
+            |a·d - b·c| en lugar de las indicadas.
+
+    Returns:
+        np.ndarray: Probabilidades, que suman 1.
+    """
+    if por_determinante:
+        pesos = [
+            abs(float(v["a"]) * float(v["d"]) - float(v["b"]) * float(v["c"]))
+            for v, _, _ in lista_funciones
+        ]
+    else:
+        pesos = [float(probabilidad) for _, probabilidad, _ in lista_funciones]
+    pesos = np.array(pesos)
+    return pesos / pesos.sum()
+
+
+def puntos_ifs(
+    lista_funciones: list, iteraciones: int, umbral: int, por_determinante: bool = False,
+    cadenas: int = Default.IFS_CADENAS, semilla: int | None = None,
+):
+    """
+    Calcula puntos de un fractal IFS con el juego del caos.
+
+    Args:
+        lista_funciones (list): Funciones como (valores, probabilidad, color).
+        iteraciones (int): Número de puntos que se devuelven.
+        umbral (int): Iteraciones de cada cadena que no se guardan.
+        por_determinante (bool): Probabilidades proporcionales al determinante.
+        cadenas (int): Puntos que se mueven a la vez.
+        semilla (int | None): Semilla de los números aleatorios.
+
+    Returns:
+        tuple: Arrays x, y de los puntos y el índice de la función que generó cada uno.
+    """
+    valores = np.array(
+        [[float(v[clave]) for clave in "abcdef"] for v, _, _ in lista_funciones]
+    )
+    a, b, c, d, e, f = valores.T
+    probabilidades = probabilidades_ifs(lista_funciones, por_determinante)
+    generador = np.random.default_rng(semilla)
+
+    cadenas = max(min(cadenas, iteraciones), 1)
+    pasos = math.ceil(iteraciones / cadenas)
+    elegidas = generador.choice(
+        len(lista_funciones), size=(umbral + pasos, cadenas), p=probabilidades
+    )
+    x, y = np.zeros(cadenas), np.zeros(cadenas)  # El punto inicial
+    puntos_x = np.empty((pasos, cadenas))
+    puntos_y = np.empty((pasos, cadenas))
+    for paso, funcion in enumerate(elegidas):
+        # x' = a·x + c·y + e, y' = b·x + d·y + f, cada cadena con su función
+        x, y = (
+            a[funcion] * x + c[funcion] * y + e[funcion],
+            b[funcion] * x + d[funcion] * y + f[funcion],
+        )
+        if paso >= umbral:
+            puntos_x[paso - umbral], puntos_y[paso - umbral] = x, y
+
+    return (
+        puntos_x.ravel()[:iteraciones],
+        puntos_y.ravel()[:iteraciones],
+        elegidas[umbral:].ravel()[:iteraciones],
+    )
@@ -0,0 +1,243 @@
+"""
+Archivo: perturbacion.py
+
+Descripción:
+Este archivo contiene el cálculo del conjunto de Mandelbrot (grado 2) con zoom
+profundo, donde los píxeles están tan juntos que float64 ya no los distingue.
+
+Características principales:
+- Se calcula una sola órbita de referencia con `decimal`, con tantas cifras como
+  haga falta para el zoom, y se guarda en float64.
+- Cada píxel se itera en float64 como una diferencia δ con la órbita de referencia:
+  δ -> 2·Z·δ + δ² + δc. Las diferencias son pequeñas, pero float64 las guarda con
+  toda su precisión relativa (hasta unos 1e-300).
+- Detección de fallos (glitches) y cambio de referencia: cuando |z| < |δ| la
+  diferencia ya no es fiable, así que el píxel pasa a usar como diferencia su
+  propio z y vuelve al principio de la órbita de referencia. Lo mismo cuando la
+  órbita de referencia se acaba.
+- Aproximación por series: las primeras iteraciones de todos los píxeles se
+  sustituyen por un polinomio de grado 3 en δc, mientras sea preciso.
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+# Imports estándar
+import math
+from decimal import Decimal, localcontext
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from nucleo_fractal import (
+    PUNTOS_POR_BLOQUE,
+    RADIO_ESCAPE,
+    iteraciones_suaves,
+)  # Núcleo de tiempo de escape.
+
+# Cifras decimales de más, sobre las que pide el zoom, en la órbita de referencia
+CIFRAS_EXTRA = 20
+
+# Error relativo máximo del término siguiente de la serie frente al primero
+TOLERANCIA_SERIE = 1e-9
+
+
+def cifras_necesarias(distancia: float) -> int:
+    """Devuelve las cifras con las que hay que guardar puntos separados por `distancia`."""
+    return max(-math.floor(math.log10(distancia)), 0) + CIFRAS_EXTRA
+
+
+class OrbitaReferencia:
+    """
+    Órbita de alta precisión de un punto de referencia y la aproximación por series
+    de la zona que la rodea.
+
+    Se puede mandar a otros procesos: solo guarda floats y arrays de NumPy.
+
+    Atributos:
+        zr, zi (np.ndarray): Órbita de referencia Z_n en float64 (Z_0 = 0). Termina
+            en la primera iteración en la que escapa, o en max_iter.
+        radio (float): Distancia máxima de los píxeles a la referencia.
+        salto (int): Iteraciones que se sustituyen por la serie.
+        serie (tuple): Coeficientes (a, b, c) de la serie en la iteración `salto`,
+            ya multiplicados por radio, radio² y radio³.
+    """
+
+    def __init__(self, centro_r, centro_i, radio: float, max_iter: int) -> None:
+        """
+        Calcula la órbita de referencia y la serie.
+
+        Args:
+            centro_r, centro_i (str | Decimal | float): Punto de referencia. Como
+                texto o Decimal se usan todas sus cifras.
+            radio (float): Distancia máxima de los píxeles a la referencia.
+            max_iter (int): Número máximo de iteraciones.
+        """
+        self.radio = float(radio)
+        self.zr, self.zi = self._calcular_orbita(centro_r, centro_i, max_iter)
+        self.salto, self.serie = self._calcular_serie()
+
+    def _calcular_orbita(self, centro_r, centro_i, max_iter):
+        """Itera la referencia con `decimal` y devuelve la órbita en float64."""
+        orbita_r, orbita_i = [0.0], [0.0]
+        limite = Decimal(RADIO_ESCAPE * RADIO_ESCAPE)
+        with localcontext() as contexto:
+            contexto.prec = cifras_necesarias(self.radio)
+            cr, ci = Decimal(centro_r), Decimal(centro_i)
+            zr = zi = Decimal(0)
+            for _ in range(max_iter):
+                zr, zi = zr * zr - zi * zi + cr, 2 * zr * zi + ci
+                orbita_r.append(float(zr))
+                orbita_i.append(float(zi))
+                if zr * zr + zi * zi > limite:
+                    break
+        return np.array(orbita_r), np.array(orbita_i)
+
+    def _calcular_serie(self):
+        """
+        Avanza la serie δ_n ≈ a·u + b·u² + c·u³ (u = δc / radio) mientras el término
+        de grado 3 sea despreciable y ningún píxel pueda haber escapado.
+        """
+        a = b = c = 0j
+        salto = 0
+        for n in range(self.zr.size - 1):
+            z = complex(self.zr[n], self.zi[n])
+            # δ_{n+1} = 2·Z_n·δ_n + δ_n² + δc, agrupando por potencias de u
+            siguiente = (2 * z * a + self.radio, 2 * z * b + a * a, 2 * z * c + 2 * a * b)
+            a1, b1, c1 = siguiente
+            if abs(c1) > TOLERANCIA_SERIE * abs(a1):
+                break
+            z1 = complex(self.zr[n + 1], self.zi[n + 1])
+            if abs(z1) + abs(a1) + abs(b1) + abs(c1) > RADIO_ESCAPE:
+                break
+            a, b, c = siguiente
+            salto = n + 1
+        return salto, (a, b, c)
+
+
+def tiempo_escape_perturbacion(dr, di, orbita: OrbitaReferencia, max_iter, suave=False):
+    """
+    Calcula las iteraciones de Mandelbrot de grado 2 de los puntos referencia + δc.
+
+    Da lo mismo que `nucleo_fractal.tiempo_escape` con los puntos en precisión
+    exacta, aunque estén más juntos de lo que float64 puede distinguir.
+
+    Args:
+        dr, di (np.ndarray): Parte real e imaginaria de la distancia δc de cada
+            punto a la referencia.
+        orbita (OrbitaReferencia): Órbita de referencia.
+        max_iter (int): Número máximo de iteraciones.
+        suave (bool): Si es True, devuelve las iteraciones continuas (float32).
+
+    Returns:
+        np.ndarray: Iteraciones de cada punto (int32, o float32 si `suave`), con
+            la forma de dr y di.
+    """
+    forma = np.broadcast_shapes(np.shape(dr), np.shape(di))
+    cr, ci = (
+        np.broadcast_to(np.asarray(a, dtype=np.float64), forma).ravel() for a in (dr, di)
+    )
+
+    # las primeras iteraciones se saltan con la serie
+    a, b, c = orbita.serie
+    u = (cr + 1j * ci) / orbita.radio
+    delta = ((c * u + b) * u + a) * u
+
+    cuentas = np.empty(cr.size, dtype=np.int32)
+    modulos2 = np.empty(cr.size)  # |z|² de cada punto al escapar
+    for inicio in range(0, cr.size, PUNTOS_POR_BLOQUE):
+        bloque = slice(inicio, inicio + PUNTOS_POR_BLOQUE)
+        cuentas[bloque], modulos2[bloque] = _tiempo_escape_bloque(
+            cr[bloque], ci[bloque], delta.real[bloque], delta.imag[bloque], orbita, max_iter
+        )
+
+    if suave:
+        return iteraciones_suaves(cuentas, modulos2, 2, max_iter).reshape(forma)
+    return cuentas.reshape(forma)
+
+
+def _tiempo_escape_bloque(cr, ci, delta_r, delta_i, orbita, max_iter):
+    """
+    Itera las diferencias de un bloque de puntos desde la iteración `orbita.salto`.
+
+    Como en `nucleo_fractal`, los puntos que escapan se quitan de los arrays solo
+    cuando son bastantes, y los arrays auxiliares se reservan una sola vez.
+    Devuelve las iteraciones y |z|² de cada punto al escapar.
+    """
+    radio2 = RADIO_ESCAPE * RADIO_ESCAPE
+    ultimo = orbita.zr.size - 1
+    cuentas = np.full(cr.size, max_iter, dtype=np.int32)
+    modulos2 = np.zeros(cr.size)
+    activos = np.arange(cr.size)  # Índice de cada punto en el bloque, -1 si ya escapó
+    referencia = np.full(cr.size, orbita.salto)  # Iteración de la órbita que usa cada punto
+    cr, ci, delta_r, delta_i = (array.copy() for array in (cr, ci, delta_r, delta_i))
+    zr, zi, modulo2, auxiliar = (np.empty(cr.size) for _ in range(4))
+    escapados, cambiar = np.empty(cr.size, dtype=bool), np.empty(cr.size, dtype=bool)
+    muertos = 0  # Puntos escapados que siguen en los arrays
+
+    for iteracion in range(orbita.salto, max_iter):
+        # z = Z + δ
+        np.take(orbita.zr, referencia, out=zr)
+        np.take(orbita.zi, referencia, out=zi)
+        zr += delta_r
+        zi += delta_i
+        np.multiply(zr, zr, out=modulo2)
+        np.multiply(zi, zi, out=auxiliar)
+        modulo2 += auxiliar
+        np.greater(modulo2, radio2, out=escapados)
+
+        if escapados.any():
+            indices = np.flatnonzero(escapados)
+            cuentas[activos[indices]] = iteracion
+            modulos2[activos[indices]] = modulo2[indices]
+            activos[indices] = -1
+            muertos += indices.size
+
+            if muertos * 4 > activos.size:
+                # quitar los escapados de los arrays cuando son bastantes
+                vivos = np.flatnonzero(activos >= 0)
+                if vivos.size == 0:
+                    break
+                activos, referencia, cr, ci = (
+                    activos[vivos], referencia[vivos], cr[vivos], ci[vivos]
+                )
+                delta_r, delta_i, zr, zi = delta_r[vivos], delta_i[vivos], zr[vivos], zi[vivos]
+                modulo2, auxiliar = modulo2[vivos], auxiliar[: vivos.size]
+                escapados, cambiar = escapados[: vivos.size], cambiar[: vivos.size]
+                muertos = 0
+            else:
+                # si son pocos, se convierten en el punto c = 0, que se queda en
+                # z = 0: su δc es -Z_1 y su δ sigue a la referencia hasta Z_0
+                cr[indices], ci[indices] = -orbita.zr[1], -orbita.zi[1]
+                for array in (delta_r, delta_i, zr, zi, modulo2):
+                    array[indices] = 0
+                referencia[indices] = 0
+
+        # fallo: el punto está más cerca de 0 que de la referencia, o la referencia
+        # se ha acabado. Se sigue con z como diferencia respecto a Z_0 = 0
+        np.multiply(delta_r, delta_r, out=auxiliar)
+        auxiliar += delta_i * delta_i
+        np.less(modulo2, auxiliar, out=cambiar)
+        cambiar |= referencia == ultimo
+        if cambiar.any():
+            indices = np.flatnonzero(cambiar)
+            delta_r[indices], delta_i[indices] = zr[indices], zi[indices]
+            referencia[indices] = 0
+
+        # δ -> (2·Z + δ)·δ + δc, con 2·Z + δ = 2·z - δ
+        zr += zr
+        zr -= delta_r
+        zi += zi
+        zi -= delta_i
+        np.multiply(zr, delta_r, out=modulo2)
+        np.multiply(zi, delta_i, out=auxiliar)
+        modulo2 -= auxiliar
+        modulo2 += cr
+        np.multiply(zr, delta_i, out=auxiliar)
+        zi *= delta_r
+        np.add(auxiliar, zi, out=delta_i)
+        delta_i += ci
+        delta_r, modulo2 = modulo2, delta_r
+        referencia += 1
+
+    return cuentas, modulos2
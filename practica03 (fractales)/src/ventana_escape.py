@@ -0,0 +1,496 @@
+"""
+Archivo: ventana_escape.py
+
+Descripción:
+Este archivo contiene la clase `VentanaEscape`, la ventana común de los fractales de
+tiempo de escape (Mandelbrot y Julia).
+
+Características principales:
+- Calcula el fractal en los procesos de `motor_fractal` sin bloquear la ventana.
+- Dibuja de forma progresiva: primero 1 de cada 16 píxeles, luego 1 de cada 4 y
+  por último todos, reutilizando en cada pasada los píxeles ya calculados.
+- Cada pasada actualiza la misma imagen de Matplotlib en lugar de crear otra.
+- Las iteraciones (continuas por defecto) se colorean con una tabla de colores
+  precalculada directamente en una imagen RGBA, sin los mapas de Matplotlib.
+- Al hacer zoom o mover la vista se vuelve a calcular a la resolución del canvas,
+  cuando el usuario deja de moverla, y se cancelan los cálculos de vistas viejas.
+- La vista se compone con teselas de un árbol cuaternario que se guardan en una
+  caché, así que solo se calculan las que faltan.
+- Con zoom poco profundo se calcula en float32 y, al acercarse, en float64
+  (se puede fijar una de las dos).
+- El número máximo de iteraciones crece con la profundidad del zoom y, si en la
+  primera pasada quedan muchos píxeles sin decidir, se duplica y se vuelve a
+  empezar. Se muestra por consola el que se usa.
+- Con zoom profundo (si el fractal lo admite) los ejes pasan a ser distancias a un
+  centro guardado con `decimal`, y la vista se calcula por perturbación.
+
+Autor: Gabriel Gómez García
+Fecha: 19 de Octubre de 2026
+"""
+
+import math
+from decimal import Decimal, localcontext
+
+import numpy as np  # Para cálculos numéricos avanzados.
+
+# Imports locales
+from ventana_fractal import VentanaFractal  # Clase base para ventanas.
+from constantes import Default, Texts  # Constantes y textos predeterminados.
+from nucleo_fractal import (
+    PRECISION_FLOAT64,
+    elegir_precision,
+    faltan_iteraciones,
+    iteraciones_para_zoom,
+)  # Precisión e iteraciones del cálculo.
+from motor_fractal import (
+    ALGORITMO_DISTANCIA,
+    ALGORITMO_FUERZA_BRUTA,
+    ALGORITMO_MARIANI_SILVER,
+    TIPO_MANDELBROT_PROFUNDO,
+    ImagenCompartida,
+    dividir_en_teselas,
+    enviar_tareas,
+)  # Cálculo por teselas.
+from perturbacion import OrbitaReferencia, cifras_necesarias  # Zoom profundo.
+from colores import colorear, crear_lut  # Colores de las iteraciones.
+from cache_teselas import (
+    CacheTeselas,
+    nivel_para,
+    tamanho_tesela,
+    teselas_visibles,
+)  # Teselas ya calculadas.
+
+
+class VentanaEscape(VentanaFractal):
+    """
+    Ventana para fractales de tiempo de escape que se dibujan de forma progresiva.
+
+    Las clases hijas indican qué fractal calcular con `_tipo_fractal`,
+    `_parametro_fractal` y `_mapa_colores`, fijan los límites (x_min, x_max,
+    y_min, y_max) y `max_iter` (las iteraciones de la vista inicial), y llaman a
+    `_renderizar_vista`.
+
+    Atributos:
+        imagen (ImagenCompartida): Iteraciones de las teselas que se están calculando.
+        cache (CacheTeselas): Teselas ya calculadas.
+        algoritmo (str): Algoritmo de `motor_fractal` con el que se calculan las teselas.
+        origen (tuple | None): Con zoom profundo, el punto (Decimal, Decimal) al que
+            son relativos los ejes. None con zoom normal.
+        suave (bool): Calcular las iteraciones continuas, para colorear sin bandas.
+        ecualizar (bool): Ecualizar el histograma de colores.
+        precision (str): "float32", "float64" o "auto" (según el zoom).
+        iteraciones (int | None): Número máximo de iteraciones de la vista actual.
+        iteraciones_adaptativas (bool): Ajustar las iteraciones al zoom y a la primera
+            pasada. Si es False, se usa siempre `max_iter`.
+    """
+
+    def __init__(
+        self,
+        width: int = Default.WINDOW_WIDTH,
+        height: int = Default.WINDOW_HEIGHT,
+        title: str = Default.WINDOW_TITLE,
+        algoritmo: str = Default.FRACTAL_ALGORITMO,
+    ) -> None:
+        """
+        Inicializa una nueva instancia de la clase VentanaEscape.
+
+        Args:
+            width (int): Ancho de la ventana en píxeles. Valor por defecto definido en Default.WINDOW_WIDTH.
+            height (int): Alto de la ventana en píxeles. Valor por defecto definido en Default.WINDOW_HEIGHT.
+            title (str): Título de la ventana. Valor por defecto definido en Default.WINDOW_TITLE.
+            algoritmo (str): Algoritmo de cálculo (uno de Default.JULIA_MODOS_ALGORITMO).
+        """
+        super().__init__(width, height, title)
+        self.imagen = None
+        self.cache = CacheTeselas()
+        self.algoritmo = algoritmo
+        self.origen = None
+        self.suave = Default.FRACTAL_SUAVE
+        self.ecualizar = Default.FRACTAL_ECUALIZAR
+        self.precision = Default.FRACTAL_PRECISION
+        self.iteraciones = None
+        self.iteraciones_adaptativas = Default.FRACTAL_ITER_ADAPTATIVAS
+        self._lut = None  # Tabla de colores, se crea al mostrar la primera imagen
+        self._mosaico = None  # Teselas de la vista, juntas en una sola imagen
+        self._extension = None  # Límites del mosaico en el plano complejo
+        self._pendientes = []  # Teselas que no estaban en la caché
+        self._artista = None  # Imagen de Matplotlib que se actualiza en cada pasada
+        self._ajustar_limites = True  # Los ejes tienen que pasar a mostrar la vista pedida
+        self._calculo = None  # Tipo, parámetro y precisión del cálculo en curso
+        self._precision_usada = None  # Precisión de la última vista, para avisar al cambiar
+        self._anchura_inicial = None  # Anchura de la primera vista, para medir el zoom
+        self._iteraciones_zoom = None  # Iteraciones que corresponden al zoom actual
+        self._zona_iteraciones = None  # Zoom y zona de la vista actual, para recordarlas
+        self._iteraciones_subidas = {}  # Zoom y zona -> iteraciones que hicieron falta
+        self._sin_decidir = None  # Píxeles sin decidir antes de subir las iteraciones
+        self._tareas = []  # Zonas de la imagen compartida y sus coordenadas
+        self._pasos = []  # Pasadas que faltan por calcular
+        self._paso_anterior = None
+        self._futuros = []  # Teselas de la pasada en curso
+        self._avisado = False  # Si ya se ha avisado de que la vista se dibuja mal
+        self._generacion = 0  # Número del cálculo en curso; los anteriores se ignoran
+        self._espera_vista = None  # Recalculo programado tras un zoom o arrastre
+
+        self._ventana.protocol("WM_DELETE_WINDOW", self.cerrar_ventana)
+
+    def _tipo_fractal(self) -> str:
+        """Devuelve el tipo de fractal para `motor_fractal`. Debe implementarlo la clase hija."""
+        raise NotImplementedError
+
+    def _parametro_fractal(self):
+        """Devuelve el exponente (Mandelbrot) o el c (Julia). Debe implementarlo la clase hija."""
+        raise NotImplementedError
+
+    def _mapa_colores(self) -> str:
+        """Devuelve el mapa de colores de Matplotlib. Debe implementarlo la clase hija."""
+        raise NotImplementedError
+
+    def _admite_zoom_profundo(self) -> bool:
+        """Indica si el fractal se puede calcular por perturbación (Mandelbrot de grado 2)."""
+        return False
+
+    def _resolucion(self) -> tuple[int, int]:
+        """Devuelve el ancho y el alto en píxeles de la zona del gráfico en el canvas."""
+        bbox = self.ax.bbox
+        return max(int(round(bbox.width)), 1), max(int(round(bbox.height)), 1)
+
+    def _vista_cambiada(self) -> None:
+        """Programa el recálculo de la vista, retrasándolo mientras siga cambiando."""
+        if self._espera_vista is not None:
+            self._ventana.after_cancel(self._espera_vista)
+        self._espera_vista = self._ventana.after(
+            Default.FRACTAL_ESPERA_VISTA_MS, self._renderizar_vista_actual
+        )
+
+    def _renderizar_vista_actual(self) -> None:
+        """Recalcula el fractal con los límites que tiene ahora el gráfico."""
+        self._espera_vista = None
+        self.x_min, self.x_max = self.ax.get_xlim()
+        self.y_min, self.y_max = self.ax.get_ylim()
+        self._renderizar_vista()
+
+    def _renderizar_vista(self) -> None:
+        """
+        Muestra la vista actual con las teselas de la caché y empieza a calcular las
+        que faltan, de la pasada más gruesa a la completa.
+        """
+        # el cálculo anterior deja de interesar: sus teselas pendientes se cancelan
+        # y las que ya están en marcha escriben en una imagen que ya no se usa
+        self._generacion += 1
+        self._liberar_imagen()
+        self._sin_decidir = None
+        self._avisado = False
+
+        width, height = self._resolucion()
+        tamanho_pixel = max(
+            (self.x_max - self.x_min) / width, (self.y_max - self.y_min) / height
+        )
+        self._elegir_iteraciones()
+        if self._admite_zoom_profundo() and tamanho_pixel < Default.FRACTAL_PIXEL_PROFUNDO:
+            self._renderizar_vista_profunda(width, height, tamanho_pixel)
+            return
+        if self.origen is not None:
+            # vuelta al zoom normal: los ejes vuelven a ser coordenadas absolutas
+            origen_r, origen_i = (float(valor) for valor in self.origen)
+            self.x_min, self.x_max = self.x_min + origen_r, self.x_max + origen_r
+            self.y_min, self.y_max = self.y_min + origen_i, self.y_max + origen_i
+            self.origen = None
+            self._ajustar_limites = True
+
+        # nivel del árbol con píxeles al menos tan pequeños como los del canvas
+        nivel = nivel_para(tamanho_pixel)
+        tx0, ty0, n_x, n_y = teselas_visibles(
+            self.x_min, self.x_max, self.y_min, self.y_max, nivel
+        )
+        lado = tamanho_tesela(nivel)
+        pixeles = Default.FRACTAL_TESELA
+        precision = self._elegir_precision(lado / pixeles)
+        fractal = (
+            self._tipo_fractal(), self._parametro_fractal(), self.suave, self.algoritmo,
+            precision,
+        )
+
+        self._mosaico = np.zeros((n_y * pixeles, n_x * pixeles), dtype=self._tipo_mosaico())
+        self._extension = (tx0 * lado, (tx0 + n_x) * lado, ty0 * lado, (ty0 + n_y) * lado)
+        self._pendientes = []
+        for j in range(n_y):
+            for i in range(n_x):
+                clave = (fractal, nivel, tx0 + i, ty0 + j)
+                zona = self._mosaico[
+                    j * pixeles : (j + 1) * pixeles, i * pixeles : (i + 1) * pixeles
+                ]
+                cuentas = self.cache.obtener(clave, self.iteraciones)
+                if cuentas is None:
+                    # mientras se calcula, se muestra ampliada su antecesora si la hay
+                    cuentas = self.cache.aproximar(clave, self.iteraciones)
+                    # fila en la que irá dentro de la imagen compartida
+                    fila0 = len(self._pendientes) * pixeles
+                    self._pendientes.append(
+                        (clave, zona, cuentas is not None, (fila0, fila0 + pixeles))
+                    )
+                if cuentas is not None:
+                    zona[:] = cuentas
+        self._mostrar_imagen()
+        if not self._pendientes:
+            return
+
+        # las teselas que faltan se calculan una debajo de otra en la imagen compartida
+        self.imagen = ImagenCompartida(pixeles, len(self._pendientes) * pixeles, self.suave)
+        distancia = lado / pixeles
+        self._tareas = [
+            (
+                (k * pixeles, (k + 1) * pixeles, 0, pixeles),
+                tx * lado + distancia / 2,  # centro del primer píxel
+                distancia,
+                ty * lado + distancia / 2,
+                distancia,
+            )
+            for k, ((_, _, tx, ty), _, _, _) in enumerate(self._pendientes)
+        ]
+        self._calculo = (self._tipo_fractal(), self._parametro_fractal(), precision)
+        self._empezar_pasadas()
+
+    def _renderizar_vista_profunda(self, width, height, tamanho_pixel) -> None:
+        """
+        Calcula la vista por perturbación, sin caché, con los ejes relativos al centro
+        de la vista.
+
+        Args:
+            width, height (int): Tamaño de la vista en píxeles.
+            tamanho_pixel (float): Lado de un píxel en el plano complejo.
+        """
+        # el centro de la vista pasa a ser el origen de los ejes y la referencia
+        centro_x, centro_y = (self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2
+        origen_r, origen_i = self.origen or (Decimal(0), Decimal(0))
+        with localcontext() as contexto:
+            contexto.prec = cifras_necesarias(tamanho_pixel)
+            self.origen = (origen_r + Decimal(centro_x), origen_i + Decimal(centro_y))
+        medio_ancho = (self.x_max - self.x_min) / 2
+        medio_alto = (self.y_max - self.y_min) / 2
+        self.x_min, self.x_max = -medio_ancho, medio_ancho
+        self.y_min, self.y_max = -medio_alto, medio_alto
+        print(
+            f"Zoom profundo: centro {self.origen[0]} {self.origen[1]}, "
+            f"radio {medio_ancho:.3e}"
+        )
+
+        # la imagen que se ve se mueve a los nuevos ejes mientras se calcula la nueva
+        if self._artista is not None:
+            x0, x1, y0, y1 = self._artista.get_extent()
+            self._artista.set_extent((x0 - centro_x, x1 - centro_x, y0 - centro_y, y1 - centro_y))
+        self.ax.set_xlim(self.x_min, self.x_max)
+        self.ax.set_ylim(self.y_min, self.y_max)
+        self.canvas.draw_idle()
+
+        self._mosaico = np.zeros((height, width), dtype=self._tipo_mosaico())
+        self._extension = (self.x_min, self.x_max, self.y_min, self.y_max)
+        self._pendientes = [(None, self._mosaico, False, (0, height))]
+
+        self.imagen = ImagenCompartida(width, height, self.suave)
+        dx, dy = 2 * medio_ancho / width, 2 * medio_alto / height
+        self._tareas = [
+            (
+                tesela,
+                self.x_min + (tesela[2] + 0.5) * dx,  # centro del primer píxel
+                dx,
+                self.y_min + (tesela[0] + 0.5) * dy,
+                dy,
+            )
+            for tesela in dividir_en_teselas(width, height, Default.FRACTAL_TESELA)
+        ]
+        orbita = OrbitaReferencia(
+            *self.origen, math.hypot(medio_ancho, medio_alto), self.iteraciones
+        )
+        self._calculo = (TIPO_MANDELBROT_PROFUNDO, orbita, PRECISION_FLOAT64)
+        self._empezar_pasadas()
+
+    def _elegir_precision(self, tamanho_pixel: float) -> str:
+        """
+        Devuelve la precisión con la que calcular píxeles de `tamanho_pixel` y avisa
+        por consola cuando cambia.
+        """
+        precision = elegir_precision(self.precision, tamanho_pixel)
+        if precision != self._precision_usada:
+            print(f"Precisión del cálculo: {precision}")
+            self._precision_usada = precision
+        return precision
+
+    def _elegir_iteraciones(self) -> None:
+        """
+        Fija las iteraciones de la vista actual según su zoom respecto a la inicial, o
+        las que hicieron falta la última vez con ese zoom en la misma zona, y avisa por
+        consola cuando cambian.
+        """
+        anchura = max(self.x_max - self.x_min, self.y_max - self.y_min)
+        if self._anchura_inicial is None:
+            self._anchura_inicial = anchura
+        zoom = self._anchura_inicial / anchura
+        if self.iteraciones_adaptativas:
+            self._iteraciones_zoom = iteraciones_para_zoom(self.max_iter, zoom)
+            # zona de la rejilla de celdas del tamaño de la vista en la que está su
+            # centro: lo que hizo falta en un sitio no sirve para otro
+            origen_r, origen_i = (float(valor) for valor in self.origen or (0, 0))
+            centro_x = (self.x_min + self.x_max) / 2 + origen_r
+            centro_y = (self.y_min + self.y_max) / 2 + origen_i
+            self._zona_iteraciones = (
+                self._iteraciones_zoom, round(centro_x / anchura), round(centro_y / anchura)
+            )
+            iteraciones = self._iteraciones_subidas.get(
+                self._zona_iteraciones, self._iteraciones_zoom
+            )
+        else:
+            iteraciones = self.max_iter
+        if iteraciones != self.iteraciones:
+            print(f"Iteraciones máximas: {iteraciones} (zoom {zoom:.3g}x)")
+            self.iteraciones = iteraciones
+
+    def _subir_iteraciones(self) -> bool:
+        """
+        Mira la primera pasada y, si muchos píxeles se han quedado sin decidir, duplica
+        las iteraciones para este zoom y esta zona y vuelve a calcular la vista.
+
+        Returns:
+            bool: True si se ha vuelto a empezar la vista.
+        """
+        # solo fuerza bruta y Mariani-Silver dan tiempos de escape que se puedan medir
+        if (
+            not self.iteraciones_adaptativas
+            or self.algoritmo not in (ALGORITMO_FUERZA_BRUTA, ALGORITMO_MARIANI_SILVER)
+            or self.iteraciones >= Default.FRACTAL_ITER_MAXIMO
+        ):
+            return False
+        paso = self._pasos[0]
+        muestra = np.concatenate(
+            [
+                self.imagen.img[fila0:fila1][::paso, ::paso].ravel()
+                for _, _, _, (fila0, fila1) in self._pendientes
+            ]
+        )
+        if not faltan_iteraciones(muestra, self.iteraciones, self._sin_decidir):
+            return False
+        sin_decidir = np.count_nonzero(muestra >= self.iteraciones) / muestra.size
+        nuevas = min(2 * self.iteraciones, Default.FRACTAL_ITER_MAXIMO)
+        print(
+            f"Muchos píxeles sin decidir con {self.iteraciones} iteraciones: "
+            f"se sube a {nuevas}"
+        )
+        self._iteraciones_subidas[self._zona_iteraciones] = nuevas
+        self._renderizar_vista()
+        self._sin_decidir = sin_decidir  # Para comparar con la siguiente primera pasada
+        return True
+
+    def _tipo_mosaico(self):
+        """Devuelve el tipo de las iteraciones: continuas (float32) o enteras (int32)."""
+        return np.float32 if self.suave else np.int32
+
+    def _empezar_pasadas(self) -> None:
+        """Empieza a calcular las pasadas de `self._tareas`."""
+        # Mariani-Silver y la iteración inversa necesitan la tesela entera, así que
+        # se calculan en una pasada
+        if self.algoritmo in (ALGORITMO_FUERZA_BRUTA, ALGORITMO_DISTANCIA):
+            self._pasos = list(Default.FRACTAL_PASOS)
+        else:
+            self._pasos = [1]
+        self._paso_anterior = None
+        self._lanzar_pasada()
+
+    def _lanzar_pasada(self) -> None:
+        """Manda a los procesos la siguiente pasada y espera a que termine."""
+        tipo, parametro, precision = self._calculo
+        self._futuros = enviar_tareas(
+            self.imagen,
+            self._tareas,
+            tipo,
+            parametro,
+            self.iteraciones,
+            paso=self._pasos[0],
+            paso_anterior=self._paso_anterior,
+            algoritmo=self.algoritmo,
+            precision=precision,
+        )
+        self._ventana.after(
+            Default.FRACTAL_SONDEO_MS, self._comprobar_pasada, self._generacion
+        )
+
+    def _comprobar_pasada(self, generacion: int) -> None:
+        """
+        Muestra la pasada si ya ha terminado y lanza la siguiente.
+
+        Args:
+            generacion (int): Cálculo al que pertenece la pasada.
+        """
+        if generacion != self._generacion:
+            return  # La vista ha cambiado desde que se lanzó
+        if not all(futuro.done() for _, futuro in self._futuros):
+            self._ventana.after(
+                Default.FRACTAL_SONDEO_MS, self._comprobar_pasada, generacion
+            )
+            return
+
+        # result() también hace que se vean los errores de los procesos
+        avisos = [futuro.result() for _, futuro in self._futuros]
+        self._futuros = []
+        if any(avisos) and not self._avisado:
+            print(Texts.JULIA_AVISO_MIIM)
+            self._avisado = True
+        if self._paso_anterior is None and self._subir_iteraciones():
+            return
+
+        paso = self._pasos.pop(0)
+        self._paso_anterior = paso
+        for clave, zona, aproximada, (fila0, fila1) in self._pendientes:
+            cuentas = self.imagen.img[fila0:fila1]
+            if paso == 1:
+                zona[:] = cuentas
+                if clave is not None:
+                    self.cache.guardar(clave, cuentas, self.iteraciones)
+            elif not aproximada:
+                # cada píxel calculado se repite en los que aún faltan a su lado
+                gruesa = cuentas[::paso, ::paso]
+                ampliada = np.repeat(np.repeat(gruesa, paso, axis=0), paso, axis=1)
+                zona[:] = ampliada[: zona.shape[0], : zona.shape[1]]
+        self._mostrar_imagen()
+
+        if self._pasos:
+            self._lanzar_pasada()
+        else:
+            self._liberar_imagen()
+
+    def _mostrar_imagen(self) -> None:
+        """Muestra el mosaico de teselas tal y como está ahora."""
+        if self._lut is None:
+            self._lut = crear_lut(self._mapa_colores())
+        colores = colorear(self._mosaico, self.iteraciones, self._lut, self.ecualizar)
+
+        # la fila 0 es la de menor y, así que el origen de la imagen va abajo
+        if self._artista is None:
+            self._artista = self.ax.imshow(
+                colores,
+                extent=self._extension,
+                origin="lower",
+                interpolation="nearest",
+            )
+        else:
+            self._artista.set_data(colores)
+            self._artista.set_extent(self._extension)
+        if self._ajustar_limites:
+            # el mosaico es más grande que la vista: se ve solo la parte pedida
+            self.ax.set_xlim(self.x_min, self.x_max)
+            self.ax.set_ylim(self.y_min, self.y_max)
+            self._ajustar_limites = False
+        self.canvas.draw_idle()
+
+    def _liberar_imagen(self) -> None:
+        """Libera la memoria compartida de la imagen actual."""
+        if self.imagen is not None:
+            # las teselas pendientes se cancelan; las que ya se han mandado a un
+            # proceso abren la memoria por su nombre, así que se libera cuando acaben
+            self.imagen.liberar_al_terminar(futuro for _, futuro in self._futuros)
+            self._futuros = []
+            self.imagen = None
+
+    def cerrar_ventana(self) -> None:
+        """Libera la imagen compartida y cierra la ventana."""
+        self._generacion += 1
+        self._liberar_imagen()
+        super().cerrar_ventana()
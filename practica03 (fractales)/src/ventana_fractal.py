@@ -105,6 +105,10 @@ class VentanaFractal(Ventana):
         self.canvas.get_tk_widget().bind(UserEvents.LEFT_RELEASE, self.on_release)
         self.canvas.get_tk_widget().bind(UserEvents.RIGHT_RELEASE, self.on_release)
 
+        # Arrastrar con la rueda del ratón pulsada para mover la vista
+        self.canvas.get_tk_widget().bind(UserEvents.MOUSE_WHEEL_PRESS, self.on_drag_start)
+        self.canvas.get_tk_widget().bind(UserEvents.MOUSE_WHEEL_DRAG, self.on_drag)
+
         # Llamar al método para generar el fractal según el algoritmo seleccionado
         self._generar_fractal()
 
@@ -128,6 +132,26 @@ class VentanaFractal(Ventana):
         """Activa la desaceleración al soltar el botón del ratón."""
         self.zooming = False
 
+    def on_drag_start(self, evento):
+        """Guarda dónde empieza el arrastre de la vista."""
+        self.mouse_x, self.mouse_y = evento.x, evento.y
+
+    def on_drag(self, evento):
+        """Mueve la vista lo mismo que se ha movido el ratón."""
+        # Convertir el desplazamiento en píxeles a unidades del gráfico
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        bbox = self.ax.bbox
+        dx = (evento.x - self.mouse_x) * (xlim[1] - xlim[0]) / bbox.width
+        dy = (evento.y - self.mouse_y) * (ylim[1] - ylim[0]) / bbox.height
+        self.mouse_x, self.mouse_y = evento.x, evento.y
+
+        # La Y del canvas crece hacia abajo y la del gráfico hacia arriba
+        self.ax.set_xlim(xlim[0] - dx, xlim[1] - dx)
+        self.ax.set_ylim(ylim[0] + dy, ylim[1] + dy)
+        self.canvas.draw_idle()
+        self._vista_cambiada()
+
     def _apply_zoom(self):
         """Gestiona el zoom continuo con aceleración y desaceleración."""
         if self.zooming:
@@ -193,6 +217,14 @@ class VentanaFractal(Ventana):
 
         # Redibujar el canvas con los nuevos límites
         self.canvas.draw()
+        self._vista_cambiada()
+
+    def _vista_cambiada(self) -> None:
+        """
+        Se llama cada vez que el zoom o el arrastre cambian los límites del gráfico.
+        Las clases que puedan recalcular el fractal para la nueva vista lo sobrescriben.
+        """
+        pass
 
     # @abstracmethod
     def _generar_fractal(self) -> None:
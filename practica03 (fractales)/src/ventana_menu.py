@@ -261,6 +261,7 @@ class VentanaMenu(Ventana):
         self.julia_ymax = None
         self.julia_color = None
         self.julia_color_seleccionado = Texts.JULIA_COLORES_DEFAULT
+        self.julia_modo_seleccionado = Texts.JULIA_MODOS_DEFAULT
 
         frame_julia = self._crear_frame_seccion(parent_frame, titulo)
         frame_julia.grid(row=2, column=0, pady=(10, 0), padx=10, sticky="nsew")
@@ -317,6 +318,20 @@ class VentanaMenu(Ventana):
             row=4, column=3, pady=(10, 5), padx=(5, 10), sticky="ew"
         )
 
+        # Menú desplegable para elegir cómo se dibuja el fractal
+        ctk.CTkLabel(frame_julia, text=Texts.JULIA_MODO, font=(self.fuente, 12)).grid(
+            row=5, column=0, pady=(10, 5), padx=10, sticky="w"
+        )
+        dropdown_modo = ctk.CTkOptionMenu(
+            frame_julia,
+            values=Texts.JULIA_MODOS,
+            command=self.julia_elegir_modo,
+        )
+        dropdown_modo.set(Texts.JULIA_MODOS_DEFAULT)
+        dropdown_modo.grid(
+            row=5, column=1, pady=(10, 5), padx=(5, 10), sticky="ew", columnspan=3
+        )
+
         # Menú desplegable para elegir algoritmos
         ctk.CTkLabel(
             frame_julia, text=Texts.JULIA_EJEMPLO, font=(self.fuente, 12)
@@ -423,6 +438,15 @@ class VentanaMenu(Ventana):
         """ """
         self.julia_color_seleccionado = color
 
+    def julia_elegir_modo(self, modo: str) -> None:
+        """
+        Guarda la forma de dibujar el fractal seleccionada.
+
+        Args:
+            modo (str): El modo elegido, debe estar en Texts.JULIA_MODOS.
+        """
+        self.julia_modo_seleccionado = modo
+
     def julia_generar_fractal(self):
         """
         Función que maneja el evento de generar el fractal de Julia y guarda los valores introducidos.
@@ -456,6 +480,7 @@ class VentanaMenu(Ventana):
         print(f"Xmin: {self.julia_xmin}, Xmax: {self.julia_xmax}")
         print(f"Ymin: {self.julia_ymin}, Ymax: {self.julia_ymax}")
         print(f"Color: {self.julia_color_seleccionado}")
+        print(f"Algoritmo: {self.julia_modo_seleccionado}")
 
         # Configuración inicial de la ventana y creación de la instancia
         width: int = Fractales.WINDOW_WIDTH
@@ -469,6 +494,9 @@ class VentanaMenu(Ventana):
         julia_ymin = self.julia_ymin
         julia_ymax = self.julia_ymax
         julia_color_seleccionado = self.julia_color_seleccionado
+        algoritmo = Default.JULIA_MODOS_ALGORITMO[
+            Texts.JULIA_MODOS.index(self.julia_modo_seleccionado)
+        ]
 
         # Crear y mostrar la ventana del fractal de Julia
         fractal = FractalJulia(
@@ -482,6 +510,7 @@ class VentanaMenu(Ventana):
             julia_ymin,
             julia_ymax,
             julia_color_seleccionado,
+            algoritmo,
         )
         fractal.mostrar_ventana()
 
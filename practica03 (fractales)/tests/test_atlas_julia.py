@@ -0,0 +1,22 @@
+import numpy as np
+
+from atlas_julia import rejilla_c, renderizar_atlas
+from nucleo_fractal import tiempo_escape
+
+# Comprueba que cada miniatura del atlas es el conjunto de Julia de su c
+
+
+def test_miniaturas_del_atlas():
+    cs = rejilla_c(-1.0, 0.5, -0.5, 0.5, 3, 2)
+    lado, limites = 16, (-2.0, 2.0, -2.0, 2.0)
+    with renderizar_atlas(
+        cs, lado, limites, 50, suave=False, procesos=2, precision="float64"
+    ) as imagen:
+        mosaico = imagen.img.copy()
+    assert mosaico.shape == (2 * lado, 3 * lado)
+
+    x = -2.0 + (np.arange(lado) + 0.5) * 4.0 / lado
+    y = 2.0 - (np.arange(lado) + 0.5) * 4.0 / lado
+    c = cs[1, 2]
+    esperado = tiempo_escape(x[np.newaxis, :], y[:, np.newaxis], c.real, c.imag, 50)
+    assert np.array_equal(mosaico[lado:, 2 * lado :], esperado)
@@ -0,0 +1,64 @@
+import numpy as np
+
+from cache_teselas import CacheTeselas, nivel_para, teselas_visibles
+
+# Comprueba el limite de memoria de la cache, que al ampliar una tesela
+# antecesora sale la zona correcta y que se elige bien el nivel del arbol
+
+
+FRACTAL = ("mandelbrot", 2)
+
+
+def test_descarta_las_teselas_mas_antiguas():
+    tesela = np.zeros((16, 16), dtype=np.int32)
+    cache = CacheTeselas(memoria_maxima=3 * tesela.size)  # caben 3 teselas uint8
+
+    for tx in range(3):
+        cache.guardar((FRACTAL, 0, tx, 0), tesela, max_iter=100)
+    cache.obtener((FRACTAL, 0, 0, 0))  # la 0 pasa a ser la mas reciente
+    cache.guardar((FRACTAL, 0, 3, 0), tesela, max_iter=100)
+
+    assert (FRACTAL, 0, 1, 0) not in cache
+    assert (FRACTAL, 0, 0, 0) in cache
+    assert len(cache) == 3
+    assert cache.memoria == 3 * tesela.size
+
+
+def test_aproxima_con_la_antecesora():
+    cache = CacheTeselas()
+    padre = np.arange(16).reshape(4, 4)
+    cache.guardar((FRACTAL, 1, -1, 0), padre, max_iter=100)
+
+    # la hija de arriba a la derecha de (-1, 0) en el nivel 2 es (-1, 1)
+    hija = cache.aproximar((FRACTAL, 2, -1, 1))
+    assert np.array_equal(hija, np.repeat(np.repeat(padre[2:, 2:], 2, 0), 2, 1))
+    assert cache.aproximar((FRACTAL, 2, 5, 5)) is None
+
+
+def test_iteraciones_de_cada_tesela():
+    cache = CacheTeselas()
+    padre = np.array([[5, 100], [100, 7]])
+    cache.guardar((FRACTAL, 0, 0, 0), padre, max_iter=100)
+
+    # solo sirve con sus iteraciones
+    assert cache.obtener((FRACTAL, 0, 0, 0), 200) is None
+    assert np.array_equal(cache.obtener((FRACTAL, 0, 0, 0), 100), padre)
+    # pero aproxima a sus hijas con más: lo que no escapó sigue sin escapar
+    hija = cache.aproximar((FRACTAL, 1, 1, 0), 200)
+    assert np.array_equal(hija, [[200, 200], [200, 200]])
+    hija = cache.aproximar((FRACTAL, 1, 0, 0), 200)
+    assert np.array_equal(hija, [[5, 5], [5, 5]])
+
+
+def test_nivel_y_teselas_visibles():
+    # 4 unidades en 256 pixeles: el nivel 0 ya basta
+    assert nivel_para(4 / 256, 256) == 0
+    assert nivel_para(4 / 1000, 256) == 2
+    assert teselas_visibles(-2.0, 1.0, -1.5, 1.5, 1) == (-1, -1, 2, 2)
+
+
+if __name__ == "__main__":
+    test_descarta_las_teselas_mas_antiguas()
+    test_aproxima_con_la_antecesora()
+    test_nivel_y_teselas_visibles()
+    print("Cache de teselas correcta")
@@ -0,0 +1,26 @@
+import numpy as np
+
+from colores import colorear, crear_lut, ecualizar_lut
+
+# Comprueba que la tabla de colores da los extremos del mapa y que la
+# ecualizacion reparte los colores entre los pixeles que escapan
+
+
+def test_extremos_de_la_tabla():
+    lut = crear_lut("viridis", 256)
+    cuentas = np.array([[0.0, 50.0, 100.0]], dtype=np.float32)
+    colores = colorear(cuentas, 100, lut)
+    assert colores.shape == (1, 3, 4) and colores.dtype == np.uint8
+    assert colores[0, 0].view(np.uint32)[0] == lut[0]
+    assert colores[0, 2].view(np.uint32)[0] == lut[-1]
+
+
+def test_ecualizar_reparte_los_colores():
+    # el 90 % de los pixeles escapa en las primeras entradas de la tabla: al
+    # ecualizar, esas entradas pasan a ocupar el 90 % de los colores
+    lut = np.arange(4096, dtype=np.uint32)  # cada "color" es su posicion
+    indices = np.concatenate([np.repeat(np.arange(20), 45), np.linspace(20, 4094, 100)])
+    ecualizada = ecualizar_lut(lut, indices.astype(np.int32).reshape(40, 25))
+    assert abs(int(ecualizada[19]) - 0.9 * 4094) < 10
+    assert ecualizada[-1] == lut[-1]
+    assert np.all(np.diff(ecualizada[:-1].astype(np.int64)) >= 0)
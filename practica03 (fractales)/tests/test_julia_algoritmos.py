@@ -0,0 +1,72 @@
+import numpy as np
+
+from julia_algoritmos import distancia_julia, iteracion_inversa
+from nucleo_fractal import tiempo_escape
+
+# Comprueba que la iteracion inversa y la estimacion de distancia encuentran la
+# frontera del conjunto de Julia que da el tiempo de escape
+
+
+def _frontera(x, y, c, max_iter):
+    dentro = tiempo_escape(x[np.newaxis, :], y[:, np.newaxis], c.real, c.imag, max_iter)
+    dentro = dentro == max_iter
+    return (dentro ^ np.roll(dentro, 1, axis=0)) | (dentro ^ np.roll(dentro, 1, axis=1))
+
+
+def test_iteracion_inversa_dibuja_la_frontera():
+    c = -1 + 0j  # Basílica
+    x, y = np.linspace(-1.6, 1.6, 256), np.linspace(-1.2, 1.2, 192)
+    mascara, poco_crece = iteracion_inversa(c, x, y)
+    assert not poco_crece
+    distancias = distancia_julia(x[np.newaxis, :], y[:, np.newaxis], c, 300)
+    dx = x[1] - x[0]
+    # todos los puntos que dibuja están sobre la frontera
+    assert mascara.sum() > 1000
+    assert np.all(distancias[mascara] < dx)
+    # y casi toda la frontera tiene un punto dibujado al lado
+    alrededor = mascara.copy()
+    for eje in (0, 1):
+        for desplazamiento in (1, -1):
+            alrededor |= np.roll(mascara, desplazamiento, axis=eje)
+    frontera = _frontera(x, y, c, 300)
+    assert (alrededor & frontera).sum() > 0.95 * frontera.sum()
+
+
+def test_iteracion_inversa_con_zoom():
+    c = -1 + 0j
+    # vista 64 veces más pequeña que la inicial, junto a la punta derecha
+    radio = 1.5 / 64
+    x, y = np.linspace(1 - radio, 1 + radio, 256), np.linspace(0.3 - radio, 0.3 + radio, 256)
+    mascara, poco_crece = iteracion_inversa(c, x, y)
+    assert not poco_crece
+    distancias = distancia_julia(x[np.newaxis, :], y[:, np.newaxis], c, 1000)
+    dx = x[1] - x[0]
+    assert np.all(distancias[mascara] < dx)
+    # la frontera sigue saliendo entera, con la resolución de los píxeles
+    alrededor = mascara.copy()
+    for eje in (0, 1):
+        for desplazamiento in (1, -1):
+            alrededor |= np.roll(mascara, desplazamiento, axis=eje)
+    frontera = (distancias > 0) & (distancias < 0.5 * dx)
+    assert frontera.sum() > 500
+    assert (alrededor & frontera).sum() > 0.95 * frontera.sum()
+
+
+def test_iteracion_inversa_avisa_si_la_zona_apenas_crece():
+    c = -0.7 + 0.27015j
+    # cerca de un ciclo casi parabólico la vista tarda mucho en crecer al iterarla
+    radio = 1.5 / 256
+    x, y = np.linspace(-0.9 - radio, -0.9 + radio, 64), np.linspace(0.1 - radio, 0.1 + radio, 64)
+    mascara, poco_crece = iteracion_inversa(c, x, y)
+    assert poco_crece
+    assert mascara.any()
+
+
+def test_distancia_cubre_la_frontera():
+    c = -0.123 + 0.745j  # Conejo de Douady
+    x, y = np.linspace(-1.5, 1.5, 200), np.linspace(-1.5, 1.5, 200)
+    distancias = distancia_julia(x[np.newaxis, :], y[:, np.newaxis], c, 300)
+    dx = x[1] - x[0]
+    assert np.all(distancias[_frontera(x, y, c, 300)] < 1.5 * dx)
+    # los puntos lejanos están lejos
+    assert distancias[0, 0] > 0.1
@@ -0,0 +1,42 @@
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+
+import pytest
+
+from motor_fractal import ImagenCompartida
+
+# Comprueba que la imagen compartida no se libera mientras haya una tesela ya
+# mandada a un proceso, aunque todavía no haya empezado a escribir
+
+
+def abrir(nombre):
+    memoria = shared_memory.SharedMemory(name=nombre)
+    memoria.close()
+
+
+def test_libera_al_terminar_la_ultima_tesela():
+    imagen = ImagenCompartida(8, 8)
+    nombre = imagen.nombre
+    pendiente, mandadas = Future(), [Future(), Future()]
+    for futuro in mandadas:
+        futuro.set_running_or_notify_cancel()
+
+    # la misma tarea puede aparecer varias veces (iteración inversa)
+    imagen.liberar_al_terminar([pendiente, mandadas[0], mandadas[0], mandadas[1]])
+    assert pendiente.cancelled()
+    abrir(nombre)
+
+    mandadas[0].set_result(None)
+    abrir(nombre)
+    mandadas[1].set_result(None)
+    with pytest.raises(FileNotFoundError):
+        abrir(nombre)
+
+
+def test_libera_enseguida_sin_teselas_en_marcha():
+    imagen = ImagenCompartida(8, 8)
+    terminada = Future()
+    terminada.set_result(None)
+    imagen.liberar_al_terminar([Future(), terminada])
+    with pytest.raises(FileNotFoundError):
+        abrir(imagen.nombre)
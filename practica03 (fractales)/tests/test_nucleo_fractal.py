@@ -0,0 +1,119 @@
+import numpy as np
+
+from mariani_silver import mariani_silver
+from nucleo_fractal import (
+    ejes,
+    elegir_precision,
+    faltan_iteraciones,
+    iteraciones_para_zoom,
+    julia,
+    mandelbrot,
+    tiempo_escape,
+)
+
+# Comprueba que el calculo vectorizado da las mismas iteraciones que el bucle
+# de cada pixel que usaban antes las ventanas
+
+
+def iteraciones(z, c, max_iter, grado=2):
+    iterations = 0
+    while abs(z) <= 2 and iterations < max_iter:
+        z = z**grado + c
+        iterations += 1
+    return iterations
+
+
+def test_mandelbrot_igual_que_el_bucle():
+    x, y = ejes(-2.0, 1.0, -1.5, 1.5, 60, 50)
+    for grado, max_iter in ((2, 100), (3, 40), (4, 40), (7, 30), (2.5, 30)):
+        esperado = [[iteraciones(0, complex(a, b), max_iter, grado) for a in x] for b in y]
+        assert np.array_equal(mandelbrot(x, y, max_iter, grado), esperado)
+
+
+def test_julia_igual_que_el_bucle():
+    c = complex(-0.7, 0.27015)
+    x, y = ejes(-1.5, 1.5, -1.5, 1.5, 60, 50)
+    esperado = [[iteraciones(complex(a, b), c, 300) for a in x] for b in y]
+    assert np.array_equal(julia(x, y, c, 300), esperado)
+
+
+def test_atajos_no_cambian_el_resultado():
+    # vista con el cardioide, el circulo de periodo 2 y un minibrot
+    x, y = ejes(-1.8, 0.5, -1.2, 1.2, 120, 110)
+    normal = mandelbrot(x, y, 500)
+    for cardioide, periodicidad in ((True, False), (False, True), (True, True)):
+        assert np.array_equal(mandelbrot(x, y, 500, 2, cardioide, periodicidad), normal)
+    # la periodicidad tambien vale para los demas exponentes enteros
+    assert np.array_equal(mandelbrot(x, y, 300, 3, periodicidad=True), mandelbrot(x, y, 300, 3))
+
+
+def test_iteraciones_suaves_entre_las_enteras():
+    # el valor continuo de un punto que escapa en n esta entre n - 1 y n + 1
+    x, y = ejes(-2.0, 1.0, -1.5, 1.5, 60, 50)
+    for grado in (2, 3):
+        enteras = mandelbrot(x, y, 100, grado)
+        suaves = mandelbrot(x, y, 100, grado, suave=True)
+        escapados = enteras < 100
+        assert np.all(suaves[~escapados] == 100)
+        assert np.all(suaves[escapados] >= enteras[escapados] - 1)
+        assert np.all(suaves[escapados] <= enteras[escapados] + 1 + 1e-4)
+
+
+def test_mariani_silver_igual_que_fuerza_bruta():
+    # Julia conexo (conejo de Douady): el interior se rellena sin iterarlo
+    c = complex(-0.123, 0.745)
+    x, y = ejes(-1.5, 1.5, -1.5, 1.5, 150, 130)
+    calculados = []
+
+    def calcular(xs, ys):
+        calculados.append(xs.size)
+        return tiempo_escape(xs, ys, c.real, c.imag, 200)
+
+    assert np.array_equal(mariani_silver(calcular, x, y), julia(x, y, c, 200))
+    assert sum(calculados) < x.size * y.size
+
+
+if __name__ == "__main__":
+    test_mandelbrot_igual_que_el_bucle()
+    test_julia_igual_que_el_bucle()
+    test_atajos_no_cambian_el_resultado()
+    test_iteraciones_suaves_entre_las_enteras()
+    test_mariani_silver_igual_que_fuerza_bruta()
+    print("Nucleo fractal correcto")
+
+
+def test_float32_en_la_vista_inicial():
+    # con los píxeles de la vista inicial, float32 da casi la misma imagen
+    x, y = ejes(-2.0, 1.0, -1.5, 1.5, 300, 300)
+    cr, ci = x[np.newaxis, :], y[:, np.newaxis]
+    for grado in (2, 3, 2.5):
+        doble = tiempo_escape(0.0, 0.0, cr, ci, 100, grado, periodicidad=True)
+        simple = tiempo_escape(
+            0.0, 0.0, cr, ci, 100, grado, periodicidad=True, precision="float32"
+        )
+        assert np.count_nonzero(doble != simple) < 0.01 * doble.size
+    assert elegir_precision("auto", 3.0 / 800) == "float32"
+    assert elegir_precision("auto", 1e-9) == "float64"
+    assert elegir_precision("float64", 3.0 / 800) == "float64"
+
+
+def test_iteraciones_adaptativas():
+    # crecen con cada duplicación completa del zoom, y nunca bajan de la base
+    assert iteraciones_para_zoom(100, 1) == 100
+    assert iteraciones_para_zoom(100, 0.5) == 100
+    assert iteraciones_para_zoom(100, 3.9) == iteraciones_para_zoom(100, 2)
+    assert iteraciones_para_zoom(100, 1e6) > iteraciones_para_zoom(100, 1e3) > 100
+    # la vista inicial tiene bastantes con 100, el valle de los caballitos no
+    x, y = ejes(-2.0, 1.0, -1.5, 1.5, 150, 150)
+    assert not faltan_iteraciones(mandelbrot(x, y, 100, suave=True), 100)
+    x, y = ejes(-0.7445, -0.7425, 0.1304, 0.1324, 150, 150)
+    assert faltan_iteraciones(mandelbrot(x, y, 100, suave=True), 100)
+    assert not faltan_iteraciones(mandelbrot(x, y, 3000, suave=True), 3000)
+    # ni se siguen subiendo si al duplicarlas casi no se decide ningún píxel
+    cuentas = mandelbrot(x, y, 200, suave=True)
+    assert faltan_iteraciones(cuentas, 200)
+    assert not faltan_iteraciones(cuentas, 200, np.mean(cuentas >= 200))
+    # si no escapa ningún píxel tampoco se puede decidir nada
+    assert faltan_iteraciones(np.full((8, 8), 100), 100)
+    # salvo que tampoco escapara ninguno con la mitad: la vista está dentro del conjunto
+    assert not faltan_iteraciones(np.full((8, 8), 200), 200, 1.0)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from constantes import Texts
+from nucleo_ifs import probabilidades_ifs, puntos_ifs
+
+# Comprueba el juego del caos vectorizado con el triangulo de Sierpinski
+
+
+def test_puntos_en_el_triangulo():
+    funciones = Texts.IFS_PREDEFINIDOS[Texts.IFS_ALGORITMOS[0]]
+    xs, ys, elegidas = puntos_ifs(funciones, 50_000, 20, semilla=0)
+    assert len(xs) == len(ys) == len(elegidas) == 50_000
+    # todas las funciones se usan aproximadamente con su probabilidad
+    frecuencias = np.bincount(elegidas, minlength=len(funciones)) / len(elegidas)
+    assert np.allclose(frecuencias, probabilidades_ifs(funciones), atol=0.02)
+    # y los puntos no se escapan
+    assert np.all(np.isfinite(xs)) and np.all(np.isfinite(ys))
+    assert np.ptp(xs) > 0 and np.ptp(ys) > 0
+
+
+def test_misma_semilla_mismos_puntos():
+    funciones = Texts.IFS_PREDEFINIDOS[Texts.IFS_ALGORITMOS[0]]
+    primero = puntos_ifs(funciones, 1000, 10, semilla=3)
+    segundo = puntos_ifs(funciones, 1000, 10, semilla=3)
+    for a, b in zip(primero, segundo):
+        assert np.array_equal(a, b)
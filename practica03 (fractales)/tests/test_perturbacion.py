@@ -0,0 +1,40 @@
+from decimal import Decimal, localcontext
+
+import numpy as np
+
+from perturbacion import OrbitaReferencia, tiempo_escape_perturbacion
+
+# Comprueba el zoom profundo contra el bucle de cada pixel hecho con decimal
+
+CENTRO_R, CENTRO_I = "-1.7490812690237315702355817426", "0"
+
+
+def iteraciones_exactas(dr, di, max_iter):
+    with localcontext() as contexto:
+        contexto.prec = 200
+        cr = Decimal(CENTRO_R) + Decimal(dr)
+        ci = Decimal(CENTRO_I) + Decimal(di)
+        zr = zi = Decimal(0)
+        for iterations in range(max_iter):
+            if zr * zr + zi * zi > 4:
+                return iterations
+            zr, zi = zr * zr - zi * zi + cr, 2 * zr * zi + ci
+    return max_iter
+
+
+def test_perturbacion_igual_que_decimal():
+    # a 1e-30 float64 ya no distingue los pixeles: todos serian el mismo punto
+    radio, max_iter = 1e-30, 1000
+    d = np.linspace(-radio, radio, 16)
+    orbita = OrbitaReferencia(CENTRO_R, CENTRO_I, radio * 2**0.5, max_iter)
+    cuentas = tiempo_escape_perturbacion(d[np.newaxis, :], d[:, np.newaxis], orbita, max_iter)
+
+    esperado = [[iteraciones_exactas(a, b, max_iter) for a in d] for b in d]
+    assert orbita.salto > 0
+    assert len(np.unique(cuentas)) > 1
+    assert np.array_equal(cuentas, esperado)
+
+
+if __name__ == "__main__":
+    test_perturbacion_igual_que_decimal()
+    print("Perturbacion correcta")
@@ -1,4 +1,3 @@
-import turtle
 import math
 
 
@@ -45,7 +44,37 @@ class LSystem:
 
         return min_x, max_x, min_y, max_y
     
+    def segments(self):
+        """
+        Devuelve los segmentos que dibuja la tortuga de `draw`, sin abrir ninguna
+        ventana: una lista de ((x0, y0), (x1, y1), color).
+        """
+        # en modo 'logo' el rumbo 0 es hacia arriba y girar a la derecha lo aumenta
+        x, y = self.start_point
+        heading = self.start_angle + self.rotation_offset
+        turns = {'+': self.angle, '-': -self.angle, '|': 180, '&': -self.angle,
+                 '^': self.angle, '\\': -45, '/': 45}
+        stack = []
+        segments = []
+
+        for char in self.generate():
+            if char in self.color_map:  # Avanzar dibujando
+                x1 = x + self.length * math.sin(math.radians(heading))
+                y1 = y + self.length * math.cos(math.radians(heading))
+                segments.append(((x, y), (x1, y1), self.color_map[char]))
+                x, y = x1, y1
+            elif char in turns:
+                heading += turns[char]
+            elif char == '[':  # Guardar estado
+                stack.append((x, y, heading))
+            elif char == ']':  # Restaurar estado
+                x, y, heading = stack.pop()
+
+        return segments
+
     def draw(self, velocidad, instantaneo):
+        import turtle  # Solo hace falta (y solo necesita Tk) para dibujar en pantalla
+
         turtle.mode('logo')
         turtle.clearscreen()
         turtle.tracer(False)